@@ -0,0 +1 @@
+default_app_config = 'task_manager.apps.TaskManagerConfig'
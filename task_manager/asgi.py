@@ -2,6 +2,15 @@
 ASGI config for task_manager project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Requests are routed with ``task_manager.asgi_urls``, which serves the tasks
+pages with async views, and the stream of task events and the task export
+are answered before Django. Run it with uvicorn:
+
+    uvicorn task_manager.asgi:application
+
+or with gunicorn managing uvicorn workers:
+
+    gunicorn task_manager.asgi:application -k uvicorn.workers.UvicornWorker
 
 For more information on this file, see
 https://docs.djangoproject.com/en/3.0/howto/deployment/asgi/
@@ -9,8 +18,39 @@ https://docs.djangoproject.com/en/3.0/howto/deployment/asgi/
 
 import os
 
-from django.core.asgi import get_asgi_application
+import django
+from django.core.handlers.asgi import ASGIHandler, ASGIRequest
+from django.urls import reverse
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'task_manager.settings')
 
-application = get_asgi_application()
+django.setup(set_prefix=False)
+
+from task_manager import async_views as tm_async_views  # noqa: E402
+from task_manager import events as tm_events  # noqa: E402
+
+EVENTS_PATH = reverse('task_events')
+EXPORT_PATH = reverse('export_tasks')
+
+
+class TaskManagerASGIRequest(ASGIRequest):
+    urlconf = 'task_manager.asgi_urls'
+
+
+class TaskManagerASGIHandler(ASGIHandler):
+    request_class = TaskManagerASGIRequest
+
+
+django_application = TaskManagerASGIHandler()
+
+
+async def application(scope, receive, send):
+    # Django 3.1 iterates streaming responses synchronously, so the event
+    # stream is served as a plain ASGI application holding no thread, and
+    # the export reads its rows in the executor.
+    if scope['type'] == 'http' and scope['path'] == EVENTS_PATH:
+        await tm_events.stream(scope, receive, send)
+    elif scope['type'] == 'http' and scope['path'] == EXPORT_PATH:
+        await tm_async_views.export_stream(scope, receive, send)
+    else:
+        await django_application(scope, receive, send)
@@ -0,0 +1,20 @@
+from django.urls import path
+
+from task_manager import async_views
+from task_manager import urls
+
+ASYNC_URL_NAMES = ('index', 'tasks', 'task_details')
+
+urlpatterns = [
+    path('', async_views.IndexView.as_view(), name='index'),
+    path('tasks/', async_views.TasksView.as_view(), name='tasks'),
+    path(
+        'tasks/<int:pk>/details',
+        async_views.TaskDetailView.as_view(),
+        name='task_details'
+    ),
+] + [
+    pattern
+    for pattern in urls.urlpatterns
+    if getattr(pattern, 'name', None) not in ASYNC_URL_NAMES
+]
@@ -0,0 +1,174 @@
+import asyncio
+import functools
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from importlib import import_module
+
+from django.conf import settings
+from django.contrib.auth import get_user
+from django.core.exceptions import DisallowedHost
+from django.core.handlers.asgi import ASGIHandler, ASGIRequest
+from django.db import close_old_connections
+from django.http import HttpResponseBadRequest
+
+from task_manager import middleware as tm_middleware
+from task_manager import views as tm_views
+
+# Every thread keeps its own database connection, so the pool size is also
+# the number of connections an ASGI worker opens.
+executor = ThreadPoolExecutor(
+    max_workers=settings.ASYNC_VIEW_THREADS,
+    thread_name_prefix='async-view',
+)
+
+
+def _call_blocking(timings, func, *args, **kwargs):
+    close_old_connections()
+    try:
+        if timings is None:
+            return func(*args, **kwargs)
+        job_timings = tm_middleware.RequestTimings()
+        try:
+            with tm_middleware.track_queries(job_timings):
+                return func(*args, **kwargs)
+        finally:
+            timings.merge(job_timings)
+    finally:
+        close_old_connections()
+
+
+async def run_blocking(func, *args, **kwargs):
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(
+        executor,
+        functools.partial(
+            _call_blocking,
+            tm_middleware.current_timings.get(),
+            func,
+            *args,
+            **kwargs
+        ),
+    )
+
+
+class AsyncViewMixin:
+    # Django 3.1 has no async ORM, so the view runs in the executor up to
+    # the rendered response: templates evaluate lazy querysets too. The
+    # event loop is free meanwhile, and slow clients are handled by the
+    # ASGI server without holding a thread.
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+
+        def render_view(request, *args, **kwargs):
+            with tm_middleware.timed(request, 'view'):
+                response = view(request, *args, **kwargs)
+            if callable(getattr(response, 'render', None)):
+                with tm_middleware.timed(request, 'render'):
+                    response.render()
+            return response
+
+        async def async_view(request, *args, **kwargs):
+            return await run_blocking(render_view, request, *args, **kwargs)
+
+        functools.update_wrapper(async_view, view)
+        return async_view
+
+
+class IndexView(AsyncViewMixin, tm_views.IndexView):
+    pass
+
+
+class TasksView(AsyncViewMixin, tm_views.TasksView):
+    pass
+
+
+class TaskDetailView(AsyncViewMixin, tm_views.TaskDetailView):
+    pass
+
+
+export_view = tm_views.ExportTasksView.as_view()
+
+
+def _response_headers(response):
+    headers = [
+        (header.encode('ascii'), value.encode('latin1'))
+        for header, value in response.items()
+    ]
+    for cookie in response.cookies.values():
+        headers.append(
+            (b'Set-Cookie', cookie.output(header='').encode('ascii').strip())
+        )
+    return headers
+
+
+def _export(scope, loop, send, disconnected):
+    request = ASGIRequest(scope, io.BytesIO())
+    try:
+        request.get_host()
+    except DisallowedHost:
+        response = HttpResponseBadRequest()
+    else:
+        request.session = import_module(
+            settings.SESSION_ENGINE
+        ).SessionStore(request.COOKIES.get(settings.SESSION_COOKIE_NAME))
+        request.user = get_user(request)
+        response = export_view(request)
+
+    def forward(message):
+        asyncio.run_coroutine_threadsafe(send(message), loop).result()
+
+    try:
+        forward({
+            'type': 'http.response.start',
+            'status': response.status_code,
+            'headers': _response_headers(response),
+        })
+        if not response.streaming:
+            forward({'type': 'http.response.body', 'body': response.content})
+            return
+        chunk = []
+        size = 0
+        for part in response:
+            chunk.append(part)
+            size += len(part)
+            if size < ASGIHandler.chunk_size:
+                continue
+            if disconnected.is_set():
+                return
+            forward({
+                'type': 'http.response.body',
+                'body': b''.join(chunk),
+                'more_body': True,
+            })
+            chunk = []
+            size = 0
+        forward({'type': 'http.response.body', 'body': b''.join(chunk)})
+    finally:
+        # Ends the transaction of the export when the client goes away
+        response.close()
+
+
+async def export_stream(scope, receive, send):
+    # Django 3.1 iterates streaming responses on the event loop, where the
+    # export can not read from the database. Its rows come from a cursor
+    # inside a transaction, which belong to the connection of one thread,
+    # so the whole export is a single job of the executor handing chunks
+    # back to the event loop. It is served without the middleware chain,
+    # the host, the session and the user are checked the way the handler
+    # and the middleware do.
+    disconnected = threading.Event()
+
+    async def watch_disconnect():
+        while (await receive())['type'] != 'http.disconnect':
+            pass
+        disconnected.set()
+
+    watcher = asyncio.ensure_future(watch_disconnect())
+    try:
+        await run_blocking(
+            _export, scope, asyncio.get_event_loop(), send, disconnected
+        )
+    finally:
+        watcher.cancel()
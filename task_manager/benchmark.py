@@ -0,0 +1,173 @@
+import platform
+import statistics
+import time
+from datetime import datetime, timezone
+
+import django
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager import cache as tm_cache
+from task_manager import seeding
+from task_manager import views as tm_views
+from task_manager.forms import FilterForm, TaskForm
+from task_manager.models import Task
+
+DEFAULT_SIZES = (10000, 100000, 1000000)
+DEFAULT_REPEAT = 5
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    def register(func):
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+
+class Sample:
+    def __init__(self):
+        self.task = Task.objects.filter(
+            tags__isnull=False
+        ).order_by('-pk').first()
+        if self.task is None:
+            raise ValueError('There are no tagged tasks to benchmark')
+        self.user = User.objects.get(pk=self.task.assigned_to_id)
+        self.tag_id = self.task.tags.values_list('pk', flat=True).first()
+        self.factory = RequestFactory()
+
+    def request(self, method, url, data=None):
+        request = getattr(self.factory, method)(url, data)
+        request.user = self.user
+        return request
+
+
+def _render(view, request, **kwargs):
+    response = view(request, **kwargs)
+    if hasattr(response, 'render'):
+        response.render()
+    return response
+
+
+@benchmark('tasks_view')
+def tasks_view(sample):
+    _render(
+        tm_views.TasksView.as_view(),
+        sample.request('get', reverse('tasks')),
+    )
+
+
+@benchmark('tasks_view_filtered')
+def tasks_view_filtered(sample):
+    _render(
+        tm_views.TasksView.as_view(),
+        sample.request(
+            'get',
+            reverse('tasks'),
+            {'status': sample.task.status_id, 'tags__in': sample.tag_id},
+        ),
+    )
+
+
+@benchmark('index_view')
+def index_view(sample):
+    _render(
+        tm_views.IndexView.as_view(),
+        sample.request('get', reverse('index')),
+    )
+
+
+@benchmark('task_detail_view')
+def task_detail_view(sample):
+    _render(
+        tm_views.TaskDetailView.as_view(),
+        sample.request(
+            'get',
+            reverse('task_details', kwargs={'pk': sample.task.pk}),
+        ),
+        pk=sample.task.pk,
+    )
+
+
+@benchmark('filter_form')
+def filter_form(sample):
+    FilterForm(
+        {'status': sample.task.status_id, 'tags__in': [sample.tag_id]}
+    ).is_valid()
+
+
+@benchmark('filter_form_cold_cache')
+def filter_form_cold_cache(sample):
+    tm_cache.invalidate(tm_cache.STATUSES)
+    tm_cache.invalidate(tm_cache.USERS)
+    filter_form(sample)
+
+
+@benchmark('task_form_save')
+def task_form_save(sample):
+    form = TaskForm(
+        {
+            'name': 'Benchmark task',
+            'description': 'Created by the benchmark and rolled back',
+            'status': sample.task.status_id,
+            'creator': sample.user.pk,
+            'assigned_to': sample.user.pk,
+            'tags': 'bench_tag_1|bench_tag_2|benchmark',
+        },
+        initial={'creator': sample.user},
+    )
+    if not form.is_valid():
+        raise ValueError(form.errors.as_text())
+    with transaction.atomic():
+        form.save()
+        transaction.set_rollback(True)
+
+
+def measure(func, sample, repeat=DEFAULT_REPEAT):
+    func(sample)
+    timings = []
+    for _ in range(repeat):
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            func(sample)
+            timings.append((time.perf_counter() - started) * 1000)
+    return {
+        'repeat': repeat,
+        'queries': len(queries),
+        'min_ms': min(timings),
+        'median_ms': statistics.median(timings),
+        'mean_ms': statistics.mean(timings),
+        'max_ms': max(timings),
+    }
+
+
+def environment():
+    return {
+        'started_at': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'database': connection.vendor,
+        'database_version': connection.pg_version,
+        'machine': platform.machine(),
+    }
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, repeat=DEFAULT_REPEAT, names=None,
+                   seeder=None, progress=None):
+    names = names or list(BENCHMARKS)
+    seeder = seeder or seeding.TaskSeeder()
+    results = {'environment': environment(), 'runs': []}
+    for size in sorted(sizes):
+        seeder.top_up(size)
+        sample = Sample()
+        run = {'tasks': Task.objects.count(), 'benchmarks': {}}
+        for name in names:
+            run['benchmarks'][name] = measure(BENCHMARKS[name], sample, repeat)
+            if progress is not None:
+                progress(size, name, run['benchmarks'][name])
+        results['runs'].append(run)
+    return results
@@ -0,0 +1,80 @@
+from django.db import connection
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+from task_manager import cache as tm_cache
+from task_manager import counters as tm_counters
+from task_manager.models import Task
+from task_manager.pagination import (
+    NEXT, KeysetPage, KeysetPaginator, encode_cursor
+)
+
+DEFAULT_PER_COLUMN = 20
+
+
+class Column:
+    def __init__(self, status_id, name, count, page):
+        self.status_id = status_id
+        self.name = name
+        self.count = count
+        self.page = page
+
+    def __repr__(self):
+        return '<Column {} {}/{}>'.format(
+            self.name, len(self.page), self.count
+        )
+
+
+def first_rows(queryset, per_column):
+    # One more row than shown tells whether a column has a next page
+    ranked = queryset.order_by().annotate(
+        column_row=Window(
+            expression=RowNumber(),
+            partition_by=[F('status_id')],
+            order_by=F('pk').asc(),
+        )
+    ).values_list('pk', 'status_id', 'column_row')
+    sql, params = ranked.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT id, status_id FROM ({}) AS board '
+            'WHERE column_row <= %s ORDER BY status_id, id'.format(sql),
+            params + (per_column + 1,),
+        )
+        return cursor.fetchall()
+
+
+def _first_page(tasks, per_column):
+    if len(tasks) <= per_column:
+        return KeysetPage(tasks)
+    last = tasks[per_column - 1]
+    return KeysetPage(
+        tasks[:per_column],
+        next_cursor=encode_cursor(NEXT, last.pk, last.pk),
+    )
+
+
+def columns(per_column=DEFAULT_PER_COLUMN):
+    rows = first_rows(Task.objects.all(), per_column)
+    tasks = Task.objects.for_listing().in_bulk([pk for pk, _ in rows])
+    by_status = {}
+    for pk, status_id in rows:
+        if pk in tasks:
+            by_status.setdefault(status_id, []).append(tasks[pk])
+    counts = tm_counters.status_totals()
+    return [
+        Column(
+            pk,
+            name,
+            counts.get(pk, 0),
+            _first_page(by_status.get(pk, []), per_column),
+        )
+        for pk, name in tm_cache.status_choices()
+    ]
+
+
+def column_page(status_id, cursor=None, per_column=DEFAULT_PER_COLUMN):
+    return KeysetPaginator(
+        Task.objects.for_listing().filter(status_id=status_id),
+        per_column,
+    ).page(cursor)
@@ -0,0 +1,194 @@
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from task_manager import events as tm_events
+from task_manager import tag_gc as tm_tag_gc
+from task_manager.models import Tag, Task, TaskStatus
+
+MAX_TASKS = 1000
+MAX_DELETED_TASKS = 10000
+NOT_FOUND = 'not_found'
+FORBIDDEN = 'forbidden'
+
+
+class BulkResult:
+    def __init__(self, done, failed, verb='updated'):
+        self.done = done
+        self.failed = failed
+        self.verb = verb
+
+    def as_dict(self):
+        return {
+            self.verb: self.done,
+            'failed': {str(pk): reason for pk, reason in self.failed.items()},
+        }
+
+
+def _lock_tasks(task_ids, user):
+    # Only the creator or the assignee of a task may change it in bulk
+    rows = {
+        row[0]: row
+        for row in Task.objects.filter(
+            pk__in=task_ids
+        ).select_for_update().values_list(
+            'pk', 'creator_id', 'assigned_to_id', 'status_id'
+        )
+    }
+    permitted, failed = {}, {}
+    for pk in task_ids:
+        row = rows.get(pk)
+        if row is None:
+            failed[pk] = NOT_FOUND
+        elif user.pk in (row[1], row[2]):
+            permitted[pk] = row
+        else:
+            failed[pk] = FORBIDDEN
+    return permitted, failed
+
+
+def _notified_users(row, value):
+    users = {row[1], row[2]}
+    if hasattr(value, 'pk'):
+        users.add(value.pk)
+    return users
+
+
+def _bulk_action(apply):
+    def action(task_ids, user, value):
+        with transaction.atomic():
+            permitted, failed = _lock_tasks(task_ids, user)
+            changed, values = [], {}
+            if permitted:
+                changed, values = apply(permitted, value)
+            if changed:
+                Task.objects.filter(pk__in=changed).update(
+                    updated_at=timezone.now(),
+                    version=F('version') + 1,
+                    **values
+                )
+                tm_events.publish_tasks('updated', [
+                    (pk, _notified_users(permitted[pk], value))
+                    for pk in changed
+                ])
+        return BulkResult(list(permitted), failed)
+    return action
+
+
+@_bulk_action
+def set_status(tasks, status_id):
+    changed = [pk for pk, row in tasks.items() if row[3] != status_id]
+    return changed, {'status_id': status_id}
+
+
+@_bulk_action
+def reassign(tasks, user):
+    changed = [pk for pk, row in tasks.items() if row[2] != user.pk]
+    return changed, {'assigned_to_id': user.pk}
+
+
+@_bulk_action
+def add_tags(tasks, names):
+    tags, _ = Tag.objects.get_or_create_many(names)
+    through = Task.tags.through
+    existing = set(
+        through.objects.filter(
+            task_id__in=tasks,
+            tag_id__in=[tag.pk for tag in tags],
+        ).values_list('task_id', 'tag_id')
+    )
+    missing = [
+        through(task_id=task_id, tag_id=tag.pk)
+        for task_id in tasks
+        for tag in tags
+        if (task_id, tag.pk) not in existing
+    ]
+    through.objects.bulk_create(missing, ignore_conflicts=True)
+    return list(dict.fromkeys(row.task_id for row in missing)), {}
+
+
+@_bulk_action
+def remove_tags(tasks, names):
+    rows = Task.tags.through.objects.filter(
+        task_id__in=tasks,
+        tag__name__in=names,
+    )
+    changed = list(set(rows.values_list('task_id', flat=True)))
+    rows.delete()
+    return changed, {}
+
+
+def delete_status(status_id, move_to=None):
+    # The locked status row blocks new tasks from referencing it, so the
+    # delete can not cascade to tasks created meanwhile. The status getting
+    # the tasks is locked too, its choice may come from a stale cache.
+    with transaction.atomic():
+        locked = set(
+            TaskStatus.objects.select_for_update().filter(
+                pk__in={status_id, move_to} - {None}
+            ).order_by('pk').values_list('pk', flat=True)
+        )
+        if move_to is not None and move_to not in locked:
+            raise TaskStatus.DoesNotExist(
+                'Status {} does not exist'.format(move_to)
+            )
+        if status_id not in locked:
+            return True
+        tasks = Task.objects.filter(status_id=status_id)
+        if move_to is None:
+            if tasks.exists():
+                return False
+        else:
+            tasks.update(
+                status_id=move_to,
+                updated_at=timezone.now(),
+                version=F('version') + 1,
+            )
+        TaskStatus.objects.filter(pk=status_id).delete()
+    return True
+
+
+DELETE_OWNED_TASKS = """
+DELETE FROM {table} WHERE id = ANY(%s) AND creator_id = %s
+RETURNING id, assigned_to_id
+"""
+
+DELETE_TAG_LINKS = """
+DELETE FROM {table} WHERE task_id = ANY(%s)
+RETURNING tag_id
+"""
+
+
+def delete(task_ids, user):
+    # Raw statements, the ORM would load every task to send its signals.
+    # Tombstones are written by a trigger, orphan tags are collected after
+    # the commit.
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            DELETE_OWNED_TASKS.format(table=Task._meta.db_table),
+            [task_ids, user.pk]
+        )
+        deleted = dict(cursor.fetchall())
+        tag_ids = set()
+        if deleted:
+            through_table = Task.tags.through._meta.db_table
+            cursor.execute(
+                DELETE_TAG_LINKS.format(table=through_table),
+                [list(deleted)]
+            )
+            tag_ids = {tag_id for tag_id, in cursor.fetchall()}
+        rest = [pk for pk in task_ids if pk not in deleted]
+        existing = set()
+        if rest:
+            existing = set(
+                Task.objects.filter(pk__in=rest).values_list('pk', flat=True)
+            )
+        tm_events.publish_tasks('deleted', [
+            (pk, {user.pk, assigned_to_id})
+            for pk, assigned_to_id in deleted.items()
+        ])
+        tm_tag_gc.schedule_cleanup(tag_ids)
+    failed = {pk: FORBIDDEN if pk in existing else NOT_FOUND for pk in rest}
+    return BulkResult(
+        [pk for pk in task_ids if pk in deleted], failed, 'deleted'
+    )
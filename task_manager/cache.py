@@ -0,0 +1,112 @@
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.db import transaction
+from django.contrib.auth.models import User
+from django.template.loader import get_template
+from django.utils.safestring import mark_safe
+
+from task_manager.models import TaskStatus
+
+STATUSES = 'statuses'
+USERS = 'users'
+KEY_PREFIX = 'task_manager:reference'
+CHOICES_TIMEOUT = 300
+ROW_KEY_PREFIX = 'task_manager:row'
+ROW_TEMPLATE = 'task_manager/task_row.html'
+CARD_TEMPLATE = 'task_manager/task_card.html'
+ROW_TIMEOUT = 60 * 60 * 24
+
+
+def _version_key(name):
+    return '{}:{}:version'.format(KEY_PREFIX, name)
+
+
+def get_version(name):
+    key = _version_key(name)
+    cache.add(key, 1, timeout=None)
+    return cache.get(key, 1)
+
+
+def _bump_version(name):
+    key = _version_key(name)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, timeout=None)
+
+
+def invalidate(name):
+    # Readers of other connections see the change only once it commits,
+    # an earlier bump lets them cache the old rows under the new version
+    transaction.on_commit(lambda: _bump_version(name))
+
+
+def _get_or_build(name, build):
+    key = '{}:{}:v{}'.format(KEY_PREFIX, name, get_version(name))
+    choices = cache.get(key)
+    if choices is None:
+        choices = build()
+        cache.set(key, choices, timeout=CHOICES_TIMEOUT)
+    return choices
+
+
+def status_choices():
+    return _get_or_build(
+        STATUSES,
+        lambda: [
+            (status.pk, status.name)
+            for status in TaskStatus.objects.order_by('pk')
+        ]
+    )
+
+
+def user_choices():
+    return _get_or_build(
+        USERS,
+        lambda: [
+            (user.pk, user.get_full_name())
+            for user in User.objects.filter(is_staff=False).order_by('pk')
+        ]
+    )
+
+
+def _row_template(template_name):
+    template = get_template(template_name)
+    digest = hashlib.blake2b(
+        template.template.source.encode('utf-8'), digest_size=8
+    ).hexdigest()
+    return template, digest
+
+
+def _row_key(task, template_digest):
+    rendered_values = [
+        task.name,
+        task.description,
+        task.status.name,
+        task.creator.get_full_name(),
+        task.assigned_to.get_full_name(),
+        [tag.name for tag in task.tags.all()],
+    ]
+    digest = hashlib.blake2b(
+        json.dumps(rendered_values).encode('utf-8'), digest_size=16
+    ).hexdigest()
+    return '{}:{}:{}:{}'.format(
+        ROW_KEY_PREFIX, template_digest, task.pk, digest
+    )
+
+
+def task_rows(tasks, template_name=ROW_TEMPLATE):
+    template, template_digest = _row_template(template_name)
+    keys = [_row_key(task, template_digest) for task in tasks]
+    rows = cache.get_many(keys)
+    missing = {
+        key: template.render({'task': task})
+        for key, task in zip(keys, tasks)
+        if key not in rows
+    }
+    if missing:
+        cache.set_many(missing, timeout=ROW_TIMEOUT)
+        rows.update(missing)
+    return [mark_safe(rows[key]) for key in keys]
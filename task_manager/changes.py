@@ -0,0 +1,100 @@
+import heapq
+
+from django.db import connection
+from django.db.models import Q
+
+from task_manager.export import tag_names
+from task_manager.models import Task, TaskTombstone
+from task_manager.pagination import (
+    NEXT, InvalidCursor, decode_cursor, encode_cursor
+)
+
+DEFAULT_LIMIT = 500
+MAX_LIMIT = 1000
+
+
+def decode_token(token):
+    if not token:
+        return 0, 0
+    direction, change_seq, pk = decode_cursor(token)
+    if direction != NEXT or not isinstance(change_seq, int):
+        raise InvalidCursor(token)
+    return change_seq, pk
+
+
+def visible_horizon():
+    # Transactions below the snapshot xmin are finished, so no row can
+    # appear later with a change_seq lower than it.
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT txid_snapshot_xmin(txid_current_snapshot())')
+        return cursor.fetchone()[0]
+
+
+def _window(queryset, pk_field, change_seq, pk, horizon, limit):
+    return queryset.filter(
+        Q(change_seq__gt=change_seq) |
+        Q(change_seq=change_seq, **{'{}__gt'.format(pk_field): pk}),
+        change_seq__gte=change_seq,
+        change_seq__lt=horizon,
+    ).order_by('change_seq', pk_field)[:limit]
+
+
+def _task_changes(change_seq, pk, horizon, limit):
+    tasks = _window(
+        Task.objects.all(), 'pk', change_seq, pk, horizon, limit
+    ).annotate(tag_names=tag_names()).values_list(
+        'change_seq',
+        'id',
+        'name',
+        'description',
+        'status__name',
+        'creator__username',
+        'assigned_to__username',
+        'tag_names',
+        'updated_at',
+    )
+    for row in tasks:
+        yield row[0], row[1], {
+            'id': row[1],
+            'deleted': False,
+            'name': row[2],
+            'description': row[3],
+            'status': row[4],
+            'creator': row[5],
+            'assigned_to': row[6],
+            'tags': row[7].split('|') if row[7] else [],
+            'updated_at': row[8],
+        }
+
+
+def _deletions(change_seq, pk, horizon, limit):
+    tombstones = _window(
+        TaskTombstone.objects.all(), 'task_id', change_seq, pk, horizon, limit
+    ).values_list('change_seq', 'task_id', 'deleted_at')
+    for seq, task_id, deleted_at in tombstones:
+        yield seq, task_id, {
+            'id': task_id,
+            'deleted': True,
+            'deleted_at': deleted_at,
+        }
+
+
+def changes_since(token, limit=DEFAULT_LIMIT):
+    change_seq, pk = decode_token(token)
+    horizon = visible_horizon()
+    changes = list(
+        heapq.merge(
+            _task_changes(change_seq, pk, horizon, limit + 1),
+            _deletions(change_seq, pk, horizon, limit + 1),
+            key=lambda change: change[:2],
+        )
+    )[:limit + 1]
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+    if changes:
+        change_seq, pk, _ = changes[-1]
+    return {
+        'changes': [change for _, _, change in changes],
+        'next': encode_cursor(NEXT, change_seq, pk),
+        'has_more': has_more,
+    }
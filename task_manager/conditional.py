@@ -0,0 +1,90 @@
+import hashlib
+import json
+
+from django.contrib import messages
+from django.core.serializers.json import DjangoJSONEncoder
+from django.middleware.csrf import get_token
+from django.http import Http404
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+from task_manager import cache as tm_cache
+from task_manager.pagination import (
+    CURSOR_PARAM, InvalidCursor, KeysetPaginator
+)
+
+
+def _csrf_secret(request):
+    # Makes sure the secret is known before the page is rendered, so the
+    # response setting the CSRF cookie has the same ETag as later ones.
+    get_token(request)
+    return request.META['CSRF_COOKIE']
+
+
+def page_etag(request, *parts):
+    # Everything besides the tasks that can change a rendered page: the
+    # viewer, the CSRF token in its forms, the query string and the names
+    # of statuses and users.
+    payload = json.dumps(
+        [
+            request.user.pk,
+            _csrf_secret(request),
+            request.GET.urlencode(),
+            tm_cache.get_version(tm_cache.STATUSES),
+            tm_cache.get_version(tm_cache.USERS),
+            *parts,
+        ],
+        cls=DjangoJSONEncoder,
+    )
+    return quote_etag(
+        hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+    )
+
+
+class ConditionalGetMixin:
+    def get_conditional_state(self):
+        # Returns the parts of the ETag and the Last-Modified datetime.
+        raise NotImplementedError
+
+    def get(self, request, *args, **kwargs):
+        if messages.get_messages(request):
+            return super().get(request, *args, **kwargs)
+        parts, last_modified = self.get_conditional_state()
+        etag = page_etag(request, *parts)
+        timestamp = last_modified and int(last_modified.timestamp())
+        response = get_conditional_response(
+            request, etag=etag, last_modified=timestamp
+        )
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+        response['ETag'] = etag
+        if timestamp:
+            response['Last-Modified'] = http_date(timestamp)
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+
+class KeysetConditionalGetMixin(ConditionalGetMixin):
+    # The page is identified by the keys and timestamps of its rows. There
+    # is no Last-Modified: a task deleted, reassigned or filtered out of the
+    # page changes it without making any remaining row newer.
+    version_field = 'updated_at'
+
+    def get_conditional_state(self):
+        queryset = self.get_queryset()
+        paginator = KeysetPaginator(
+            queryset,
+            self.get_paginate_by(queryset),
+            ordering=self.get_keyset_ordering(),
+        )
+        try:
+            rows = paginator.page_values(
+                self.request.GET.get(CURSOR_PARAM),
+                'pk',
+                self.version_field,
+            )
+        except InvalidCursor:
+            raise Http404('Invalid page cursor')
+        return rows, None
@@ -0,0 +1,57 @@
+from django.db import connection, transaction
+from django.db.models import Count, Sum
+
+from task_manager.models import Task, TaskCounter
+
+
+def status_counts(user):
+    return list(
+        TaskCounter.objects.filter(user=user, count__gt=0).order_by(
+            'status_id'
+        ).values_list('status__name', 'count')
+    )
+
+
+def status_totals():
+    return dict(
+        TaskCounter.objects.order_by().values_list('status_id').annotate(
+            Sum('count')
+        )
+    )
+
+
+def rebuild():
+    # Fixes the counters which drifted from the tasks, e.g. after the
+    # triggers were disabled for a bulk load. Task writes wait until the
+    # counters are committed.
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute('LOCK TABLE {} IN SHARE MODE'.format(
+                connection.ops.quote_name(Task._meta.db_table)
+            ))
+        expected = {
+            (row['assigned_to_id'], row['status_id']): row['count']
+            for row in Task.objects.order_by().values(
+                'assigned_to_id', 'status_id'
+            ).annotate(count=Count('pk'))
+        }
+        changed, stale = [], []
+        for counter in TaskCounter.objects.select_for_update():
+            count = expected.pop((counter.user_id, counter.status_id), 0)
+            if counter.count == count:
+                continue
+            if count:
+                counter.count = count
+                changed.append(counter)
+            else:
+                stale.append(counter.pk)
+        TaskCounter.objects.bulk_update(changed, ['count'], batch_size=1000)
+        TaskCounter.objects.filter(pk__in=stale).delete()
+        TaskCounter.objects.bulk_create(
+            [
+                TaskCounter(user_id=user_id, status_id=status_id, count=count)
+                for (user_id, status_id), count in expected.items()
+            ],
+            batch_size=1000,
+        )
+    return len(changed) + len(stale) + len(expected)
@@ -0,0 +1,162 @@
+import asyncio
+import itertools
+import json
+import threading
+from importlib import import_module
+
+from django.conf import settings
+from django.contrib.auth import get_user
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.http import HttpRequest, parse_cookie
+
+HEARTBEAT_INTERVAL = 25
+QUEUE_SIZE = 100
+
+
+class Broker:
+    # Subscribers live on the event loop of the ASGI server, events are
+    # published from whichever thread saved the task.
+    def __init__(self):
+        self.loop = None
+        self.subscribers = {}
+        self.ids = itertools.count(1)
+        self.lock = threading.Lock()
+
+    def has_subscribers(self):
+        return bool(self.subscribers)
+
+    def subscribe(self, user_id):
+        self.loop = asyncio.get_event_loop()
+        queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self.subscribers.setdefault(user_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, user_id, queue):
+        queues = self.subscribers.get(user_id, set())
+        queues.discard(queue)
+        if not queues:
+            self.subscribers.pop(user_id, None)
+
+    def publish(self, event, user_ids):
+        if self.loop is None or not self.subscribers:
+            return
+        with self.lock:
+            event = dict(event, id=next(self.ids))
+        self.loop.call_soon_threadsafe(self._deliver, event, set(user_ids))
+
+    def _deliver(self, event, user_ids):
+        for user_id in user_ids:
+            for queue in self.subscribers.get(user_id, ()):
+                try:
+                    queue.put_nowait(event)
+                except asyncio.QueueFull:
+                    pass
+
+
+broker = Broker()
+
+
+def publish_task(task, kind):
+    if not broker.has_subscribers():
+        return
+    user_ids = {
+        task.creator_id,
+        task.assigned_to_id,
+        getattr(task, '_loaded_assigned_to_id', None),
+    } - {None}
+    event = {'type': kind, 'task': task.pk}
+    if kind != 'deleted':
+        event.update({
+            'name': task.name,
+            'status': task.status_id,
+            'assigned_to': task.assigned_to_id,
+            'updated_at': task.updated_at,
+        })
+    transaction.on_commit(lambda: broker.publish(event, user_ids))
+
+
+def publish_tasks(kind, task_users):
+    if not broker.has_subscribers():
+        return
+
+    def publish():
+        for task_id, user_ids in task_users:
+            broker.publish({'type': kind, 'task': task_id}, user_ids)
+
+    transaction.on_commit(publish)
+
+
+def format_event(event):
+    return 'event: task\nid: {}\ndata: {}\n\n'.format(
+        event['id'], json.dumps(event, cls=DjangoJSONEncoder)
+    ).encode('utf-8')
+
+
+def authenticate(scope):
+    headers = dict(scope['headers'])
+    cookies = parse_cookie(headers.get(b'cookie', b'').decode('latin1'))
+    request = HttpRequest()
+    request.session = import_module(settings.SESSION_ENGINE).SessionStore(
+        cookies.get(settings.SESSION_COOKIE_NAME)
+    )
+    user = get_user(request)
+    return user.pk if user.is_authenticated else None
+
+
+async def _send_status(send, status):
+    await send({'type': 'http.response.start', 'status': status,
+                'headers': []})
+    await send({'type': 'http.response.body', 'body': b''})
+
+
+async def stream(scope, receive, send):
+    # Imported here, the views publish events themselves
+    from task_manager.async_views import run_blocking
+
+    user_id = await run_blocking(authenticate, scope)
+    if user_id is None:
+        await _send_status(send, 403)
+        return
+    queue = broker.subscribe(user_id)
+    disconnect = asyncio.ensure_future(receive())
+    event = None
+    try:
+        await send({
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [
+                (b'content-type', b'text/event-stream'),
+                (b'cache-control', b'no-cache'),
+                (b'x-accel-buffering', b'no'),
+            ],
+        })
+        await send({
+            'type': 'http.response.body',
+            'body': b': connected\n\n',
+            'more_body': True,
+        })
+        while True:
+            if event is None:
+                event = asyncio.ensure_future(queue.get())
+            done, _ = await asyncio.wait(
+                {event, disconnect},
+                timeout=HEARTBEAT_INTERVAL,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if disconnect in done:
+                break
+            if event in done:
+                body, event = format_event(event.result()), None
+            else:
+                body = b': ping\n\n'
+            await send({
+                'type': 'http.response.body',
+                'body': body,
+                'more_body': True,
+            })
+    finally:
+        broker.unsubscribe(user_id, queue)
+        for future in (event, disconnect):
+            if future is not None:
+                future.cancel()
@@ -0,0 +1,79 @@
+import csv
+import json
+
+from django.contrib.postgres.aggregates import StringAgg
+from django.db import transaction
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from task_manager.models import Task
+
+FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+FIELDS = (
+    'id',
+    'name',
+    'description',
+    'status',
+    'creator',
+    'assigned_to',
+    'tags',
+)
+DEFAULT_CHUNK_SIZE = 2000
+
+
+def tag_names():
+    names = Task.tags.through.objects.filter(
+        task_id=OuterRef('pk')
+    ).values('task_id').annotate(
+        names=StringAgg('tag__name', delimiter='|', ordering='tag__name')
+    ).values('names')
+    return Coalesce(Subquery(names), Value(''))
+
+
+def export_values(queryset):
+    return queryset.annotate(tag_names=tag_names()).values_list(
+        'id',
+        'name',
+        'description',
+        'status__name',
+        'creator__username',
+        'assigned_to__username',
+        'tag_names',
+    ).order_by('pk')
+
+
+class _Echo:
+    def write(self, value):
+        return value
+
+
+def _ndjson_lines(rows):
+    for row in rows:
+        yield json.dumps(dict(zip(FIELDS, row)), ensure_ascii=False) + '\n'
+
+
+def _csv_lines(rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(FIELDS)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def export_lines(queryset, export_format, chunk_size=DEFAULT_CHUNK_SIZE):
+    # Outside of a transaction the server side cursor is declared WITH HOLD
+    # and PostgreSQL builds the whole result before returning a row. Rows
+    # are only read, so there is no need for a savepoint in an outer one.
+    with transaction.atomic(savepoint=False):
+        rows = export_values(queryset).iterator(chunk_size=chunk_size)
+        try:
+            if export_format == 'csv':
+                yield from _csv_lines(rows)
+            else:
+                yield from _ndjson_lines(rows)
+        finally:
+            # Closes the cursor before the transaction ends when the client
+            # goes away early
+            rows.close()
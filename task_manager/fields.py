@@ -1,11 +1,72 @@
-from django.forms import CharField, ModelChoiceField
+from django.forms import (
+    CharField, Field, ModelChoiceField, MultipleHiddenInput, Select
+)
 from django.core.validators import RegexValidator
 from django.core.exceptions import ValidationError
+from django.urls import reverse_lazy
 
 NOT_PERMITED_TAG_SYMBOLS = r'[^0-9a-zA-Zа-яА-Я _|]'
 
 
-class UserModelChoiceField(ModelChoiceField):
+class ModelAutocompleteSelect(Select):
+    def __init__(self, url, attrs=None):
+        super().__init__(attrs)
+        self.url = url
+        self.preloaded = ()
+
+    def get_context(self, name, value, attrs):
+        context = super().get_context(name, value, attrs)
+        context['widget']['attrs']['data-autocomplete-url'] = self.url
+        return context
+
+    def optgroups(self, name, value, attrs=None):
+        iterator = self.choices
+        field = iterator.field
+        choices = []
+        if field.empty_label is not None:
+            choices.append(('', field.empty_label))
+        selected = [pk for pk in value if pk]
+        preloaded = [obj for obj in self.preloaded if str(obj.pk) in selected]
+        if preloaded and len(preloaded) == len(selected):
+            choices.extend(iterator.choice(obj) for obj in preloaded)
+        elif selected:
+            try:
+                choices.extend(
+                    iterator.choice(obj)
+                    for obj in field.queryset.filter(pk__in=selected)
+                )
+            except (ValueError, TypeError):
+                pass
+        self.choices = choices
+        try:
+            return super().optgroups(name, value, attrs)
+        finally:
+            self.choices = iterator
+
+
+class PreloadedModelChoiceField(ModelChoiceField):
+    # Objects loaded together with the edited instance are not fetched
+    # again to validate a submitted value equal to theirs. The fields and
+    # widgets of a form are shallow copies of the declared ones, so the
+    # tuples are replaced rather than changed.
+    preloaded = ()
+
+    def preload(self, obj):
+        self.preloaded += (obj,)
+        if isinstance(self.widget, ModelAutocompleteSelect):
+            self.widget.preloaded += (obj,)
+
+    def to_python(self, value):
+        if value not in self.empty_values:
+            for obj in self.preloaded:
+                if str(obj.pk) == str(value):
+                    return obj
+        return super().to_python(value)
+
+
+class UserModelChoiceField(PreloadedModelChoiceField):
+    widget = ModelAutocompleteSelect(reverse_lazy('user_autocomplete'))
+
     def label_from_instance(self, obj):
         return obj.get_full_name()
 
@@ -37,7 +98,54 @@ class TagsField(CharField):
         ]
         self.validators.extend(validators)
 
+    def widget_attrs(self, widget):
+        attrs = super().widget_attrs(widget)
+        attrs.update(
+            {
+                'autocomplete': 'off',
+                'list': 'tag-suggestions',
+                'data-autocomplete-url': reverse_lazy('tag_autocomplete'),
+            }
+        )
+        return attrs
+
     def clean(self, value):
         tag_names = super().clean(value)
         tags = [tag.strip().lower() for tag in tag_names.split('|')]
         return tags
+
+
+class IdListField(Field):
+    widget = MultipleHiddenInput
+    default_error_messages = {
+        'invalid': 'Enter a list of ids',
+        'max_ids': 'You can select %(max_ids)s items maximum',
+    }
+
+    def __init__(self, *, max_ids, **kwargs):
+        super().__init__(**kwargs)
+        self.max_ids = max_ids
+
+    def to_python(self, value):
+        if not value:
+            return []
+        if not isinstance(value, (list, tuple)):
+            value = [value]
+        # A single "1,2,3" value keeps long lists under the request limit
+        # on the number of fields
+        try:
+            return list(dict.fromkeys(
+                int(pk)
+                for item in value
+                for pk in str(item).split(',')
+                if pk.strip()
+            ))
+        except (TypeError, ValueError):
+            raise ValidationError(self.error_messages['invalid'])
+
+    def validate(self, value):
+        super().validate(value)
+        if len(value) > self.max_ids:
+            raise ValidationError(
+                self.error_messages['max_ids'] % {'max_ids': self.max_ids}
+            )
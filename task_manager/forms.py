@@ -2,9 +2,12 @@ from django_registration.forms import RegistrationForm
 from django import forms
 from django.core import validators
 from django.contrib.auth.models import User
+from django.db import transaction
 
-from task_manager.models import TaskStatus, Tag, Task
+from task_manager.models import Tag, Task
 from task_manager import fields as tm_fields
+from task_manager import bulk as tm_bulk
+from task_manager import cache as tm_cache
 
 ONLY_LETTERS = r'^[a-zA-Zа-яА-Я]+$'
 BLANK_CHOICE = [('', '-----')]
@@ -50,6 +53,11 @@ class CustomRegistrationForm(RegistrationForm):
 
 
 class FilterForm(forms.Form):
+    q = forms.CharField(
+        label='Search',
+        max_length=200,
+        required=False,
+    )
     my_tasks = forms.BooleanField(
         label='My tasks',
         required=False,
@@ -69,7 +77,8 @@ class FilterForm(forms.Form):
         label='Assigned to',
         required=False,
     )
-    tags__in = forms.MultipleChoiceField(
+    tags__in = forms.TypedMultipleChoiceField(
+        coerce=int,
         label='Tags',
         widget=forms.CheckboxSelectMultiple,
         required=False,
@@ -77,26 +86,49 @@ class FilterForm(forms.Form):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.fields['status'].choices = BLANK_CHOICE + [
-            (row.pk, getattr(row, 'name'))
-            for row in TaskStatus.objects.all()
-        ]
-        self.fields['creator'].choices = BLANK_CHOICE + [
-            (user.pk, user.get_full_name())
-            for user in User.objects.filter(is_staff=False)
-        ]
-        self.fields['assigned_to'].choices = BLANK_CHOICE + [
-            (user.pk, user.get_full_name())
-            for user in User.objects.filter(is_staff=False)
-        ]
-        self.fields['tags__in'].choices = [
-            (row.pk, getattr(row, 'name'))
-            for row in Tag.objects.order_by('name').all()
-        ]
+        user_choices = BLANK_CHOICE + tm_cache.user_choices()
+        self.fields['status'].choices = (
+            BLANK_CHOICE + tm_cache.status_choices()
+        )
+        self.fields['creator'].choices = user_choices
+        self.fields['assigned_to'].choices = user_choices
+        if self.is_bound:
+            self.fields['tags__in'].choices = [
+                (tag.pk, tag.name)
+                for tag in Tag.objects.filter(
+                    pk__in=self._selected_tag_ids()
+                ).order_by('name')
+            ]
+
+    def _selected_tag_ids(self):
+        tag_ids = []
+        values = self.fields['tags__in'].widget.value_from_datadict(
+            self.data, self.files, self.add_prefix('tags__in')
+        )
+        for value in values or []:
+            try:
+                tag_ids.append(int(value))
+            except (TypeError, ValueError):
+                pass
+        return tag_ids
+
+    def get_filters(self, user):
+        filters = {k: v for k, v in self.cleaned_data.items() if v}
+        filters.pop('q', None)
+        if filters.pop('my_tasks', False):
+            filters['assigned_to'] = user.pk
+        return filters
+
+    def filter_queryset(self, queryset, user):
+        queryset = queryset.apply_filters(self.get_filters(user))
+        if self.cleaned_data['q']:
+            queryset = queryset.search(self.cleaned_data['q'])
+        return queryset
 
 
 class TaskForm(forms.ModelForm):
     tags = tm_fields.TagsField()
+    version = forms.IntegerField(widget=forms.HiddenInput, required=False)
 
     class Meta:
         model = Task
@@ -109,12 +141,17 @@ class TaskForm(forms.ModelForm):
             'tags',
         )
         field_classes = {
+            'status': tm_fields.PreloadedModelChoiceField,
             'creator': tm_fields.UserModelChoiceField,
             'assigned_to': tm_fields.UserModelChoiceField,
         }
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.fields['status'].choices = [
+            ('', self.fields['status'].empty_label)
+        ] + tm_cache.status_choices()
+
         self.fields['creator'].queryset = User.objects.filter(
             is_staff=False
         )
@@ -128,20 +165,177 @@ class TaskForm(forms.ModelForm):
             self.initial['tags'] = '|'.join(
                 tag.name for tag in self.instance.tags.all()
             )
+            self.initial['version'] = self.instance.version
+            for name in ('status', 'creator', 'assigned_to'):
+                if Task._meta.get_field(name).is_cached(self.instance):
+                    self.fields[name].preload(getattr(self.instance, name))
+
+    def _get_validation_exclusions(self):
+        # The form fields already fetched the related objects
+        return super()._get_validation_exclusions() + [
+            'status', 'creator', 'assigned_to'
+        ]
 
     def save(self, commit=True):
         task = super().save(commit=False)
         if commit:
-            task.save()
-            previous_tags = [tag for tag in task.tags.all()]
-            tag_names = self.cleaned_data['tags']
-            new_tags = []
-            if tag_names:
-                for name in tag_names:
-                    tag, _ = Tag.objects.get_or_create(name=name)
-                    new_tags.append(tag)
-            task.tags.set(new_tags)
-            for previous_tag in previous_tags:
-                if previous_tag not in new_tags:
-                    previous_tag.delete_if_not_used()
+            with transaction.atomic():
+                if task._state.adding:
+                    task.save()
+                    self._save_tags(task)
+                else:
+                    self._save_changes(task)
         return task
+
+    def _save_tags(self, task, touch=True):
+        tag_names = list(
+            dict.fromkeys(
+                name for name in self.cleaned_data['tags'] if name
+            )
+        )
+        tags, _ = Tag.objects.get_or_create_many(tag_names)
+        task.set_tags(tags, touch)
+
+    def _save_changes(self, task):
+        fields = [
+            name for name in self.changed_data
+            if name in self._meta.fields and name != 'tags'
+        ]
+        if not fields and 'tags' not in self.changed_data:
+            return
+        if self.cleaned_data['version'] is not None:
+            task.version = self.cleaned_data['version']
+        task.save_changes(fields)
+        if 'tags' in self.changed_data:
+            self._save_tags(task, touch=False)
+
+
+class BulkActionForm(forms.Form):
+    SET_STATUS = 'set_status'
+    REASSIGN = 'reassign'
+    ADD_TAGS = 'add_tags'
+    REMOVE_TAGS = 'remove_tags'
+    ACTIONS = [
+        (SET_STATUS, 'Set status'),
+        (REASSIGN, 'Reassign'),
+        (ADD_TAGS, 'Add tags'),
+        (REMOVE_TAGS, 'Remove tags'),
+    ]
+    REQUIRED_FIELDS = {
+        SET_STATUS: 'status',
+        REASSIGN: 'assigned_to',
+        ADD_TAGS: 'tags',
+        REMOVE_TAGS: 'tags',
+    }
+
+    action = forms.ChoiceField(choices=ACTIONS)
+    tasks = tm_fields.IdListField(max_ids=tm_bulk.MAX_TASKS)
+    status = forms.TypedChoiceField(
+        coerce=int,
+        label='Status',
+        required=False,
+    )
+    assigned_to = tm_fields.UserModelChoiceField(
+        queryset=User.objects.filter(is_staff=False),
+        label='Assigned to',
+        required=False,
+    )
+    tags = tm_fields.TagsField()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields['status'].choices = (
+            BLANK_CHOICE + tm_cache.status_choices()
+        )
+
+    def clean(self):
+        cleaned_data = super().clean()
+        field = self.REQUIRED_FIELDS.get(cleaned_data.get('action'))
+        if field is None or field in self.errors:
+            return cleaned_data
+        value = cleaned_data.get(field)
+        if field == 'tags':
+            value = cleaned_data[field] = [
+                name for name in dict.fromkeys(value) if name
+            ]
+        if not value:
+            self.add_error(field, 'This field is required.')
+        return cleaned_data
+
+    def apply(self, user):
+        action = self.cleaned_data['action']
+        value = self.cleaned_data[self.REQUIRED_FIELDS[action]]
+        return getattr(tm_bulk, action)(
+            self.cleaned_data['tasks'], user, value
+        )
+
+
+class BulkDeleteForm(forms.Form):
+    tasks = tm_fields.IdListField(max_ids=tm_bulk.MAX_DELETED_TASKS)
+
+    def apply(self, user):
+        return tm_bulk.delete(self.cleaned_data['tasks'], user)
+
+
+class DeleteStatusForm(forms.Form):
+    move_to = forms.TypedChoiceField(
+        coerce=int,
+        empty_value=None,
+        label='Move its tasks to',
+        required=False,
+    )
+
+    def __init__(self, *args, status, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields['move_to'].choices = BLANK_CHOICE + [
+            (pk, name)
+            for pk, name in tm_cache.status_choices()
+            if pk != status.pk
+        ]
+
+
+class TaskImportForm(forms.Form):
+    name = forms.CharField(max_length=200)
+    description = forms.CharField(required=False)
+    status = forms.CharField(required=False)
+    creator = forms.CharField()
+    assigned_to = forms.CharField()
+    tags = tm_fields.TagsField()
+
+    def __init__(self, *args, statuses, users, default_status=None,
+                 **kwargs):
+        super().__init__(*args, **kwargs)
+        self.statuses = statuses
+        self.users = users
+        self.default_status = default_status
+
+    def clean_status(self):
+        name = self.cleaned_data['status']
+        if not name:
+            if self.default_status is None:
+                raise forms.ValidationError('Status is required')
+            return self.default_status
+        if name not in self.statuses:
+            raise forms.ValidationError(
+                'Unknown status "{}"'.format(name)
+            )
+        return self.statuses[name]
+
+    def _clean_user(self, field):
+        username = self.cleaned_data[field]
+        if username not in self.users:
+            raise forms.ValidationError(
+                'Unknown user "{}"'.format(username)
+            )
+        return self.users[username]
+
+    def clean_creator(self):
+        return self._clean_user('creator')
+
+    def clean_assigned_to(self):
+        return self._clean_user('assigned_to')
+
+    def clean_tags(self):
+        return list(dict.fromkeys(
+            name for name in self.cleaned_data['tags'] if name
+        ))
@@ -0,0 +1,156 @@
+import csv
+import itertools
+import json
+import os
+import time
+
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from task_manager.forms import TaskImportForm
+from task_manager.models import (
+    Tag, Task, TaskImportCheckpoint, TaskStatus
+)
+
+FORMATS = ('ndjson', 'csv')
+DEFAULT_CHUNK_SIZE = 5000
+
+
+class TaskImportError(Exception):
+    pass
+
+
+def detect_format(path):
+    extension = os.path.splitext(path)[1].lstrip('.').lower()
+    if extension in FORMATS:
+        return extension
+    raise TaskImportError(
+        'Can not detect the format of "{}", use --format'.format(path)
+    )
+
+
+def read_rows(lines, import_format):
+    if import_format == 'csv':
+        yield from csv.DictReader(lines)
+        return
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            raise TaskImportError('Line {} is not valid JSON'.format(number))
+        if not isinstance(row, dict):
+            raise TaskImportError(
+                'Line {} is not a JSON object'.format(number)
+            )
+        if isinstance(row.get('tags'), list):
+            row['tags'] = '|'.join(row['tags'])
+        yield row
+
+
+class TaskImporter:
+    def __init__(self, chunk_size=DEFAULT_CHUNK_SIZE, checkpoint=None):
+        self.chunk_size = chunk_size
+        self.checkpoint = checkpoint
+        self.statuses = dict(TaskStatus.objects.values_list('name', 'pk'))
+        self.default_status = TaskStatus.objects.order_by(
+            'pk'
+        ).values_list('pk', flat=True).first()
+        self.users = dict(
+            User.objects.filter(
+                is_staff=False
+            ).values_list('username', 'pk')
+        )
+        self.tags = {}
+        self.imported = 0
+        self.invalid = []
+
+    def read_checkpoint(self):
+        if self.checkpoint is None:
+            return 0
+        return TaskImportCheckpoint.objects.filter(
+            name=self.checkpoint
+        ).values_list('position', flat=True).first() or 0
+
+    def write_checkpoint(self, position):
+        if self.checkpoint is None:
+            return
+        TaskImportCheckpoint.objects.update_or_create(
+            name=self.checkpoint, defaults={'position': position}
+        )
+
+    def validate(self, row):
+        form = TaskImportForm(
+            row,
+            statuses=self.statuses,
+            users=self.users,
+            default_status=self.default_status,
+        )
+        if form.is_valid():
+            return form.cleaned_data, None
+        return None, form.errors
+
+    def resolve_tags(self, names):
+        missing = [name for name in names if name not in self.tags]
+        if missing:
+            tags, _ = Tag.objects.get_or_create_many(missing)
+            self.tags.update((tag.name, tag.pk) for tag in tags)
+
+    def write_chunk(self, rows):
+        tag_names = list(dict.fromkeys(
+            name for row in rows for name in row['tags']
+        ))
+        self.resolve_tags(tag_names)
+        tasks = Task.objects.bulk_create(
+            [
+                Task(
+                    name=row['name'],
+                    description=row['description'],
+                    status_id=row['status'],
+                    creator_id=row['creator'],
+                    assigned_to_id=row['assigned_to'],
+                )
+                for row in rows
+            ],
+            batch_size=self.chunk_size,
+        )
+        Task.tags.through.objects.bulk_create(
+            [
+                Task.tags.through(task_id=task.pk, tag_id=self.tags[name])
+                for task, row in zip(tasks, rows)
+                for name in row['tags']
+            ],
+            batch_size=self.chunk_size,
+        )
+
+    def run(self, rows, progress=None):
+        position = self.read_checkpoint()
+        rows = itertools.islice(rows, position, None)
+        started = time.monotonic()
+        while True:
+            chunk = list(itertools.islice(rows, self.chunk_size))
+            if not chunk:
+                break
+            valid = []
+            for number, row in enumerate(chunk, start=position + 1):
+                cleaned_data, errors = self.validate(row)
+                if errors:
+                    self.invalid.append((number, errors))
+                else:
+                    valid.append(cleaned_data)
+            position += len(chunk)
+            # The checkpoint commits with the chunk, a crash either keeps
+            # both or neither
+            with transaction.atomic():
+                if valid:
+                    self.write_chunk(valid)
+                self.write_checkpoint(position)
+            self.imported += len(valid)
+            if progress is not None:
+                progress(position, self.imported, self.rate(started))
+        return self.rate(started)
+
+    def rate(self, started):
+        elapsed = time.monotonic() - started
+        return self.imported / elapsed if elapsed else 0.0
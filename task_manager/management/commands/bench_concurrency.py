@@ -0,0 +1,174 @@
+import asyncio
+import json
+import statistics
+import time
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.contrib.auth import (
+    BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+)
+from django.contrib.auth.models import User
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.management.base import BaseCommand, CommandError
+
+
+def build_request(url, cookie):
+    parts = urlsplit(url)
+    path = parts.path or '/'
+    if parts.query:
+        path = '{}?{}'.format(path, parts.query)
+    lines = [
+        'GET {} HTTP/1.1'.format(path),
+        'Host: {}'.format(parts.netloc),
+        'Connection: close',
+    ]
+    if cookie:
+        lines.append('Cookie: {}'.format(cookie))
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('ascii')
+
+
+def percentile(values, share):
+    return sorted(values)[min(len(values) - 1, int(len(values) * share))]
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures latency of a running server while slow clients keep '
+        'connections busy. Run it against the WSGI (gunicorn) and the ASGI '
+        '(uvicorn) entry points with the same number of workers to compare '
+        'them.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('url', help='e.g. http://127.0.0.1:8000/tasks/')
+        parser.add_argument('--requests', type=int, default=200)
+        parser.add_argument('--concurrency', type=int, default=10)
+        parser.add_argument(
+            '--slow-clients',
+            type=int,
+            default=0,
+            help='Connections sending their request one byte at a time',
+        )
+        parser.add_argument(
+            '--slow-delay',
+            type=float,
+            default=0.2,
+            help='Seconds between two bytes of a slow client',
+        )
+        parser.add_argument(
+            '--username',
+            help='Requests are made with a session of this user',
+        )
+        parser.add_argument('--timeout', type=float, default=30)
+
+    def login(self, username):
+        try:
+            user = User.objects.get(username=username)
+        except User.DoesNotExist:
+            raise CommandError('Unknown user "{}"'.format(username))
+        session = SessionStore()
+        session[SESSION_KEY] = str(user.pk)
+        session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+        session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        session.create()
+        return '{}={}'.format(
+            settings.SESSION_COOKIE_NAME, session.session_key
+        )
+
+    async def open(self):
+        return await asyncio.open_connection(self.host, self.port)
+
+    async def fetch(self):
+        started = time.perf_counter()
+        reader, writer = await self.open()
+        try:
+            writer.write(self.request)
+            response = await reader.read()
+        finally:
+            writer.close()
+        status = int(response.split(b' ', 2)[1]) if response else 0
+        return status, time.perf_counter() - started
+
+    async def slow_client(self, stopped):
+        while not stopped.is_set():
+            try:
+                reader, writer = await self.open()
+            except OSError:
+                await asyncio.sleep(self.slow_delay)
+                continue
+            try:
+                for byte in self.request:
+                    if stopped.is_set():
+                        break
+                    writer.write(bytes([byte]))
+                    await writer.drain()
+                    await asyncio.sleep(self.slow_delay)
+                else:
+                    await reader.read()
+            except OSError:
+                pass
+            finally:
+                writer.close()
+
+    async def run(self, requests, concurrency, slow_clients):
+        stopped = asyncio.Event()
+        slow = [
+            asyncio.ensure_future(self.slow_client(stopped))
+            for _ in range(slow_clients)
+        ]
+        if slow:
+            await asyncio.sleep(1)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def limited():
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(self.fetch(), self.timeout)
+                except (OSError, asyncio.TimeoutError):
+                    return 0, self.timeout
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(limited() for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+        stopped.set()
+        for task in slow:
+            task.cancel()
+        await asyncio.gather(*slow, return_exceptions=True)
+        return results, elapsed
+
+    def handle(self, *args, **options):
+        parts = urlsplit(options['url'])
+        if parts.scheme != 'http' or not parts.hostname:
+            raise CommandError('Only http:// URLs are supported')
+        self.host, self.port = parts.hostname, parts.port or 80
+        self.slow_delay = options['slow_delay']
+        self.timeout = options['timeout']
+        cookie = options['username'] and self.login(options['username'])
+        self.request = build_request(options['url'], cookie)
+
+        results, elapsed = asyncio.get_event_loop().run_until_complete(
+            self.run(
+                options['requests'],
+                options['concurrency'],
+                options['slow_clients'],
+            )
+        )
+        latencies = [
+            seconds * 1000 for status, seconds in results if status == 200
+        ]
+        report = {
+            'url': options['url'],
+            'requests': options['requests'],
+            'concurrency': options['concurrency'],
+            'slow_clients': options['slow_clients'],
+            'errors': len(results) - len(latencies),
+            'requests_per_second': round(len(latencies) / elapsed, 1),
+        }
+        if latencies:
+            report.update({
+                'median_ms': round(statistics.median(latencies), 1),
+                'p95_ms': round(percentile(latencies, 0.95), 1),
+                'max_ms': round(max(latencies), 1),
+            })
+        self.stdout.write(json.dumps(report, indent=2))
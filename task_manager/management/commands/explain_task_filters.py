@@ -0,0 +1,62 @@
+import itertools
+import re
+
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.forms import FilterForm
+from task_manager.models import Task
+from task_manager.views import TasksView
+
+FILTER_FIELDS = ('status', 'creator', 'assigned_to', 'tags__in')
+SEQ_SCAN = re.compile(
+    r'Seq Scan on (task_manager_task|task_manager_task_tags)\b'
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Explains the tasks list query for every FilterForm fields '
+        'combination and fails if any of them scans a whole table. '
+        'Run it against a database seeded with realistic volumes.'
+    )
+
+    def get_sample(self):
+        task = Task.objects.filter(tags__isnull=False).order_by('-pk').first()
+        if task is None:
+            raise CommandError('There are no tagged tasks to explain')
+        return {
+            'status': task.status_id,
+            'creator': task.creator_id,
+            'assigned_to': task.assigned_to_id,
+            'tags__in': [task.tags.values_list('pk', flat=True).first()],
+        }
+
+    def get_queryset(self, data):
+        form = FilterForm(data)
+        if not form.is_valid():
+            raise CommandError(form.errors.as_text())
+        queryset = Task.objects.apply_filters(form.get_filters(None))
+        return queryset.order_by('pk')[:TasksView.paginate_by + 1]
+
+    def handle(self, *args, **options):
+        sample = self.get_sample()
+        failed = []
+        for size in range(len(FILTER_FIELDS) + 1):
+            for fields in itertools.combinations(FILTER_FIELDS, size):
+                data = {field: sample[field] for field in fields}
+                plan = self.get_queryset(data).explain()
+                name = '+'.join(fields) or 'no filters'
+                if SEQ_SCAN.search(plan):
+                    failed.append(name)
+                    self.stdout.write(
+                        self.style.ERROR('{}: sequential scan'.format(name))
+                    )
+                else:
+                    self.stdout.write('{}: index scan'.format(name))
+                if options['verbosity'] > 1:
+                    self.stdout.write(plan)
+        if failed:
+            raise CommandError(
+                'Sequential scans for: {}'.format(', '.join(failed))
+            )
+        self.stdout.write(self.style.SUCCESS('All filters use indexes'))
@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager import export as tm_export
+from task_manager.forms import FilterForm
+from task_manager.models import Task
+
+
+class Command(BaseCommand):
+    help = 'Streams tasks matching the tasks list filters to stdout'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--format',
+            choices=sorted(tm_export.FORMATS),
+            default='ndjson',
+        )
+        parser.add_argument('--status', type=int)
+        parser.add_argument('--creator', type=int)
+        parser.add_argument('--assigned-to', type=int)
+        parser.add_argument('--tag', type=int, action='append', default=[])
+        parser.add_argument('--search')
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=tm_export.DEFAULT_CHUNK_SIZE,
+        )
+
+    def handle(self, *args, **options):
+        data = {
+            'status': options['status'],
+            'creator': options['creator'],
+            'assigned_to': options['assigned_to'],
+            'tags__in': options['tag'],
+            'q': options['search'],
+        }
+        form = FilterForm({k: v for k, v in data.items() if v})
+        if not form.is_valid():
+            raise CommandError(form.errors.as_text())
+        lines = tm_export.export_lines(
+            form.filter_queryset(Task.objects.all(), None),
+            options['format'],
+            options['chunk_size'],
+        )
+        for line in lines:
+            self.stdout.write(line, ending='')
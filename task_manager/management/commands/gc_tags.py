@@ -0,0 +1,50 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from task_manager import tag_gc
+
+
+class Command(BaseCommand):
+    help = 'Deletes tags which are not bounded to any task'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=tag_gc.DEFAULT_BATCH_SIZE,
+        )
+        parser.add_argument(
+            '--max-batches',
+            type=int,
+            default=None,
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=None,
+            help='Repeats the collection every INTERVAL seconds until stopped',
+        )
+
+    def collect(self, batch_size, max_batches):
+        total = 0
+        batches = tag_gc.collect_unused_tags(batch_size, max_batches)
+        for number, (deleted, elapsed) in enumerate(batches, start=1):
+            total += deleted
+            self.stdout.write(
+                'Batch {}: deleted {} tags in {:.1f} ms'.format(
+                    number, deleted, elapsed * 1000
+                )
+            )
+        self.stdout.write(
+            self.style.SUCCESS('Deleted {} unused tags'.format(total))
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            self.collect(options['batch_size'], options['max_batches'])
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
+            close_old_connections()
@@ -0,0 +1,78 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager import importer
+
+
+class Command(BaseCommand):
+    help = (
+        'Imports tasks from a NDJSON or CSV file with the columns of '
+        'export_tasks. Statuses, creators and assignees are referenced by '
+        'name and username.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Input file, "-" for stdin')
+        parser.add_argument('--format', choices=importer.FORMATS)
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=importer.DEFAULT_CHUNK_SIZE,
+        )
+        parser.add_argument(
+            '--checkpoint',
+            help=(
+                'Name of a checkpoint keeping the number of processed '
+                'rows in the database, an interrupted import with the same '
+                'name continues from it'
+            ),
+        )
+
+    def progress(self, position, imported, rate):
+        if self.verbosity > 1:
+            self.stdout.write(
+                'Processed {} rows, imported {} ({:.0f} rows/s)'.format(
+                    position, imported, rate
+                )
+            )
+
+    def handle(self, *args, **options):
+        self.verbosity = options['verbosity']
+        path = options['path']
+        try:
+            import_format = options['format'] or importer.detect_format(path)
+        except importer.TaskImportError as error:
+            raise CommandError(error)
+
+        task_importer = importer.TaskImporter(
+            chunk_size=options['chunk_size'],
+            checkpoint=options['checkpoint'],
+        )
+        if path == '-':
+            lines = sys.stdin
+        else:
+            lines = open(path, encoding='utf-8', newline='')
+        try:
+            rate = task_importer.run(
+                importer.read_rows(lines, import_format),
+                progress=self.progress,
+            )
+        except importer.TaskImportError as error:
+            raise CommandError(error)
+        finally:
+            if lines is not sys.stdin:
+                lines.close()
+
+        for number, errors in task_importer.invalid:
+            self.stderr.write(
+                'Row {}: {}'.format(number, errors.as_json())
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                'Imported {} tasks ({:.0f} rows/s), skipped {} invalid '
+                'rows'.format(
+                    task_importer.imported, rate, len(task_importer.invalid)
+                )
+            )
+        )
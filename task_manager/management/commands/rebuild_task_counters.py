@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from task_manager import counters
+
+
+class Command(BaseCommand):
+    help = 'Recounts the tasks of every user by status'
+
+    def handle(self, *args, **options):
+        fixed = counters.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS('Fixed {} task counters'.format(fixed))
+        )
@@ -0,0 +1,67 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager import benchmark, seeding
+
+
+class Command(BaseCommand):
+    help = (
+        'Times the task views and forms at growing numbers of tasks and '
+        'writes the results as JSON. Missing rows are generated the same '
+        'way as seed_bench, so run it against a disposable database.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes',
+            type=int,
+            nargs='+',
+            default=list(benchmark.DEFAULT_SIZES),
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=benchmark.DEFAULT_REPEAT,
+        )
+        parser.add_argument(
+            '--benchmark',
+            dest='benchmarks',
+            action='append',
+            choices=sorted(benchmark.BENCHMARKS),
+        )
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--tags', type=int, default=5000)
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument(
+            '--output',
+            help='File for the JSON results, stdout by default',
+        )
+
+    def progress(self, size, name, result):
+        self.stderr.write(
+            '{} tasks, {}: median {:.1f} ms, {} queries'.format(
+                size, name, result['median_ms'], result['queries']
+            )
+        )
+
+    def handle(self, *args, **options):
+        seeding.seed_statuses()
+        seeding.seed_users(options['users'])
+        seeding.seed_tags(options['tags'])
+        try:
+            results = benchmark.run_benchmarks(
+                sizes=options['sizes'],
+                repeat=options['repeat'],
+                names=options['benchmarks'],
+                seeder=seeding.TaskSeeder(seed=options['seed']),
+                progress=self.progress if options['verbosity'] > 1 else None,
+            )
+        except ValueError as error:
+            raise CommandError(error)
+        output = json.dumps(results, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as results_file:
+                results_file.write(output)
+        else:
+            self.stdout.write(output)
@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand
+
+from task_manager import seeding
+
+
+class Command(BaseCommand):
+    help = (
+        'Fills the database with generated users, statuses, tags and tasks '
+        'for benchmarks. Counts are totals, running it again only adds the '
+        'missing rows.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--tags', type=int, default=5000)
+        parser.add_argument('--tasks', type=int, default=10000)
+        parser.add_argument(
+            '--tags-per-task',
+            type=int,
+            default=3,
+            help='Maximum number of tags bound to a task',
+        )
+        parser.add_argument(
+            '--distribution',
+            choices=seeding.DISTRIBUTIONS,
+            default='zipf',
+            help='How tags are spread over tasks',
+        )
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=seeding.DEFAULT_BATCH_SIZE,
+        )
+
+    def progress(self, created):
+        if self.verbosity > 1:
+            self.stdout.write('Created {} tasks'.format(created))
+
+    def handle(self, *args, **options):
+        self.verbosity = options['verbosity']
+        batch_size = options['batch_size']
+        seeding.seed_statuses()
+        users = seeding.seed_users(options['users'], batch_size)
+        tags = seeding.seed_tags(options['tags'], batch_size)
+        seeder = seeding.TaskSeeder(
+            tags_per_task=options['tags_per_task'],
+            distribution=options['distribution'],
+            seed=options['seed'],
+            batch_size=batch_size,
+        )
+        tasks = seeder.top_up(options['tasks'], progress=self.progress)
+        self.stdout.write(
+            self.style.SUCCESS(
+                'Created {} users, {} tags and {} tasks'.format(
+                    users, tags, tasks
+                )
+            )
+        )
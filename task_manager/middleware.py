@@ -0,0 +1,178 @@
+import asyncio
+import contextlib
+import contextvars
+import json
+import logging
+import random
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+logger = logging.getLogger(__name__)
+
+# Timings of the sampled request handled by the current task of an ASGI
+# worker, read by the executor jobs running its blocking code
+current_timings = contextvars.ContextVar('current_timings', default=None)
+
+
+class RequestTimings:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.metrics = {}
+        self.queries = 0
+        self.view_started = None
+        self.render_started = None
+
+    def add(self, name, seconds):
+        self.metrics[name] = self.metrics.get(name, 0) + seconds
+
+    def execute_wrapper(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.add('db', time.perf_counter() - started)
+
+    def merge(self, other):
+        self.queries += other.queries
+        for name, seconds in other.metrics.items():
+            self.add(name, seconds)
+
+    def header(self):
+        entries = []
+        for name, seconds in self.metrics.items():
+            entry = '{};dur={:.1f}'.format(name, seconds * 1000)
+            if name == 'db':
+                entry += ';desc="{} queries"'.format(self.queries)
+            entries.append(entry)
+        return ', '.join(entries)
+
+
+@contextlib.contextmanager
+def timed(request, name):
+    timings = getattr(request, 'timings', None)
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, time.perf_counter() - started)
+
+
+@contextlib.contextmanager
+def track_queries(timings):
+    # Database connections belong to a thread, the queries are counted on
+    # the connections of the calling thread only
+    with contextlib.ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(
+                connection.execute_wrapper(timings.execute_wrapper)
+            )
+        yield
+
+
+class ServerTimingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.sample_rate = settings.SERVER_TIMING_SAMPLE_RATE
+        if not self.sample_rate:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if asyncio.iscoroutinefunction(self.get_response):
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+        if random.random() >= self.sample_rate:
+            return self.get_response(request)
+        timings = self.start(request)
+        with track_queries(timings):
+            response = self.get_response(request)
+        return self.finish(request, response, timings)
+
+    async def __acall__(self, request):
+        if random.random() >= self.sample_rate:
+            return await self.get_response(request)
+        timings = self.start(request)
+        token = current_timings.set(timings)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_timings.reset(token)
+        return self.finish(request, response, timings)
+
+    def start(self, request):
+        timings = request.timings = RequestTimings()
+        timings.add('db', 0)
+        return timings
+
+    def finish(self, request, response, timings):
+        if timings.view_started is not None and 'view' not in timings.metrics:
+            timings.add('view', time.perf_counter() - timings.view_started)
+        timings.add('total', time.perf_counter() - timings.started)
+        response['Server-Timing'] = timings.header()
+        logger.info(json.dumps({
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'queries': timings.queries,
+            **{
+                '{}_ms'.format(name): round(seconds * 1000, 1)
+                for name, seconds in timings.metrics.items()
+            },
+        }))
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        timings = getattr(request, 'timings', None)
+        if timings is not None:
+            timings.view_started = time.perf_counter()
+
+    def process_template_response(self, request, response):
+        timings = getattr(request, 'timings', None)
+        # Async views time their rendering themselves
+        if timings is not None and 'view' not in timings.metrics:
+            now = time.perf_counter()
+            timings.add('view', now - timings.view_started)
+            response.add_post_render_callback(
+                lambda response: timings.add(
+                    'render', time.perf_counter() - now
+                )
+            )
+        return response
+
+
+class AsyncWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    # WhiteNoise only runs synchronously, which makes Django run the whole
+    # middleware chain and the async views of the ASGI application in one
+    # shared thread. Static files are still served from a thread here, but
+    # other requests stay on the event loop.
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, settings=settings):
+        super().__init__(get_response, settings)
+        if asyncio.iscoroutinefunction(self.get_response):
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        response = await sync_to_async(
+            self.process_request,
+            thread_sensitive=False,
+        )(request)
+        return response or await self.get_response(request)
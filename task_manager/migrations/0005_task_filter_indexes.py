@@ -0,0 +1,44 @@
+# Generated by Django 3.1.14 on 2026-10-18 05:37
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('task_manager', '0004_auto_20200912_1330'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(fields=['assigned_to', 'id'], name='task_assigned_to_id_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(fields=['creator', 'id'], name='task_creator_id_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(fields=['status', 'id'], name='task_status_id_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(fields=['assigned_to', 'status', 'id'], name='task_assigned_status_id_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(fields=['creator', 'status', 'id'], name='task_creator_status_id_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(fields=['creator', 'assigned_to', 'id'], name='task_creator_assigned_id_idx'),
+        ),
+        migrations.RunSQL(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS task_tags_tag_task_idx '
+            'ON task_manager_task_tags (tag_id, task_id);',
+            'DROP INDEX CONCURRENTLY IF EXISTS task_tags_tag_task_idx;',
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 3.1.14 on 2026-10-18 05:42
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+CREATE_TRIGGER = """
+CREATE FUNCTION task_manager_task_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('english', coalesce(NEW.name, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(NEW.description, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER task_manager_task_search_vector_trigger
+BEFORE INSERT OR UPDATE OF name, description, search_vector
+ON task_manager_task
+FOR EACH ROW EXECUTE PROCEDURE task_manager_task_search_vector_update();
+"""
+
+DROP_TRIGGER = """
+DROP TRIGGER task_manager_task_search_vector_trigger ON task_manager_task;
+DROP FUNCTION task_manager_task_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('task_manager', '0005_task_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER, DROP_TRIGGER),
+        migrations.RunSQL(
+            'UPDATE task_manager_task SET search_vector = NULL;',
+            migrations.RunSQL.noop,
+        ),
+        AddIndexConcurrently(
+            model_name='task',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='task_search_vector_idx'),
+        ),
+    ]
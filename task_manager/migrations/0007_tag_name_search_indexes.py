@@ -0,0 +1,23 @@
+# Generated by Django 3.1.14 on 2026-10-18 05:45
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import (
+    AddIndexConcurrently, TrigramExtension
+)
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('task_manager', '0006_task_search_vector'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name='tag',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='tag_name_trigram_idx', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations
+
+USER_NAME_FIELDS = ('username', 'first_name', 'last_name')
+
+
+def create_index(field):
+    return (
+        'CREATE INDEX CONCURRENTLY IF NOT EXISTS auth_user_{0}_prefix_idx '
+        'ON auth_user (UPPER({0}::text) text_pattern_ops) '
+        'WHERE NOT is_staff;'.format(field)
+    )
+
+
+def drop_index(field):
+    return 'DROP INDEX CONCURRENTLY IF EXISTS auth_user_{}_prefix_idx;'.format(
+        field
+    )
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('task_manager', '0007_tag_name_search_indexes'),
+    ]
+
+    operations = [
+        migrations.RunSQL(create_index(field), drop_index(field))
+        for field in USER_NAME_FIELDS
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 3.1.14 on 2026-10-18 06:05
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+CREATE_TRIGGERS = """
+CREATE FUNCTION task_manager_task_change_seq_update() RETURNS trigger AS $$
+BEGIN
+    NEW.change_seq := txid_current();
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER task_manager_task_change_seq_trigger
+BEFORE INSERT OR UPDATE
+ON task_manager_task
+FOR EACH ROW EXECUTE PROCEDURE task_manager_task_change_seq_update();
+
+CREATE FUNCTION task_manager_task_tombstone_insert() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO task_manager_tasktombstone (task_id, change_seq, deleted_at)
+    VALUES (OLD.id, txid_current(), now());
+    RETURN OLD;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER task_manager_task_tombstone_trigger
+AFTER DELETE
+ON task_manager_task
+FOR EACH ROW EXECUTE PROCEDURE task_manager_task_tombstone_insert();
+"""
+
+DROP_TRIGGERS = """
+DROP TRIGGER task_manager_task_tombstone_trigger ON task_manager_task;
+DROP FUNCTION task_manager_task_tombstone_insert();
+DROP TRIGGER task_manager_task_change_seq_trigger ON task_manager_task;
+DROP FUNCTION task_manager_task_change_seq_update();
+"""
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('task_manager', '0009_task_timestamps'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskTombstone',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('task_id', models.IntegerField()),
+                ('change_seq', models.BigIntegerField()),
+                ('deleted_at', models.DateTimeField()),
+            ],
+            options={
+                'indexes': [models.Index(fields=['change_seq', 'task_id'], name='tombstone_change_seq_idx')],
+            },
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='change_seq',
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.RunSQL(CREATE_TRIGGERS, DROP_TRIGGERS),
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(fields=['change_seq', 'id'], name='task_change_seq_idx'),
+        ),
+    ]
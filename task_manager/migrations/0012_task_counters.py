@@ -0,0 +1,114 @@
+# Generated by Django 3.1.14 on 2026-10-18 06:32
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+# Statement level triggers apply one aggregated change per counter, so a
+# bulk statement touching thousands of tasks updates each counter once.
+# Decrements only update existing rows: when a user is deleted its
+# counters may go before its tasks.
+CREATE_TRIGGERS = """
+CREATE FUNCTION task_manager_task_counters_update() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO task_manager_taskcounter (user_id, status_id, count)
+        SELECT assigned_to_id, status_id, count(*)
+        FROM new_rows
+        GROUP BY 1, 2
+        ORDER BY 1, 2
+        ON CONFLICT (user_id, status_id) DO UPDATE
+        SET count = task_manager_taskcounter.count + EXCLUDED.count;
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE task_manager_taskcounter counter
+        SET count = counter.count - removed.count
+        FROM (
+            SELECT assigned_to_id, status_id, count(*) AS count
+            FROM old_rows
+            GROUP BY 1, 2
+        ) removed
+        WHERE counter.user_id = removed.assigned_to_id
+        AND counter.status_id = removed.status_id;
+    ELSE
+        INSERT INTO task_manager_taskcounter (user_id, status_id, count)
+        SELECT new_rows.assigned_to_id, new_rows.status_id, count(*)
+        FROM new_rows JOIN old_rows ON old_rows.id = new_rows.id
+        WHERE (old_rows.assigned_to_id, old_rows.status_id)
+            IS DISTINCT FROM (new_rows.assigned_to_id, new_rows.status_id)
+        GROUP BY 1, 2
+        ORDER BY 1, 2
+        ON CONFLICT (user_id, status_id) DO UPDATE
+        SET count = task_manager_taskcounter.count + EXCLUDED.count;
+        UPDATE task_manager_taskcounter counter
+        SET count = counter.count - removed.count
+        FROM (
+            SELECT old_rows.assigned_to_id, old_rows.status_id, count(*)
+            FROM old_rows JOIN new_rows ON new_rows.id = old_rows.id
+            WHERE (old_rows.assigned_to_id, old_rows.status_id)
+                IS DISTINCT FROM (new_rows.assigned_to_id, new_rows.status_id)
+            GROUP BY 1, 2
+        ) removed
+        WHERE counter.user_id = removed.assigned_to_id
+        AND counter.status_id = removed.status_id;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER task_manager_task_counters_insert_trigger
+AFTER INSERT ON task_manager_task
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE PROCEDURE task_manager_task_counters_update();
+
+CREATE TRIGGER task_manager_task_counters_update_trigger
+AFTER UPDATE ON task_manager_task
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE PROCEDURE task_manager_task_counters_update();
+
+CREATE TRIGGER task_manager_task_counters_delete_trigger
+AFTER DELETE ON task_manager_task
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE PROCEDURE task_manager_task_counters_update();
+"""
+
+DROP_TRIGGERS = """
+DROP TRIGGER task_manager_task_counters_delete_trigger ON task_manager_task;
+DROP TRIGGER task_manager_task_counters_update_trigger ON task_manager_task;
+DROP TRIGGER task_manager_task_counters_insert_trigger ON task_manager_task;
+DROP FUNCTION task_manager_task_counters_update();
+"""
+
+# The triggers lock the task table against writes until the migration
+# commits, so no change is missed or counted twice
+FILL_COUNTERS = """
+INSERT INTO task_manager_taskcounter (user_id, status_id, count)
+SELECT assigned_to_id, status_id, count(*)
+FROM task_manager_task
+GROUP BY 1, 2;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('task_manager', '0011_task_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskCounter',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('count', models.IntegerField(default=0)),
+                ('status', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='task_manager.taskstatus')),
+                ('user', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='task_counters', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='taskcounter',
+            constraint=models.UniqueConstraint(fields=('user', 'status'), name='task_counter_user_status_uniq'),
+        ),
+        migrations.RunSQL(CREATE_TRIGGERS, DROP_TRIGGERS),
+        migrations.RunSQL(FILL_COUNTERS, migrations.RunSQL.noop),
+    ]
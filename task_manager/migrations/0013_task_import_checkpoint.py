@@ -0,0 +1,21 @@
+# Generated by Django 3.1.14 on 2026-10-18 07:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('task_manager', '0012_task_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskImportCheckpoint',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True)),
+                ('position', models.BigIntegerField(default=0)),
+            ],
+        ),
+    ]
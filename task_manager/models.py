@@ -1,7 +1,31 @@
 from django.db import models
+from django.db.models.functions import Cast
+from django.db.models.signals import post_save
+from django.utils import timezone
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import (
+    SearchQuery, SearchRank, SearchVectorField
+)
 
 DEFAULT_TASK_STATUS_ID = 1
+SEARCH_CONFIG = 'english'
+TRIGRAM_MIN_LENGTH = 3
+
+
+class VersionConflict(Exception):
+    pass
+
+
+def find_users(term):
+    users = User.objects.filter(is_staff=False)
+    for word in term.split():
+        users = users.filter(
+            models.Q(username__istartswith=word) |
+            models.Q(first_name__istartswith=word) |
+            models.Q(last_name__istartswith=word)
+        )
+    return users
 
 
 class TaskStatus(models.Model):
@@ -14,13 +38,58 @@ class TaskStatus(models.Model):
         return '<TaskStatus {}>'.format(self.name)
 
 
+class TagQuerySet(models.QuerySet):
+    def get_or_create_many(self, names):
+        tags = {tag.name: tag for tag in self.filter(name__in=names)}
+        missing = [name for name in names if name not in tags]
+        if missing:
+            self.bulk_create(
+                [self.model(name=name) for name in missing],
+                ignore_conflicts=True
+            )
+            tags.update(
+                (tag.name, tag) for tag in self.filter(name__in=missing)
+            )
+        return [tags[name] for name in names], bool(missing)
+
+    def autocomplete(self, term, limit):
+        term = term.strip().lower()
+        if not term:
+            return []
+        tags = list(
+            self.filter(name__startswith=term).order_by('name')[:limit]
+        )
+        if len(tags) < limit and len(term) >= TRIGRAM_MIN_LENGTH:
+            tags.extend(
+                self.filter(name__contains=term).exclude(
+                    name__startswith=term
+                ).order_by('name')[:limit - len(tags)]
+            )
+        return tags
+
+    def unused(self):
+        return self.exclude(
+            models.Exists(
+                Task.tags.through.objects.filter(tag_id=models.OuterRef('pk'))
+            )
+        )
+
+
 class Tag(models.Model):
     name = models.CharField(max_length=100, unique=True)
 
-    def delete_if_not_used(self):
-        bounded_tasks = self.task_set.all()
-        if not bounded_tasks:
-            self.delete()
+    objects = TagQuerySet.as_manager()
+
+    class Meta:
+        # Prefix searches use the varchar_pattern_ops index Django creates
+        # for the unique name
+        indexes = [
+            GinIndex(
+                fields=['name'],
+                name='tag_name_trigram_idx',
+                opclasses=['gin_trgm_ops'],
+            ),
+        ]
 
     def __str__(self):
         return self.name
@@ -29,6 +98,40 @@ class Tag(models.Model):
         return '<Tag {}>'.format(self.name)
 
 
+class TaskQuerySet(models.QuerySet):
+    def for_listing(self):
+        return self.select_related(
+            'status',
+            'creator',
+            'assigned_to',
+        ).prefetch_related('tags').defer('search_vector')
+
+    def apply_filters(self, filters):
+        filters = dict(filters)
+        tag_ids = filters.pop('tags__in', None)
+        queryset = self.filter(**filters)
+        if tag_ids:
+            queryset = queryset.filter(
+                pk__in=Task.tags.through.objects.filter(
+                    tag_id__in=tag_ids
+                ).values('task_id')
+            )
+        return queryset
+
+    def search(self, text):
+        query = SearchQuery(
+            text,
+            config=SEARCH_CONFIG,
+            search_type='websearch'
+        )
+        return self.filter(search_vector=query).annotate(
+            rank=Cast(
+                SearchRank(models.F('search_vector'), query),
+                models.FloatField()
+            )
+        )
+
+
 class Task(models.Model):
     name = models.CharField(max_length=200)
     description = models.TextField(blank=True)
@@ -36,7 +139,7 @@ class Task(models.Model):
         TaskStatus,
         related_name='bounded_tasks',
         on_delete=models.CASCADE,
-        default=DEFAULT_TASK_STATUS_ID
+        default=DEFAULT_TASK_STATUS_ID,
     )
     creator = models.ForeignKey(
         User,
@@ -49,9 +152,184 @@ class Task(models.Model):
         on_delete=models.CASCADE,
     )
     tags = models.ManyToManyField(Tag, blank=True)
+    search_vector = SearchVectorField(null=True, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    # Set by a trigger to the id of the last transaction writing the row
+    change_seq = models.BigIntegerField(default=0, editable=False)
+    # Incremented by every write, edits check it instead of locking the row
+    version = models.PositiveIntegerField(default=1, editable=False)
+
+    objects = TaskQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['assigned_to', 'id'],
+                name='task_assigned_to_id_idx',
+            ),
+            models.Index(
+                fields=['creator', 'id'],
+                name='task_creator_id_idx',
+            ),
+            models.Index(
+                fields=['status', 'id'],
+                name='task_status_id_idx',
+            ),
+            models.Index(
+                fields=['assigned_to', 'status', 'id'],
+                name='task_assigned_status_id_idx',
+            ),
+            models.Index(
+                fields=['creator', 'status', 'id'],
+                name='task_creator_status_id_idx',
+            ),
+            models.Index(
+                fields=['creator', 'assigned_to', 'id'],
+                name='task_creator_assigned_id_idx',
+            ),
+            GinIndex(
+                fields=['search_vector'],
+                name='task_search_vector_idx',
+            ),
+            models.Index(
+                fields=['created_at'],
+                name='task_created_at_idx',
+            ),
+            models.Index(
+                fields=['updated_at'],
+                name='task_updated_at_idx',
+            ),
+            models.Index(
+                fields=['change_seq', 'id'],
+                name='task_change_seq_idx',
+            ),
+        ]
+
+    def save_changes(self, fields):
+        # Writes the fields only if nobody wrote the task since self.version
+        # was read, raises VersionConflict otherwise
+        self.updated_at = timezone.now()
+        values = {
+            field.attname: getattr(self, field.attname)
+            for field in map(self._meta.get_field, fields)
+        }
+        updated = Task.objects.filter(
+            pk=self.pk,
+            version=self.version,
+        ).update(
+            version=models.F('version') + 1,
+            updated_at=self.updated_at,
+            **values
+        )
+        if not updated:
+            raise VersionConflict
+        self.version += 1
+        post_save.send(
+            sender=Task,
+            instance=self,
+            created=False,
+            update_fields=frozenset(fields) | {'updated_at', 'version'},
+            raw=False,
+            using=self._state.db,
+        )
+
+    def set_tags(self, tags, touch=True):
+        through = Task.tags.through
+        new_ids = {tag.pk for tag in tags}
+        if 'tags' in getattr(self, '_prefetched_objects_cache', {}):
+            current_ids = {tag.pk for tag in self.tags.all()}
+        else:
+            current_ids = set(
+                through.objects.filter(
+                    task_id=self.pk
+                ).values_list('tag_id', flat=True)
+            )
+        removed_ids = current_ids - new_ids
+        added_ids = new_ids - current_ids
+        if removed_ids:
+            through.objects.filter(
+                task_id=self.pk,
+                tag_id__in=removed_ids
+            ).delete()
+        if added_ids:
+            through.objects.bulk_create(
+                [
+                    through(task_id=self.pk, tag_id=tag_id)
+                    for tag_id in added_ids
+                ],
+                ignore_conflicts=True
+            )
+        if touch and (removed_ids or added_ids):
+            self.updated_at = timezone.now()
+            Task.objects.filter(pk=self.pk).update(
+                updated_at=self.updated_at,
+                version=models.F('version') + 1,
+            )
+            self.version += 1
+        if hasattr(self, '_prefetched_objects_cache'):
+            self._prefetched_objects_cache.pop('tags', None)
 
     def __str__(self):
         return self.name
 
     def __repr__(self):
         return '<Task {}>'.format(self.name)
+
+
+class TaskTombstone(models.Model):
+    # Rows are inserted by a trigger when a task is deleted
+    task_id = models.IntegerField()
+    change_seq = models.BigIntegerField()
+    deleted_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['change_seq', 'task_id'],
+                name='tombstone_change_seq_idx',
+            ),
+        ]
+
+    def __repr__(self):
+        return '<TaskTombstone {}>'.format(self.task_id)
+
+
+class TaskCounter(models.Model):
+    # Number of tasks assigned to a user in a status, kept up to date by
+    # statement triggers on the task table
+    user = models.ForeignKey(
+        User,
+        related_name='task_counters',
+        on_delete=models.CASCADE,
+        db_index=False,
+    )
+    status = models.ForeignKey(
+        TaskStatus,
+        related_name='+',
+        on_delete=models.CASCADE,
+    )
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'status'],
+                name='task_counter_user_status_uniq',
+            ),
+        ]
+
+    def __repr__(self):
+        return '<TaskCounter {} {} {}>'.format(
+            self.user_id, self.status_id, self.count
+        )
+
+
+class TaskImportCheckpoint(models.Model):
+    # Number of rows an import processed, saved in the transaction of
+    # each chunk so an interrupted import resumes right after it
+    name = models.CharField(max_length=255, unique=True)
+    position = models.BigIntegerField(default=0)
+
+    def __repr__(self):
+        return '<TaskImportCheckpoint {} {}>'.format(self.name, self.position)
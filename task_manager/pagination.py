@@ -0,0 +1,182 @@
+import base64
+import json
+
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.http import Http404
+
+CURSOR_PARAM = 'cursor'
+NEXT = 'n'
+PREVIOUS = 'p'
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+def encode_cursor(direction, value, pk):
+    payload = json.dumps([direction, value, pk], cls=DjangoJSONEncoder)
+    return base64.urlsafe_b64encode(
+        payload.encode('utf-8')
+    ).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    padding = '=' * (-len(cursor) % 4)
+    try:
+        payload = base64.urlsafe_b64decode(cursor + padding)
+        direction, value, pk = json.loads(payload.decode('utf-8'))
+    except (ValueError, TypeError):
+        raise InvalidCursor(cursor)
+    if direction not in (NEXT, PREVIOUS) or not isinstance(pk, int):
+        raise InvalidCursor(cursor)
+    return direction, value, pk
+
+
+class KeysetPage:
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __repr__(self):
+        return '<KeysetPage {} objects>'.format(len(self))
+
+
+class KeysetPaginator:
+    def __init__(self, queryset, per_page, ordering='pk'):
+        self.queryset = queryset
+        self.per_page = int(per_page)
+        self.descending = ordering.startswith('-')
+        self.field = ordering.lstrip('-')
+
+    def _key(self, obj):
+        return getattr(obj, self.field), obj.pk
+
+    def _order_by(self, reverse):
+        descending = self.descending != reverse
+        prefix = '-' if descending else ''
+        if self.field == 'pk':
+            return ('{}pk'.format(prefix),)
+        return (
+            '{}{}'.format(prefix, self.field),
+            '{}pk'.format(prefix),
+        )
+
+    def _clean_value(self, value):
+        # The value of a cursor comes from the client, it has to fit the
+        # ordering field before being used in a lookup
+        annotation = self.queryset.query.annotations.get(self.field)
+        if annotation is not None:
+            field = annotation.output_field
+        else:
+            field = self.queryset.model._meta.get_field(self.field)
+        try:
+            value = field.to_python(value)
+        except ValidationError:
+            raise InvalidCursor(value)
+        if value is None:
+            raise InvalidCursor(value)
+        return value
+
+    def _after(self, value, pk, reverse):
+        descending = self.descending != reverse
+        lookup = 'lt' if descending else 'gt'
+        pk_filter = Q(**{'pk__{}'.format(lookup): pk})
+        if self.field == 'pk':
+            return pk_filter
+        return Q(**{'{}__{}'.format(self.field, lookup): value}) | (
+            Q(**{self.field: value}) & pk_filter
+        )
+
+    def _window(self, cursor):
+        if cursor:
+            direction, value, pk = decode_cursor(cursor)
+        else:
+            direction, value, pk = NEXT, None, None
+        reverse = direction == PREVIOUS
+
+        queryset = self.queryset.order_by(*self._order_by(reverse))
+        if pk is not None:
+            if self.field != 'pk':
+                value = self._clean_value(value)
+            queryset = queryset.filter(self._after(value, pk, reverse))
+        return queryset[:self.per_page + 1], reverse, pk
+
+    def page_values(self, cursor=None, *fields):
+        window, _, _ = self._window(cursor)
+        return list(window.prefetch_related(None).values_list(*fields))
+
+    def page(self, cursor=None):
+        window, reverse, pk = self._window(cursor)
+        rows = list(window)
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if reverse:
+            rows.reverse()
+
+        if not rows:
+            return KeysetPage(rows)
+        first, last = self._key(rows[0]), self._key(rows[-1])
+        if reverse:
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, pk is not None
+        return KeysetPage(
+            rows,
+            next_cursor=encode_cursor(NEXT, *last) if has_next else None,
+            previous_cursor=(
+                encode_cursor(PREVIOUS, *first) if has_previous else None
+            ),
+        )
+
+
+class KeysetPaginationMixin:
+    paginate_by = 50
+    keyset_ordering = 'pk'
+
+    def get_keyset_ordering(self):
+        return self.keyset_ordering
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator = KeysetPaginator(
+            queryset, page_size, ordering=self.get_keyset_ordering()
+        )
+        try:
+            page = paginator.page(self.request.GET.get(CURSOR_PARAM))
+        except InvalidCursor:
+            raise Http404('Invalid page cursor')
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def _page_url(self, cursor):
+        params = self.request.GET.copy()
+        params[CURSOR_PARAM] = cursor
+        return '?{}'.format(params.urlencode())
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        page = context.get('page_obj')
+        if page is not None:
+            if page.has_next():
+                context['next_page_url'] = self._page_url(page.next_cursor)
+            if page.has_previous():
+                context['previous_page_url'] = self._page_url(
+                    page.previous_cursor
+                )
+        return context
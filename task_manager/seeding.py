@@ -0,0 +1,146 @@
+import itertools
+import random
+
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from task_manager.models import Tag, Task, TaskStatus
+
+DISTRIBUTIONS = ('uniform', 'zipf')
+DEFAULT_STATUSES = ('new', 'in progress', 'testing', 'done')
+DEFAULT_BATCH_SIZE = 5000
+USERNAME_PREFIX = 'bench_user_'
+TAG_PREFIX = 'bench_tag_'
+WORDS = (
+    'fix', 'add', 'update', 'remove', 'refactor', 'review', 'deploy',
+    'migrate', 'document', 'test', 'release', 'investigate', 'login',
+    'report', 'invoice', 'dashboard', 'search', 'export', 'import',
+    'cache', 'database', 'server', 'client', 'payment', 'email', 'profile',
+    'settings', 'upload', 'backup', 'monitoring', 'performance', 'api',
+)
+
+
+def _batches(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _sentence(rng, min_words, max_words):
+    words = rng.choices(WORDS, k=rng.randint(min_words, max_words))
+    return ' '.join(words).capitalize()
+
+
+def seed_statuses(names=DEFAULT_STATUSES):
+    statuses, _ = zip(*(
+        TaskStatus.objects.get_or_create(name=name) for name in names
+    ))
+    return list(statuses)
+
+
+def seed_users(count, batch_size=DEFAULT_BATCH_SIZE):
+    existing = User.objects.filter(
+        username__startswith=USERNAME_PREFIX
+    ).count()
+    users = (
+        User(
+            username='{}{}'.format(USERNAME_PREFIX, number),
+            first_name='Bench',
+            last_name='User{}'.format(number),
+        )
+        for number in range(existing + 1, count + 1)
+    )
+    for batch in _batches(users, batch_size):
+        User.objects.bulk_create(batch)
+    return max(count - existing, 0)
+
+
+def seed_tags(count, batch_size=DEFAULT_BATCH_SIZE):
+    existing = Tag.objects.filter(name__startswith=TAG_PREFIX).count()
+    tags = (
+        Tag(name='{}{}'.format(TAG_PREFIX, number))
+        for number in range(existing + 1, count + 1)
+    )
+    for batch in _batches(tags, batch_size):
+        Tag.objects.bulk_create(batch, ignore_conflicts=True)
+    return max(count - existing, 0)
+
+
+def tag_weights(count, distribution):
+    if distribution == 'zipf':
+        return [1 / rank for rank in range(1, count + 1)]
+    return [1] * count
+
+
+class TaskSeeder:
+    def __init__(self, tags_per_task=3, distribution='zipf', seed=0,
+                 batch_size=DEFAULT_BATCH_SIZE):
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError('Unknown distribution "{}"'.format(distribution))
+        self.tags_per_task = tags_per_task
+        self.batch_size = batch_size
+        self.rng = random.Random(seed)
+        self.status_ids = list(
+            TaskStatus.objects.order_by('pk').values_list('pk', flat=True)
+        )
+        self.user_ids = list(
+            User.objects.filter(
+                username__startswith=USERNAME_PREFIX
+            ).values_list('pk', flat=True)
+        )
+        self.tag_ids = list(
+            Tag.objects.filter(
+                name__startswith=TAG_PREFIX
+            ).order_by('pk').values_list('pk', flat=True)
+        )
+        self.tag_weights = list(
+            itertools.accumulate(tag_weights(len(self.tag_ids), distribution))
+        )
+        if not self.status_ids or not self.user_ids:
+            raise ValueError('Seed statuses and users before tasks')
+
+    def build_task(self):
+        return Task(
+            name=_sentence(self.rng, 2, 8),
+            description=_sentence(self.rng, 0, 40),
+            status_id=self.rng.choice(self.status_ids),
+            creator_id=self.rng.choice(self.user_ids),
+            assigned_to_id=self.rng.choice(self.user_ids),
+        )
+
+    def choose_tags(self):
+        if not self.tag_ids:
+            return set()
+        count = self.rng.randint(0, self.tags_per_task)
+        return set(
+            self.rng.choices(
+                self.tag_ids, cum_weights=self.tag_weights, k=count
+            )
+        )
+
+    def seed(self, count, progress=None):
+        created = 0
+        while created < count:
+            size = min(self.batch_size, count - created)
+            with transaction.atomic():
+                tasks = Task.objects.bulk_create(
+                    [self.build_task() for _ in range(size)]
+                )
+                Task.tags.through.objects.bulk_create(
+                    [
+                        Task.tags.through(task_id=task.pk, tag_id=tag_id)
+                        for task in tasks
+                        for tag_id in self.choose_tags()
+                    ],
+                    batch_size=self.batch_size,
+                )
+            created += size
+            if progress is not None:
+                progress(created)
+        return created
+
+    def top_up(self, total, progress=None):
+        return self.seed(max(total - Task.objects.count(), 0), progress)
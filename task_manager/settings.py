@@ -50,6 +50,37 @@ EMAIL_HOST = 'smtp.googlemail.com'
 EMAIL_PORT = 587
 EMAIL_USE_TLS = True
 
+# Share of requests getting a Server-Timing header and a timings log line,
+# 0 disables the middleware
+SERVER_TIMING_SAMPLE_RATE = float(os.getenv('SERVER_TIMING_SAMPLE_RATE', 0))
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'message': {
+            'format': '%(message)s',
+        },
+    },
+    'handlers': {
+        'timings': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'message',
+        },
+    },
+    'loggers': {
+        # The timings log lines are JSON objects, one per sampled request
+        'task_manager.middleware': {
+            'handlers': ['timings'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+    },
+}
+
+# Threads running the blocking part of async views in an ASGI worker
+ASYNC_VIEW_THREADS = int(os.getenv('ASYNC_VIEW_THREADS', 8))
+
 if os.getenv("DJANGO_ENVIRONMENT") == 'local':
     DEBUG = True
     DATABASES = {
@@ -86,10 +117,12 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'bootstrap4',
 ]
 
 MIDDLEWARE = [
+    'task_manager.middleware.ServerTimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -98,9 +131,28 @@ MIDDLEWARE = [
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'rollbar.contrib.django.middleware.RollbarNotifierMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'task_manager.middleware.AsyncWhiteNoiseMiddleware',
 ]
 
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'OPTIONS': {
+            'MAX_ENTRIES': 20000,
+        },
+    },
+}
+# The status and user choices, their versions in the page ETags and the
+# rendered rows are cached. The local memory cache belongs to one process:
+# when running several workers, CACHE_BACKEND and CACHE_LOCATION must point
+# every one of them to the same cache (e.g. memcached), otherwise workers
+# serve stale choices and pages until the entries expire.
+if os.getenv('CACHE_BACKEND'):
+    CACHES['default'] = {
+        'BACKEND': os.getenv('CACHE_BACKEND'),
+        'LOCATION': os.getenv('CACHE_LOCATION', ''),
+    }
+
 ROOT_URLCONF = 'task_manager.urls'
 
 TEMPLATES = [
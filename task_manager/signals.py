@@ -0,0 +1,40 @@
+from django.db.models.signals import post_init, post_save, post_delete
+from django.dispatch import receiver
+from django.contrib.auth.models import User
+
+from task_manager import cache as tm_cache
+from task_manager import events as tm_events
+from task_manager.models import Task, TaskStatus
+
+NOT_LISTED_USER_FIELDS = {'last_login', 'password'}
+
+
+@receiver(post_save, sender=TaskStatus)
+@receiver(post_delete, sender=TaskStatus)
+def invalidate_status_choices(sender, **kwargs):
+    tm_cache.invalidate(tm_cache.STATUSES)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_choices(sender, update_fields=None, **kwargs):
+    if update_fields and set(update_fields) <= NOT_LISTED_USER_FIELDS:
+        return
+    tm_cache.invalidate(tm_cache.USERS)
+
+
+@receiver(post_init, sender=Task)
+def remember_assignee(sender, instance, **kwargs):
+    # Read from __dict__ so that deferred loads do not query the field
+    instance._loaded_assigned_to_id = instance.__dict__.get('assigned_to_id')
+
+
+@receiver(post_save, sender=Task)
+def publish_task_saved(sender, instance, created, **kwargs):
+    tm_events.publish_task(instance, 'created' if created else 'updated')
+    instance._loaded_assigned_to_id = instance.assigned_to_id
+
+
+@receiver(post_delete, sender=Task)
+def publish_task_deleted(sender, instance, **kwargs):
+    tm_events.publish_task(instance, 'deleted')
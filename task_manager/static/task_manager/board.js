@@ -0,0 +1,18 @@
+const loadMore = (event) => {
+    const link = event.target.closest('.board-more');
+    if (!link) {
+        return;
+    };
+    event.preventDefault();
+    fetch(link.href, {credentials: 'same-origin'})
+        .then((response) => {
+            if (!response.ok) {
+                throw new Error(response.statusText);
+            };
+            return response.text();
+        })
+        .then((html) => { link.outerHTML = html; })
+        .catch(() => { window.location.href = link.href; });
+};
+
+document.addEventListener('click', loadMore);
@@ -0,0 +1,83 @@
+const debounce = (callback, delay) => {
+    let timer;
+    return (...args) => {
+        clearTimeout(timer);
+        timer = setTimeout(() => callback(...args), delay);
+    };
+};
+
+const fetchTags = (url, term) => {
+    const params = new URLSearchParams({q: term});
+    return fetch(`${url}?${params}`, {credentials: 'same-origin'})
+        .then((response) => response.json())
+        .then((data) => data.results);
+};
+
+const setUpTagsInput = (input) => {
+    const datalist = document.createElement('datalist');
+    datalist.id = input.getAttribute('list');
+    input.after(datalist);
+
+    const suggest = debounce(() => {
+        const parts = input.value.split('|');
+        const term = parts.pop().trim();
+        if (!term) {
+            return;
+        }
+        const prefix = parts.length ? `${parts.join('|')}|` : '';
+        fetchTags(input.dataset.autocompleteUrl, term).then((tags) => {
+            datalist.replaceChildren(...tags.map((tag) => {
+                const option = document.createElement('option');
+                option.value = `${prefix}${tag.name}`;
+                return option;
+            }));
+        });
+    }, 200);
+    input.addEventListener('input', suggest);
+};
+
+const setUpTagsFilter = (input) => {
+    const results = document.getElementById(input.dataset.results);
+
+    const addCheckbox = (tag) => {
+        const name = input.dataset.fieldName;
+        if (document.querySelector(`[name="${name}"][value="${tag.id}"]`)) {
+            return;
+        }
+        const wrapper = document.createElement('div');
+        wrapper.className = 'form-check';
+        const checkbox = document.createElement('input');
+        checkbox.type = 'checkbox';
+        checkbox.className = 'form-check-input';
+        checkbox.name = name;
+        checkbox.value = tag.id;
+        checkbox.id = `${name}_${tag.id}`;
+        const label = document.createElement('label');
+        label.className = 'form-check-label';
+        label.htmlFor = checkbox.id;
+        label.textContent = tag.name;
+        wrapper.append(checkbox, label);
+        results.append(wrapper);
+    };
+
+    const search = debounce(() => {
+        const term = input.value.trim();
+        results.querySelectorAll('input:not(:checked)').forEach(
+            (checkbox) => checkbox.parentElement.remove()
+        );
+        if (!term) {
+            return;
+        }
+        fetchTags(input.dataset.autocompleteUrl, term).then(
+            (tags) => tags.forEach(addCheckbox)
+        );
+    }, 200);
+    input.addEventListener('input', search);
+};
+
+document.querySelectorAll('input[list][data-autocomplete-url]').forEach(
+    setUpTagsInput
+);
+document.querySelectorAll('input[type=search][data-autocomplete-url]').forEach(
+    setUpTagsFilter
+);
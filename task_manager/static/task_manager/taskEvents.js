@@ -0,0 +1,10 @@
+const taskEvents = document.getElementById('task-events');
+
+const showTasksChanged = () => {
+    taskEvents.classList.remove('d-none');
+};
+
+if (window.EventSource) {
+    const source = new EventSource(taskEvents.dataset.url);
+    source.addEventListener('task', showTasksChanged);
+};
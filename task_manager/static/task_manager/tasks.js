@@ -13,3 +13,19 @@ my_tasks.addEventListener("change", showAssignedTo);
 
 const event = new Event("change");
 my_tasks.dispatchEvent(event);
+
+const selectAll = document.getElementById('select-all-tasks');
+
+selectAll.addEventListener('change', () => {
+    document.querySelectorAll('input[name="tasks"][form="bulk-form"]').forEach(
+        (checkbox) => { checkbox.checked = selectAll.checked; }
+    );
+});
+
+document.querySelectorAll('[data-confirm]').forEach((button) => {
+    button.addEventListener('click', (event) => {
+        if (!window.confirm(button.dataset.confirm)) {
+            event.preventDefault();
+        }
+    });
+});
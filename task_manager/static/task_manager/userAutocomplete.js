@@ -0,0 +1,53 @@
+const setUpUserSelect = (select) => {
+    const search = document.createElement('input');
+    search.type = 'search';
+    search.className = 'form-control mb-1';
+    search.placeholder = 'Find user';
+    select.before(search);
+
+    const more = document.createElement('button');
+    more.type = 'button';
+    more.className = 'btn btn-link btn-sm d-none';
+    more.textContent = 'More users';
+    select.after(more);
+
+    let next = null;
+
+    const addOptions = (users) => {
+        users.forEach((user) => {
+            if (select.querySelector(`option[value="${user.id}"]`)) {
+                return;
+            }
+            select.append(new Option(user.name, user.id));
+        });
+    };
+
+    const load = (params, replace) => {
+        const url = `${select.dataset.autocompleteUrl}?${new URLSearchParams(params)}`;
+        fetch(url, {credentials: 'same-origin'})
+            .then((response) => response.json())
+            .then((data) => {
+                if (replace) {
+                    select.querySelectorAll('option:not(:checked)').forEach(
+                        (option) => option.value && option.remove()
+                    );
+                }
+                addOptions(data.results);
+                next = data.next;
+                more.classList.toggle('d-none', !next);
+            });
+    };
+
+    let timer;
+    search.addEventListener('input', () => {
+        clearTimeout(timer);
+        timer = setTimeout(() => load({q: search.value.trim()}, true), 200);
+    });
+    more.addEventListener('click', () => {
+        load({q: search.value.trim(), cursor: next}, false);
+    });
+};
+
+document.querySelectorAll('select[data-autocomplete-url]:not([disabled])').forEach(
+    setUpUserSelect
+);
@@ -0,0 +1,83 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import (
+    IntegrityError, close_old_connections, connection, transaction
+)
+
+from task_manager.models import Tag, Task
+
+DEFAULT_BATCH_SIZE = 1000
+
+logger = logging.getLogger(__name__)
+
+# Tags which lost tasks are checked one batch after another, off the request
+cleanup_executor = ThreadPoolExecutor(
+    max_workers=1,
+    thread_name_prefix='tag-cleanup',
+)
+
+
+def _delete_unused(condition, params):
+    # One statement which leaves the task links alone: the tags are checked
+    # again while being deleted, and the foreign key rejects the deletion
+    # of a tag linked by a transaction committed in the meantime.
+    sql = (
+        'DELETE FROM {tag} WHERE {condition} AND NOT EXISTS ('
+        'SELECT 1 FROM {link} WHERE {link}.tag_id = {tag}.id)'
+    ).format(
+        tag=connection.ops.quote_name(Tag._meta.db_table),
+        link=connection.ops.quote_name(Task.tags.through._meta.db_table),
+        condition=condition,
+    )
+    try:
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+            cursor.execute(sql, params)
+            return cursor.rowcount
+    except IntegrityError:
+        logger.info('Tags were bound to tasks while being deleted')
+        return 0
+
+
+def delete_unused_tags_batch(batch_size=DEFAULT_BATCH_SIZE):
+    batch = Tag.objects.unused().order_by('pk').values('pk')[:batch_size]
+    sql, params = batch.query.sql_with_params()
+    return _delete_unused('id IN ({})'.format(sql), params)
+
+
+def delete_unused_tags(tag_ids):
+    return _delete_unused('id = ANY(%s)', [list(tag_ids)])
+
+
+def _cleanup(tag_ids, batch_size):
+    close_old_connections()
+    try:
+        for start in range(0, len(tag_ids), batch_size):
+            deleted = delete_unused_tags(tag_ids[start:start + batch_size])
+            logger.info('Deleted %s orphan tags', deleted)
+    except Exception:
+        logger.exception('Orphan tags cleanup failed')
+    finally:
+        close_old_connections()
+
+
+def schedule_cleanup(tag_ids, batch_size=DEFAULT_BATCH_SIZE):
+    tag_ids = sorted(tag_ids)
+    if tag_ids:
+        transaction.on_commit(
+            lambda: cleanup_executor.submit(_cleanup, tag_ids, batch_size)
+        )
+
+
+def collect_unused_tags(batch_size=DEFAULT_BATCH_SIZE, max_batches=None):
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        started = time.monotonic()
+        deleted = delete_unused_tags_batch(batch_size)
+        elapsed = time.monotonic() - started
+        batches += 1
+        yield deleted, elapsed
+        if deleted < batch_size:
+            break
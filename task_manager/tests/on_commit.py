@@ -0,0 +1,16 @@
+import contextlib
+
+from django.db import connection
+
+
+class OnCommitCallbacksMixin:
+    # TestCase never commits, the callbacks registered in the block run
+    # when it exits, like captureOnCommitCallbacks(execute=True) of Django
+    # 3.2
+    @contextlib.contextmanager
+    def runOnCommitCallbacks(self):
+        start = len(connection.run_on_commit)
+        yield
+        while len(connection.run_on_commit) > start:
+            _, callback = connection.run_on_commit.pop(start)
+            callback()
@@ -0,0 +1,65 @@
+import re
+from collections import Counter
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+# Maximum number of SQL queries a request to the URL name may run,
+# including the session and user lookups, whatever the number of rows.
+QUERY_BUDGETS = {
+    'index': 6,
+    'tasks': 8,
+    'board': 7,
+    'board_column': 4,
+    'create_task': 6,
+    'task_details': 5,
+    'export_tasks': 5,
+    'task_changes': 5,
+    'tag_autocomplete': 3,
+    'user_autocomplete': 3,
+    'statuses': 3,
+}
+
+LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+IN_LISTS = re.compile(r'IN \((?:\?, )*\?\)')
+
+
+def normalize(sql):
+    return IN_LISTS.sub('IN (...)', LITERALS.sub('?', sql))
+
+
+def duplicated_queries(queries):
+    counts = Counter(normalize(query['sql']) for query in queries)
+    return [(sql, count) for sql, count in counts.most_common() if count > 1]
+
+
+class QueryBudget(CaptureQueriesContext):
+    def __init__(self, test_case, url_name):
+        super().__init__(connection)
+        self.test_case = test_case
+        self.url_name = url_name
+        self.budget = QUERY_BUDGETS[url_name]
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        super().__exit__(exc_type, exc_value, traceback)
+        if exc_type is not None or len(self) <= self.budget:
+            return
+        lines = [
+            '"{}" ran {} queries, the budget is {}'.format(
+                self.url_name, len(self), self.budget
+            )
+        ]
+        duplicates = duplicated_queries(self.captured_queries)
+        if duplicates:
+            lines.append('Duplicated queries:')
+            lines.extend(
+                '{}x {}'.format(count, sql) for sql, count in duplicates
+            )
+        else:
+            lines.extend(query['sql'] for query in self.captured_queries)
+        self.test_case.fail('\n'.join(lines))
+
+
+class QueryBudgetMixin:
+    def assertQueryBudget(self, url_name):
+        return QueryBudget(self, url_name)
@@ -0,0 +1,149 @@
+import asyncio
+import json
+import re
+
+from django.conf import settings
+from django.test import TransactionTestCase, override_settings
+from django.urls import reverse
+from django.contrib.auth.models import User
+
+from task_manager import asgi as tm_asgi
+from task_manager import async_views as tm_async_views
+from task_manager import models as tm_models
+
+
+@override_settings(ROOT_URLCONF='task_manager.asgi_urls')
+class AsyncViewsTest(TransactionTestCase):
+    def setUp(self):
+        self.user = User.objects.create(username='async')
+        self.user.set_password('a1s2y3n4')
+        self.user.save()
+        status = tm_models.TaskStatus.objects.create(name='async_status')
+        self.task = tm_models.Task.objects.create(
+            name='Async task',
+            status=status,
+            creator=self.user,
+            assigned_to=self.user,
+        )
+        self.client.login(username='async', password='a1s2y3n4')
+        self.async_client.cookies = self.client.cookies
+
+    def test_routes_use_async_views(self):
+        for name, kwargs, view_class in (
+            ('index', {}, tm_async_views.IndexView),
+            ('tasks', {}, tm_async_views.TasksView),
+            ('task_details', {'pk': self.task.pk},
+             tm_async_views.TaskDetailView),
+        ):
+            response = self.client.get(reverse(name, kwargs=kwargs))
+            self.assertEqual(
+                response.resolver_match.func.view_class,
+                view_class
+            )
+
+    async def test_tasks_list(self):
+        response = await self.async_client.get(reverse('tasks'))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'Async task', response.content)
+
+    async def test_task_details(self):
+        response = await self.async_client.get(
+            reverse('task_details', kwargs={'pk': self.task.pk})
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'Async task', response.content)
+
+    async def test_redirect_if_not_logged_in(self):
+        self.async_client.cookies.clear()
+        response = await self.async_client.get(reverse('index'))
+        self.assertEqual(response.status_code, 302)
+
+    @override_settings(SERVER_TIMING_SAMPLE_RATE=1)
+    async def test_server_timing_counts_executor_queries(self):
+        response = await self.async_client.get(reverse('tasks'))
+        timing = response['Server-Timing']
+        queries = re.search(r'desc="(\d+) queries"', timing)
+        self.assertGreater(int(queries.group(1)), 0)
+        metrics = dict(
+            re.findall(r'(\w+);dur=([\d.]+)', timing)
+        )
+        self.assertEqual(
+            list(metrics),
+            ['db', 'forms', 'view', 'render', 'total']
+        )
+        self.assertGreater(float(metrics['render']), 0)
+
+
+class ASGIExportTest(TransactionTestCase):
+    def setUp(self):
+        self.user = User.objects.create(username='asgi_export')
+        self.user.set_password('a1s2g3i4')
+        self.user.save()
+        status = tm_models.TaskStatus.objects.create(name='asgi_export')
+        for number in range(3):
+            tm_models.Task.objects.create(
+                name='Exported task {}'.format(number),
+                status=status,
+                creator=self.user,
+                assigned_to=self.user,
+            )
+        self.client.login(username='asgi_export', password='a1s2g3i4')
+
+    async def export(self, query_string, cookie=True, host=b'testserver'):
+        headers = [(b'host', host)]
+        if cookie:
+            headers.append((b'cookie', '{}={}'.format(
+                settings.SESSION_COOKIE_NAME,
+                self.client.cookies[settings.SESSION_COOKIE_NAME].value,
+            ).encode('latin1')))
+        sent = []
+        requests = [{'type': 'http.request', 'body': b''}]
+
+        async def receive():
+            if requests:
+                return requests.pop()
+            # The client stays connected until the response is sent
+            await asyncio.Event().wait()
+
+        async def send(message):
+            sent.append(message)
+
+        await tm_asgi.application(
+            {
+                'type': 'http',
+                'method': 'GET',
+                'path': reverse('export_tasks'),
+                'query_string': query_string,
+                'headers': headers,
+            },
+            receive,
+            send,
+        )
+        return sent
+
+    async def test_export_ndjson(self):
+        sent = await self.export(b'format=ndjson')
+        self.assertEqual(sent[0]['type'], 'http.response.start')
+        self.assertEqual(sent[0]['status'], 200)
+        self.assertIn(
+            (b'Content-Type', b'application/x-ndjson'), sent[0]['headers']
+        )
+        self.assertFalse(sent[-1].get('more_body'))
+        body = b''.join(message['body'] for message in sent[1:])
+        self.assertEqual(
+            [json.loads(line)['name'] for line in body.splitlines()],
+            ['Exported task 0', 'Exported task 1', 'Exported task 2']
+        )
+
+    async def test_invalid_format(self):
+        sent = await self.export(b'format=xml')
+        self.assertEqual(sent[0]['status'], 400)
+        self.assertIn(b'Unknown export format', sent[1]['body'])
+
+    async def test_redirect_if_not_logged_in(self):
+        sent = await self.export(b'', cookie=False)
+        self.assertEqual(sent[0]['status'], 302)
+
+    async def test_disallowed_host(self):
+        sent = await self.export(b'', host=b'example.com')
+        self.assertEqual(sent[0]['status'], 400)
@@ -0,0 +1,95 @@
+from unittest import mock
+
+from django.test import TestCase
+from django.core.cache import cache
+from django.contrib.auth.models import User
+
+from task_manager import models as tm_models
+from task_manager import cache as tm_cache
+from task_manager.tests.on_commit import OnCommitCallbacksMixin
+
+
+class ReferenceCacheTest(OnCommitCallbacksMixin, TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_status_save_and_delete_invalidate(self):
+        self.assertEquals(tm_cache.status_choices(), [])
+        with self.runOnCommitCallbacks():
+            status = tm_models.TaskStatus.objects.create(name='cached_status')
+        self.assertEquals(
+            tm_cache.status_choices(),
+            [(status.pk, 'cached_status')]
+        )
+        with self.runOnCommitCallbacks():
+            status.delete()
+        self.assertEquals(tm_cache.status_choices(), [])
+
+    def test_user_save_invalidates(self):
+        user = User.objects.create(username='cached', first_name='Old')
+        tm_cache.user_choices()
+        user.first_name = 'New'
+        with self.runOnCommitCallbacks():
+            user.save()
+        self.assertEquals(tm_cache.user_choices(), [(user.pk, 'New')])
+
+    def test_invalidation_waits_for_commit(self):
+        self.assertEquals(tm_cache.status_choices(), [])
+        with self.runOnCommitCallbacks():
+            status = tm_models.TaskStatus.objects.create(name='pending')
+            # Other connections still read the committed rows, which must
+            # not be cached under the next version
+            version = tm_cache.get_version(tm_cache.STATUSES)
+            self.assertEquals(tm_cache.status_choices(), [])
+        self.assertNotEqual(tm_cache.get_version(tm_cache.STATUSES), version)
+        self.assertEquals(
+            tm_cache.status_choices(), [(status.pk, 'pending')]
+        )
+
+    def test_last_login_update_keeps_user_choices(self):
+        user = User.objects.create(username='cached')
+        version = tm_cache.get_version(tm_cache.USERS)
+        user.save(update_fields=['last_login'])
+        self.assertEquals(tm_cache.get_version(tm_cache.USERS), version)
+
+
+class TaskRowsCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(
+            username='rows', first_name='Row', last_name='Owner'
+        )
+        self.status = tm_models.TaskStatus.objects.create(name='row_status')
+        self.task = tm_models.Task.objects.create(
+            name='cached_row',
+            status=self.status,
+            creator=self.user,
+            assigned_to=self.user,
+        )
+
+    def rows(self):
+        return tm_cache.task_rows(
+            list(tm_models.Task.objects.for_listing().order_by('pk'))
+        )
+
+    def test_renders_and_reuses_rows(self):
+        rows = self.rows()
+        self.assertIn('cached_row', rows[0])
+        self.assertIn('Row Owner', rows[0])
+        render = 'django.template.backends.django.Template.render'
+        with mock.patch(render) as render:
+            self.assertEquals(self.rows(), rows)
+        render.assert_not_called()
+
+    def test_related_changes_render_new_rows(self):
+        self.rows()
+        self.status.name = 'renamed_status'
+        self.status.save()
+        self.user.first_name = 'Renamed'
+        self.user.save()
+        tag, _ = tm_models.Tag.objects.get_or_create_many(['row_tag'])
+        self.task.set_tags(tag)
+        row = self.rows()[0]
+        self.assertIn('renamed_status', row)
+        self.assertIn('Renamed Owner', row)
+        self.assertIn('row_tag', row)
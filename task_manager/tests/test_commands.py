@@ -0,0 +1,412 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from io import StringIO
+
+from django.test import TestCase, TransactionTestCase
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection, transaction
+from django.contrib.auth.models import User
+
+from task_manager import importer as tm_importer
+from task_manager import models as tm_models
+from task_manager import tag_gc as tm_tag_gc
+
+
+class GcTagsCommandTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create(username='gc_tags')
+        status = tm_models.TaskStatus.objects.create(name='gc_tags_status')
+        task = tm_models.Task.objects.create(
+            name='gc_tags_task',
+            status=status,
+            creator=user,
+            assigned_to=user,
+        )
+        cls.used_tag = tm_models.Tag.objects.create(name='used')
+        task.tags.set([cls.used_tag])
+        for number in range(5):
+            tm_models.Tag.objects.create(name='unused_{}'.format(number))
+
+    def test_deletes_unused_tags_in_batches(self):
+        out = StringIO()
+        call_command('gc_tags', batch_size=2, stdout=out)
+        self.assertEquals(
+            list(tm_models.Tag.objects.all()),
+            [self.used_tag]
+        )
+        lines = out.getvalue().splitlines()
+        self.assertEquals(len(lines), 4)
+        self.assertTrue(lines[0].startswith('Batch 1: deleted 2 tags in'))
+        self.assertTrue(lines[2].startswith('Batch 3: deleted 1 tags in'))
+        self.assertEquals(lines[3], 'Deleted 5 unused tags')
+
+    def test_max_batches(self):
+        call_command('gc_tags', batch_size=2, max_batches=1, stdout=StringIO())
+        self.assertEquals(tm_models.Tag.objects.unused().count(), 3)
+
+    def test_used_tags_keep_their_tasks(self):
+        self.assertEquals(
+            tm_tag_gc.delete_unused_tags([self.used_tag.pk]), 0
+        )
+        self.assertEquals(self.used_tag.task_set.count(), 1)
+
+
+class GcTagsRaceTest(TransactionTestCase):
+    def test_tag_bound_during_deletion_is_kept(self):
+        user = User.objects.create(username='gc_race')
+        status = tm_models.TaskStatus.objects.create(name='gc_race_status')
+        task = tm_models.Task.objects.create(
+            name='gc_race_task',
+            status=status,
+            creator=user,
+            assigned_to=user,
+        )
+        tag = tm_models.Tag.objects.create(name='gc_race_tag')
+        results = []
+
+        def collect():
+            try:
+                results.append(tm_tag_gc.delete_unused_tags([tag.pk]))
+            finally:
+                connection.close()
+
+        with transaction.atomic():
+            # The locked tag stops the collector after it found the tag
+            # unused, the link is committed before it goes on
+            tm_models.Tag.objects.select_for_update().get(pk=tag.pk)
+            task.tags.through.objects.create(task=task, tag=tag)
+            collector = threading.Thread(target=collect)
+            collector.start()
+            for _ in range(100):
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT count(*) FROM pg_stat_activity "
+                        "WHERE wait_event_type = 'Lock'"
+                    )
+                    if cursor.fetchone()[0]:
+                        break
+                time.sleep(0.05)
+        collector.join()
+        self.assertEquals(results, [0])
+        self.assertEquals(list(task.tags.all()), [tag])
+
+
+class ExplainTaskFiltersCommandTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create(username='explain')
+        status = tm_models.TaskStatus.objects.create(name='explain_status')
+        task = tm_models.Task.objects.create(
+            name='explain_task',
+            status=status,
+            creator=user,
+            assigned_to=user,
+        )
+        task.tags.set([tm_models.Tag.objects.create(name='explain')])
+
+    def test_every_filter_combination_has_index(self):
+        out = StringIO()
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+        call_command('explain_task_filters', stdout=out)
+        lines = out.getvalue().splitlines()
+        self.assertEquals(len(lines), 17)
+        self.assertEquals(lines[0], 'no filters: index scan')
+        self.assertEquals(lines[-1], 'All filters use indexes')
+
+    def test_no_tagged_tasks(self):
+        tm_models.Task.tags.through.objects.all().delete()
+        with self.assertRaises(CommandError):
+            call_command('explain_task_filters', stdout=StringIO())
+
+
+class ExportTasksCommandTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create(username='export_command')
+        status = tm_models.TaskStatus.objects.create(name='export_command')
+        cls.tag = tm_models.Tag.objects.create(name='exported')
+        for number in range(3):
+            task = tm_models.Task.objects.create(
+                name='export_{}'.format(number),
+                status=status,
+                creator=user,
+                assigned_to=user,
+            )
+            if number:
+                task.tags.set([cls.tag])
+
+    def test_export_filtered_ndjson(self):
+        out = StringIO()
+        call_command(
+            'export_tasks', tag=[self.tag.pk], chunk_size=1, stdout=out
+        )
+        self.assertEqual(
+            [json.loads(line)['name'] for line in out.getvalue().splitlines()],
+            ['export_1', 'export_2']
+        )
+
+    def test_invalid_filter(self):
+        with self.assertRaises(CommandError):
+            call_command('export_tasks', status=4094, stdout=StringIO())
+
+
+class ImportTasksCommandTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='importer')
+        cls.status = tm_models.TaskStatus.objects.create(name='imported')
+        cls.existing_tag = tm_models.Tag.objects.create(name='existing')
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write(self, name, content):
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'w', encoding='utf-8') as source:
+            source.write(content)
+        return path
+
+    def test_import_ndjson(self):
+        rows = [
+            {
+                'name': 'first',
+                'status': 'imported',
+                'creator': 'importer',
+                'assigned_to': 'importer',
+                'tags': 'Existing|fresh',
+            },
+            {
+                'name': 'second',
+                'description': 'no status',
+                'creator': 'importer',
+                'assigned_to': 'importer',
+                'tags': ['fresh', 'other'],
+            },
+            {
+                'name': 'invalid',
+                'creator': 'nobody',
+                'assigned_to': 'importer',
+                'tags': 'ab',
+            },
+        ]
+        path = self.write(
+            'tasks.ndjson',
+            '\n'.join(json.dumps(row) for row in rows)
+        )
+        out, err = StringIO(), StringIO()
+        call_command(
+            'import_tasks', path, chunk_size=2, stdout=out, stderr=err
+        )
+
+        first = tm_models.Task.objects.get(name='first')
+        self.assertEqual(first.status, self.status)
+        self.assertEqual(
+            {tag.name for tag in first.tags.all()},
+            {'existing', 'fresh'}
+        )
+        second = tm_models.Task.objects.get(name='second')
+        self.assertEqual(
+            {tag.name for tag in second.tags.all()},
+            {'fresh', 'other'}
+        )
+        self.assertFalse(tm_models.Task.objects.filter(name='invalid'))
+        self.assertIn('Row 3:', err.getvalue())
+        self.assertIn('Imported 2 tasks', out.getvalue())
+
+    def test_import_csv_resumes_from_checkpoint(self):
+        path = self.write(
+            'tasks.csv',
+            'name,description,status,creator,assigned_to,tags\n'
+            'one,,imported,importer,importer,\n'
+            'two,,imported,importer,importer,\n'
+            'three,,imported,importer,importer,\n'
+        )
+        tm_models.TaskImportCheckpoint.objects.create(
+            name='tasks', position=2
+        )
+        call_command(
+            'import_tasks', path, checkpoint='tasks', stdout=StringIO()
+        )
+        self.assertEqual(
+            list(tm_models.Task.objects.values_list('name', flat=True)),
+            ['three']
+        )
+        self.assertEqual(
+            tm_models.TaskImportCheckpoint.objects.get(name='tasks').position,
+            3
+        )
+
+    def test_failed_chunk_keeps_checkpoint(self):
+        path = self.write(
+            'tasks.csv',
+            'name,description,status,creator,assigned_to,tags\n'
+            'one,,imported,importer,importer,\n'
+            'two,,imported,importer,importer,\n'
+            'three,,imported,importer,importer,\n'
+        )
+        task_importer = tm_importer.TaskImporter(
+            chunk_size=2, checkpoint='tasks'
+        )
+        write_chunk = task_importer.write_chunk
+
+        def crash_on_second_chunk(rows):
+            write_chunk(rows)
+            if rows[0]['name'] == 'three':
+                raise RuntimeError('crash')
+
+        task_importer.write_chunk = crash_on_second_chunk
+        with open(path, newline='') as lines:
+            with self.assertRaises(RuntimeError):
+                task_importer.run(tm_importer.read_rows(lines, 'csv'))
+        self.assertEqual(
+            tm_models.TaskImportCheckpoint.objects.get(name='tasks').position,
+            2
+        )
+
+        call_command(
+            'import_tasks', path, checkpoint='tasks', stdout=StringIO()
+        )
+        self.assertEqual(
+            sorted(tm_models.Task.objects.values_list('name', flat=True)),
+            ['one', 'three', 'two']
+        )
+
+    def test_ndjson_line_not_an_object(self):
+        path = self.write(
+            'tasks.ndjson',
+            '{"name": "one", "creator": "importer", '
+            '"assigned_to": "importer"}\n[1]\n'
+        )
+        with self.assertRaisesMessage(
+            CommandError, 'Line 2 is not a JSON object'
+        ):
+            call_command('import_tasks', path, stdout=StringIO())
+
+    def test_unknown_format(self):
+        with self.assertRaises(CommandError):
+            call_command('import_tasks', 'tasks.txt', stdout=StringIO())
+
+
+class SeedBenchCommandTest(TestCase):
+    def test_seed_tops_up_to_totals(self):
+        options = {'users': 3, 'tags': 4, 'tasks': 20, 'batch_size': 7}
+        call_command('seed_bench', stdout=StringIO(), **options)
+        self.assertEqual(
+            User.objects.filter(username__startswith='bench_user_').count(),
+            3
+        )
+        self.assertEqual(tm_models.Tag.objects.count(), 4)
+        self.assertEqual(tm_models.Task.objects.count(), 20)
+
+        out = StringIO()
+        options['tasks'] = 25
+        call_command('seed_bench', stdout=out, **options)
+        self.assertEqual(tm_models.Task.objects.count(), 25)
+        self.assertEqual(
+            out.getvalue().strip(),
+            'Created 0 users, 0 tags and 5 tasks'
+        )
+
+    def test_zipf_distribution_prefers_first_tags(self):
+        call_command(
+            'seed_bench',
+            users=2, tags=50, tasks=300, distribution='zipf',
+            stdout=StringIO(),
+        )
+        through = tm_models.Task.tags.through.objects
+        self.assertGreater(
+            through.filter(tag__name='bench_tag_1').count(),
+            through.filter(tag__name='bench_tag_50').count()
+        )
+
+
+class RunBenchCommandTest(TestCase):
+    def test_writes_json_results(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'results.json')
+        call_command(
+            'run_bench',
+            sizes=[5, 10],
+            repeat=2,
+            users=2,
+            tags=3,
+            output=path,
+        )
+        with open(path) as results_file:
+            results = json.load(results_file)
+        self.assertEqual(results['environment']['database'], 'postgresql')
+        self.assertEqual(
+            [run['tasks'] for run in results['runs']],
+            [5, 10]
+        )
+        tasks_view = results['runs'][0]['benchmarks']['tasks_view']
+        self.assertEqual(tasks_view['repeat'], 2)
+        self.assertGreater(tasks_view['queries'], 0)
+        self.assertEqual(
+            set(results['runs'][1]['benchmarks']),
+            {
+                'tasks_view',
+                'tasks_view_filtered',
+                'index_view',
+                'task_detail_view',
+                'filter_form',
+                'filter_form_cold_cache',
+                'task_form_save',
+            }
+        )
+        self.assertFalse(
+            tm_models.Task.objects.filter(name='Benchmark task').exists()
+        )
+
+
+class RebuildTaskCountersCommandTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='rebuild_counters')
+        cls.status = tm_models.TaskStatus.objects.create(
+            name='rebuild_counters_status'
+        )
+        for number in range(3):
+            tm_models.Task.objects.create(
+                name='rebuild_counters_{}'.format(number),
+                status=cls.status,
+                creator=cls.user,
+                assigned_to=cls.user,
+            )
+
+    def rebuild(self):
+        out = StringIO()
+        call_command('rebuild_task_counters', stdout=out)
+        return out.getvalue().strip()
+
+    def test_counters_are_up_to_date(self):
+        self.assertEquals(self.rebuild(), 'Fixed 0 task counters')
+
+    def test_fixes_drifted_counters(self):
+        other = tm_models.TaskStatus.objects.create(name='rebuild_other')
+        tm_models.TaskCounter.objects.filter(user=self.user).update(count=7)
+        tm_models.TaskCounter.objects.create(
+            user=self.user, status=other, count=2
+        )
+        self.assertEquals(self.rebuild(), 'Fixed 2 task counters')
+        self.assertEquals(
+            list(
+                tm_models.TaskCounter.objects.values_list(
+                    'status_id', 'count'
+                )
+            ),
+            [(self.status.pk, 3)]
+        )
+        tm_models.TaskCounter.objects.all().delete()
+        self.assertEquals(self.rebuild(), 'Fixed 1 task counters')
+        self.assertEquals(
+            tm_models.TaskCounter.objects.get().count, 3
+        )
@@ -0,0 +1,109 @@
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+
+from task_manager import events as tm_events
+from task_manager import models as tm_models
+
+
+class BrokerTest(TestCase):
+    async def test_publish_to_subscribed_users(self):
+        broker = tm_events.Broker()
+        first, second = broker.subscribe(1), broker.subscribe(2)
+        await sync_to_async(broker.publish)({'type': 'created'}, {1, 3})
+        event = await asyncio.wait_for(first.get(), 1)
+        self.assertEqual(event, {'type': 'created', 'id': 1})
+        self.assertTrue(second.empty())
+        broker.unsubscribe(1, first)
+        broker.unsubscribe(2, second)
+        self.assertFalse(broker.has_subscribers())
+
+    def test_publish_without_subscribers(self):
+        broker = tm_events.Broker()
+        broker.publish({'type': 'created'}, {1})
+        self.assertIsNone(broker.loop)
+
+
+class TaskEventsStreamTest(TransactionTestCase):
+    def setUp(self):
+        self.user = User.objects.create(username='events')
+        self.user.set_password('e1v2e3n4')
+        self.user.save()
+        self.other = User.objects.create(username='other_events')
+        self.status = tm_models.TaskStatus.objects.create(name='events')
+        self.client.login(username='events', password='e1v2e3n4')
+
+    def scope(self, cookie=True):
+        headers = []
+        if cookie:
+            headers.append((b'cookie', '{}={}'.format(
+                settings.SESSION_COOKIE_NAME,
+                self.client.cookies[settings.SESSION_COOKIE_NAME].value,
+            ).encode('latin1')))
+        return {
+            'type': 'http',
+            'path': reverse('task_events'),
+            'headers': headers,
+        }
+
+    def create_task(self, assigned_to):
+        return tm_models.Task.objects.create(
+            name='Streamed task',
+            status=self.status,
+            creator=self.other,
+            assigned_to=assigned_to,
+        )
+
+    async def test_stream_task_events(self):
+        sent = asyncio.Queue()
+        disconnected = asyncio.Event()
+
+        async def receive():
+            await disconnected.wait()
+            return {'type': 'http.disconnect'}
+
+        stream = asyncio.ensure_future(
+            tm_events.stream(self.scope(), receive, sent.put)
+        )
+        start = await asyncio.wait_for(sent.get(), 5)
+        self.assertEqual(start['status'], 200)
+        self.assertIn(
+            (b'content-type', b'text/event-stream'), start['headers']
+        )
+        await asyncio.wait_for(sent.get(), 5)
+
+        await sync_to_async(self.create_task)(self.other)
+        task = await sync_to_async(self.create_task)(self.user)
+        message = await asyncio.wait_for(sent.get(), 5)
+        lines = message['body'].decode('utf-8').splitlines()
+        self.assertEqual(lines[0], 'event: task')
+        event = json.loads(lines[2][len('data: '):])
+        self.assertEqual(event['type'], 'created')
+        self.assertEqual(event['task'], task.pk)
+
+        task.assigned_to = self.other
+        await sync_to_async(task.save)()
+        message = await asyncio.wait_for(sent.get(), 5)
+        self.assertIn(b'"updated"', message['body'])
+
+        disconnected.set()
+        await asyncio.wait_for(stream, 5)
+        self.assertFalse(tm_events.broker.has_subscribers())
+
+    async def test_stream_requires_login(self):
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        await tm_events.stream(self.scope(cookie=False), None, send)
+        self.assertEqual(sent[0]['status'], 403)
+
+    def test_wsgi_fallback(self):
+        response = self.client.get(reverse('task_events'))
+        self.assertEqual(response.status_code, 204)
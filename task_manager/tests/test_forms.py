@@ -1,4 +1,7 @@
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+from django.core.cache import cache
 from django import forms
 from django.core import validators
 from django.core.exceptions import ValidationError
@@ -215,6 +218,38 @@ class TaskFormTest(TestCase):
             {self.ivanov, self.petrov}
         )
 
+    def test_user_fields_render_selected_user_only(self):
+        form = tm_forms.TaskForm(
+            instance=tm_models.Task.objects.get(pk=self.task.pk)
+        )
+        with self.assertNumQueries(1):
+            html = str(form['assigned_to'])
+        self.assertIn(self.petrov.get_full_name(), html)
+        self.assertNotIn(self.ivanov.get_full_name(), html)
+        self.assertIn('data-autocomplete-url', html)
+
+    def test_user_fields_use_loaded_users(self):
+        task = tm_models.Task.objects.select_related(
+            'creator', 'assigned_to'
+        ).get(pk=self.task.pk)
+        form = tm_forms.TaskForm(instance=task)
+        with self.assertNumQueries(0):
+            html = str(form['assigned_to'])
+        self.assertIn(self.petrov.get_full_name(), html)
+        form = tm_forms.TaskForm(
+            instance=task,
+            data={'assigned_to': self.petrov.pk},
+        )
+        with self.assertNumQueries(0):
+            self.assertEqual(form['assigned_to'].field.clean(
+                str(self.petrov.pk)
+            ), task.assigned_to)
+
+    def test_user_fields_ignore_invalid_selected_value(self):
+        form = tm_forms.TaskForm(data={'assigned_to': 'invalid'})
+        self.assertNotIn(self.petrov.get_full_name(), str(form['assigned_to']))
+        self.assertIn('assigned_to', form.errors)
+
     def test_field_tags_type(self):
         form = tm_forms.TaskForm()
         self.assertTrue(form.fields['tags'], forms.CharField)
@@ -257,6 +292,41 @@ class TaskFormTest(TestCase):
                 'task|test'
         )
 
+    def _save_with_tags(self, tags):
+        form = tm_forms.TaskForm(
+            instance=tm_models.Task.objects.get(pk=self.task.pk),
+            data={
+                'name': self.task.name,
+                'description': self.task.description,
+                'status': self.status.pk,
+                'assigned_to': self.petrov.pk,
+                'tags': tags,
+            }
+        )
+        self.assertTrue(form.is_valid(), form.errors)
+        with CaptureQueriesContext(connection) as queries:
+            task = form.save()
+        return task, len(queries)
+
+    def test_save_syncs_tags(self):
+        task, _ = self._save_with_tags('test|fresh|Fresh')
+        self.assertEquals(
+            {tag.name for tag in task.tags.all()},
+            {'test', 'fresh'}
+        )
+        self.assertTrue(tm_models.Tag.objects.filter(name='task').exists())
+        self.assertEquals(
+            set(tm_models.Tag.objects.unused()),
+            {tm_models.Tag.objects.get(name='task')}
+        )
+
+    def test_save_query_count_does_not_depend_on_tags_count(self):
+        _, few_tags_queries = self._save_with_tags('one_a|two_a')
+        _, many_tags_queries = self._save_with_tags(
+            'one_b|two_b|three_b|four_b|five_b|six_b|seven_b|eight_b'
+        )
+        self.assertEquals(few_tags_queries, many_tags_queries)
+
 
 class ValidateTagsTest(TestCase):
     def test_min_tag_length(self):
@@ -287,4 +357,49 @@ class ValidateTagsTest(TestCase):
 
 
 class FilterFormTest(TestCase):
-    pass
+    @classmethod
+    def setUpTestData(cls):
+        cls.status = tm_models.TaskStatus.objects.create(name='filter_new')
+        cls.tag = tm_models.Tag.objects.create(name='filter_tag')
+        cls.user = User.objects.create(
+            first_name='Filter',
+            last_name='User',
+            username='fuser',
+        )
+        User.objects.create(username='fstaff', is_staff=True)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_choices(self):
+        form = tm_forms.FilterForm()
+        self.assertIn(
+            (self.status.pk, 'filter_new'),
+            form.fields['status'].choices
+        )
+        self.assertEquals(
+            form.fields['creator'].choices,
+            tm_forms.BLANK_CHOICE + [(self.user.pk, 'Filter User')]
+        )
+        self.assertEquals(
+            form.fields['assigned_to'].choices,
+            form.fields['creator'].choices
+        )
+        self.assertEquals(form.fields['tags__in'].choices, [])
+
+    def test_tags_choices_are_limited_to_selected_tags(self):
+        tm_models.Tag.objects.create(name='not_selected')
+        form = tm_forms.FilterForm({'tags__in': [str(self.tag.pk), 'x']})
+        self.assertEquals(
+            form.fields['tags__in'].choices,
+            [(self.tag.pk, 'filter_tag')]
+        )
+        self.assertFalse(form.is_valid())
+        form = tm_forms.FilterForm({'tags__in': [str(self.tag.pk)]})
+        self.assertTrue(form.is_valid())
+        self.assertEquals(form.cleaned_data['tags__in'], [self.tag.pk])
+
+    def test_warm_form_runs_no_queries(self):
+        tm_forms.FilterForm()
+        with self.assertNumQueries(0):
+            tm_forms.FilterForm()
@@ -0,0 +1,68 @@
+import json
+import logging
+from io import StringIO
+
+from django.test import TestCase, override_settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.urls import reverse
+from django.contrib.auth.models import User
+
+from task_manager import middleware as tm_middleware
+
+
+class TimedClientMixin:
+    def setUp(self):
+        user = User.objects.create(username='timed')
+        user.set_password('t1m2e3d4')
+        user.save()
+        self.client.login(username='timed', password='t1m2e3d4')
+
+
+@override_settings(SERVER_TIMING_SAMPLE_RATE=1)
+class ServerTimingMiddlewareTest(TimedClientMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        handler = logging.getLogger('task_manager.middleware').handlers[0]
+        self.log = StringIO()
+        stream = handler.setStream(self.log)
+        self.addCleanup(handler.setStream, stream)
+
+    def test_header_and_log_line(self):
+        with self.assertLogs('task_manager.middleware', 'INFO') as logs:
+            response = self.client.get(reverse('tasks'))
+        metrics = [
+            entry.split(';')[0]
+            for entry in response['Server-Timing'].split(', ')
+        ]
+        self.assertEquals(
+            metrics,
+            ['db', 'forms', 'view', 'render', 'total']
+        )
+        self.assertRegex(response['Server-Timing'], r'desc="\d+ queries"')
+
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEquals(record['path'], reverse('tasks'))
+        self.assertEquals(record['status'], 200)
+        self.assertGreater(record['queries'], 0)
+        self.assertIn('render_ms', record)
+
+    def test_log_line_is_written_by_the_configured_handler(self):
+        self.client.get(reverse('tasks'))
+        record = json.loads(self.log.getvalue())
+        self.assertEquals(record['path'], reverse('tasks'))
+
+    def test_json_response_has_no_render_time(self):
+        response = self.client.get(reverse('tag_autocomplete'), {'q': 'a'})
+        self.assertNotIn('render', response['Server-Timing'])
+        self.assertIn('view;dur=', response['Server-Timing'])
+
+
+class ServerTimingDisabledTest(TimedClientMixin, TestCase):
+    def test_disabled_by_default(self):
+        response = self.client.get(reverse('tasks'))
+        self.assertNotIn('Server-Timing', response)
+
+    @override_settings(SERVER_TIMING_SAMPLE_RATE=0)
+    def test_not_used_without_sampling(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            tm_middleware.ServerTimingMiddleware(lambda request: None)
@@ -126,6 +126,23 @@ class TaskModelTest(TestCase):
         for tag in task.tags.all():
             self.assertTrue(tag.name in ['task', 'manager'])
 
+    def test_timestamps(self):
+        task = tm_models.Task.objects.get(name='task_model_test')
+        self.assertIsNotNone(task.created_at)
+        self.assertGreaterEqual(task.updated_at, task.created_at)
+
+    def test_set_tags_bumps_updated_at(self):
+        task = tm_models.Task.objects.get(name='task_model_test')
+        updated_at = task.updated_at
+        task.set_tags(list(task.tags.all()))
+        task.refresh_from_db()
+        self.assertEquals(task.updated_at, updated_at)
+
+        task.set_tags([])
+        self.assertGreater(task.updated_at, updated_at)
+        task.refresh_from_db()
+        self.assertGreater(task.updated_at, updated_at)
+
     def test__str__(self):
         status = tm_models.Task.objects.get(
             name='task_model_test'
@@ -143,3 +160,106 @@ class TaskModelTest(TestCase):
             status.__repr__(),
             '<Task task_model_test>'
         )
+
+
+class TaskQuerySetTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        status = tm_models.TaskStatus.objects.create(name='listing_status')
+        tags = [
+            tm_models.Tag.objects.create(name='listing_{}'.format(number))
+            for number in range(3)
+        ]
+        users = [
+            User.objects.create(username='listing_{}'.format(number))
+            for number in range(3)
+        ]
+        for number in range(5):
+            task = tm_models.Task.objects.create(
+                name='listing_task_{}'.format(number),
+                status=status,
+                creator=users[number % 3],
+                assigned_to=users[(number + 1) % 3],
+            )
+            task.tags.set(tags[:number % 3 + 1])
+
+    def test_for_listing_fixed_query_count(self):
+        with self.assertNumQueries(2):
+            rows = [
+                (
+                    task.status.name,
+                    task.creator.get_full_name(),
+                    task.assigned_to.get_full_name(),
+                    [tag.name for tag in task.tags.all()],
+                )
+                for task in tm_models.Task.objects.for_listing().order_by('pk')
+            ]
+        self.assertEquals(len(rows), 5)
+        self.assertEquals(rows[0][3], ['listing_0'])
+
+
+class TaskCounterTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.todo = tm_models.TaskStatus.objects.create(name='counter_todo')
+        cls.done = tm_models.TaskStatus.objects.create(name='counter_done')
+        cls.first = User.objects.create(username='counter_first')
+        cls.second = User.objects.create(username='counter_second')
+
+    def create_tasks(self, count, assigned_to):
+        return tm_models.Task.objects.bulk_create([
+            tm_models.Task(
+                name='counter_task_{}'.format(number),
+                status=self.todo,
+                creator=self.first,
+                assigned_to=assigned_to,
+            )
+            for number in range(count)
+        ])
+
+    def counts(self):
+        return {
+            (counter.user_id, counter.status_id): counter.count
+            for counter in tm_models.TaskCounter.objects.filter(count__gt=0)
+        }
+
+    def test_create(self):
+        self.create_tasks(3, self.first)
+        tm_models.Task.objects.create(
+            name='counter_single',
+            status=self.done,
+            creator=self.first,
+            assigned_to=self.second,
+        )
+        self.assertEquals(self.counts(), {
+            (self.first.pk, self.todo.pk): 3,
+            (self.second.pk, self.done.pk): 1,
+        })
+
+    def test_status_change_and_reassign(self):
+        self.create_tasks(3, self.first)
+        task = tm_models.Task.objects.filter(assigned_to=self.first).first()
+        task.status = self.done
+        task.save()
+        tm_models.Task.objects.filter(
+            assigned_to=self.first, status=self.todo
+        ).update(assigned_to=self.second)
+        tm_models.Task.objects.update(name='renamed')
+        self.assertEquals(self.counts(), {
+            (self.first.pk, self.done.pk): 1,
+            (self.second.pk, self.todo.pk): 2,
+        })
+
+    def test_delete(self):
+        tasks = self.create_tasks(3, self.first)
+        tasks[0].delete()
+        self.assertEquals(self.counts(), {(self.first.pk, self.todo.pk): 2})
+        tm_models.Task.objects.all().delete()
+        self.assertEquals(self.counts(), {})
+
+    def test_delete_assignee(self):
+        self.create_tasks(2, self.second)
+        User.objects.filter(pk=self.second.pk).delete()
+        self.assertFalse(
+            tm_models.TaskCounter.objects.filter(user=self.second).exists()
+        )
@@ -0,0 +1,181 @@
+from unittest import mock
+
+from django.test import TestCase
+from django.db.models import FloatField, Value
+from django.urls import reverse
+from django.contrib.auth.models import User
+
+from task_manager import models as tm_models
+from task_manager import pagination as tm_pagination
+from task_manager import views as tm_views
+
+
+class CursorTest(TestCase):
+    def test_encode_decode(self):
+        cursor = tm_pagination.encode_cursor(
+            tm_pagination.NEXT, 'value', 42
+        )
+        self.assertEquals(
+            tm_pagination.decode_cursor(cursor),
+            (tm_pagination.NEXT, 'value', 42)
+        )
+
+    def test_decode_invalid_cursor(self):
+        with self.assertRaises(tm_pagination.InvalidCursor):
+            tm_pagination.decode_cursor('not-a-cursor')
+        with self.assertRaises(tm_pagination.InvalidCursor):
+            tm_pagination.decode_cursor(
+                tm_pagination.encode_cursor('x', None, 1)
+            )
+
+
+class KeysetPaginatorTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='paginator')
+        cls.status = tm_models.TaskStatus.objects.create(
+            name='paginator_status'
+        )
+        cls.tasks = [
+            tm_models.Task.objects.create(
+                name='task_{}'.format(name),
+                status=cls.status,
+                creator=cls.user,
+                assigned_to=cls.user,
+            )
+            for name in 'cabed'
+        ]
+
+    def test_pages_by_pk(self):
+        paginator = tm_pagination.KeysetPaginator(
+            tm_models.Task.objects.all(), 2
+        )
+        first = paginator.page()
+        self.assertEquals(list(first), self.tasks[:2])
+        self.assertFalse(first.has_previous())
+        self.assertTrue(first.has_next())
+
+        second = paginator.page(first.next_cursor)
+        self.assertEquals(list(second), self.tasks[2:4])
+        self.assertTrue(second.has_previous())
+
+        last = paginator.page(second.next_cursor)
+        self.assertEquals(list(last), self.tasks[4:])
+        self.assertFalse(last.has_next())
+
+        self.assertEquals(
+            list(paginator.page(last.previous_cursor)),
+            self.tasks[2:4]
+        )
+
+    def test_pages_by_column_with_pk_tiebreaker(self):
+        paginator = tm_pagination.KeysetPaginator(
+            tm_models.Task.objects.all(), 2, ordering='-name'
+        )
+        first = paginator.page()
+        self.assertEquals(
+            [task.name for task in first],
+            ['task_e', 'task_d']
+        )
+        second = paginator.page(first.next_cursor)
+        self.assertEquals(
+            [task.name for task in second],
+            ['task_c', 'task_b']
+        )
+        self.assertEquals(
+            list(paginator.page(second.previous_cursor)),
+            list(first)
+        )
+
+    def test_cursor_value_of_the_ordering_field(self):
+        paginator = tm_pagination.KeysetPaginator(
+            tm_models.Task.objects.annotate(
+                rank=Value(1.0, output_field=FloatField())
+            ),
+            2,
+            ordering='-rank',
+        )
+        self.assertEquals(
+            len(paginator.page(
+                tm_pagination.encode_cursor(
+                    tm_pagination.NEXT, '1', self.tasks[2].pk
+                )
+            )),
+            2
+        )
+        with self.assertRaises(tm_pagination.InvalidCursor):
+            paginator.page(
+                tm_pagination.encode_cursor(
+                    tm_pagination.NEXT, 'abc', self.tasks[2].pk
+                )
+            )
+
+    def test_cursor_survives_filter_change(self):
+        first = tm_pagination.KeysetPaginator(
+            tm_models.Task.objects.all(), 2
+        ).page()
+        filtered = tm_pagination.KeysetPaginator(
+            tm_models.Task.objects.filter(
+                name__in=['task_a', 'task_b', 'task_d']
+            ),
+            2
+        ).page(first.next_cursor)
+        self.assertEquals(
+            [task.name for task in filtered],
+            ['task_b', 'task_d']
+        )
+
+
+class PaginatedViewsTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(username='pager')
+        self.user.set_password('t4e3s2t1')
+        self.user.save()
+        status = tm_models.TaskStatus.objects.create(name='pager_status')
+        self.tasks = [
+            tm_models.Task.objects.create(
+                name='paged_{}'.format(number),
+                status=status,
+                creator=self.user,
+                assigned_to=self.user,
+            )
+            for number in range(3)
+        ]
+        self.client.login(username='pager', password='t4e3s2t1')
+
+    def test_tasks_view_keeps_filters_in_page_links(self):
+        with mock.patch.object(tm_views.TasksView, 'paginate_by', 2):
+            response = self.client.get(reverse('tasks'), {'my_tasks': 'on'})
+        self.assertEquals(list(response.context['tasks']), self.tasks[:2])
+        self.assertTrue(response.context['is_paginated'])
+        next_page_url = response.context['next_page_url']
+        self.assertIn('my_tasks=on', next_page_url)
+        self.assertIn('cursor=', next_page_url)
+
+    def test_index_view_next_page(self):
+        with mock.patch.object(tm_views.IndexView, 'paginate_by', 2):
+            response = self.client.get(reverse('index'))
+            self.assertEquals(
+                list(response.context['tasks']),
+                self.tasks[:2]
+            )
+            response = self.client.get(
+                reverse('index') + response.context['next_page_url']
+            )
+        self.assertEquals(list(response.context['tasks']), self.tasks[2:])
+        self.assertNotIn('next_page_url', response.context)
+        self.assertIn('previous_page_url', response.context)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(reverse('tasks'), {'cursor': '!!!'})
+        self.assertEquals(response.status_code, 404)
+
+    def test_invalid_cursor_value(self):
+        for value in ('abc', [1], None):
+            cursor = tm_pagination.encode_cursor(
+                tm_pagination.NEXT, value, self.tasks[0].pk
+            )
+            response = self.client.get(
+                reverse('tasks'), {'q': 'paged', 'cursor': cursor}
+            )
+            self.assertEquals(response.status_code, 404)
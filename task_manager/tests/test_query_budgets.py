@@ -0,0 +1,121 @@
+from django.test import TestCase
+from django.core.cache import cache
+from django.http import QueryDict
+from django.urls import reverse
+from django.contrib.auth.models import User
+
+from task_manager import models as tm_models
+from task_manager import seeding as tm_seeding
+from task_manager.tests import query_budgets as tm_query_budgets
+
+
+class QueryBudgetHelpersTest(tm_query_budgets.QueryBudgetMixin, TestCase):
+    def test_normalize(self):
+        self.assertEquals(
+            tm_query_budgets.normalize(
+                "SELECT * FROM t WHERE id IN (1, 2, 3) AND name = 'it''s'"
+            ),
+            'SELECT * FROM t WHERE id IN (...) AND name = ?'
+        )
+
+    def test_failure_lists_duplicated_queries(self):
+        user = User.objects.create(username='budget')
+        with self.assertRaises(AssertionError) as raised:
+            with self.assertQueryBudget('statuses'):
+                for pk in range(user.pk, user.pk + 4):
+                    User.objects.filter(pk=pk).first()
+        message = str(raised.exception)
+        self.assertIn('"statuses" ran 4 queries, the budget is 3', message)
+        self.assertIn('4x SELECT', message)
+
+
+class QueryBudgetTestMixin(tm_query_budgets.QueryBudgetMixin):
+    tasks_count = None
+
+    @classmethod
+    def setUpTestData(cls):
+        tm_seeding.seed_statuses()
+        tm_seeding.seed_users(5)
+        tm_seeding.seed_tags(20)
+        tm_seeding.TaskSeeder(tags_per_task=4).seed(cls.tasks_count)
+        cls.user = User.objects.get(username='bench_user_1')
+        cls.user.set_password('b4u3d2g1')
+        cls.user.save()
+        cls.task = tm_models.Task.objects.filter(
+            tags__isnull=False
+        ).order_by('-pk').first()
+
+    def setUp(self):
+        cache.clear()
+        self.client.login(username='bench_user_1', password='b4u3d2g1')
+
+    def get(self, url_name, data=None, **kwargs):
+        with self.assertQueryBudget(url_name):
+            response = self.client.get(reverse(url_name, kwargs=kwargs), data)
+            if response.streaming:
+                b''.join(response.streaming_content)
+        self.assertEquals(response.status_code, 200)
+        return response
+
+    def test_index(self):
+        self.get('index')
+
+    def test_tasks(self):
+        self.get('tasks')
+
+    def test_tasks_filtered(self):
+        tag = self.task.tags.first()
+        self.get(
+            'tasks',
+            {
+                'status': self.task.status_id,
+                'creator': self.task.creator_id,
+                'tags__in': [tag.pk],
+            }
+        )
+
+    def test_tasks_search(self):
+        self.get('tasks', {'q': self.task.name.split()[0]})
+
+    def test_tasks_next_page(self):
+        response = self.get('tasks')
+        if 'next_page_url' in response.context:
+            self.get(
+                'tasks',
+                QueryDict(response.context['next_page_url'].lstrip('?'))
+            )
+
+    def test_board(self):
+        self.get('board')
+
+    def test_board_column(self):
+        self.get('board_column', pk=self.task.status_id)
+
+    def test_create_task(self):
+        self.get('create_task')
+
+    def test_task_details(self):
+        self.get('task_details', pk=self.task.pk)
+
+    def test_export_tasks(self):
+        self.get('export_tasks', {'format': 'csv'})
+
+    def test_task_changes(self):
+        self.get('task_changes')
+
+    def test_tag_autocomplete(self):
+        self.get('tag_autocomplete', {'q': 'bench_tag'})
+
+    def test_user_autocomplete(self):
+        self.get('user_autocomplete', {'q': 'bench'})
+
+    def test_statuses(self):
+        self.get('statuses')
+
+
+class SmallQueryBudgetTest(QueryBudgetTestMixin, TestCase):
+    tasks_count = 3
+
+
+class LargeQueryBudgetTest(QueryBudgetTestMixin, TestCase):
+    tasks_count = 120
@@ -1,4 +1,13 @@
-from django.test import TestCase
+import csv
+import json
+from io import StringIO
+from unittest import mock
+
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+from django.core.cache import cache
+from django.core.management import call_command
 from django.urls import reverse
 from django.contrib.auth.models import User
 from django.views.generic.list import ListView
@@ -6,10 +15,13 @@ from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic.edit import CreateView, UpdateView, DeleteView
 from django.contrib.messages.views import SuccessMessageMixin
 from django.urls import reverse_lazy
+from django.utils.http import http_date
 
 from task_manager import forms as tm_forms
 from task_manager import views as tm_views
 from task_manager import models as tm_models
+from task_manager import tag_gc as tm_tag_gc
+from task_manager.tests.on_commit import OnCommitCallbacksMixin
 
 
 class CustomRegistrationViewTest(TestCase):
@@ -68,6 +80,10 @@ class IndexViewTest(TestCase):
                 self.task_two
             ]
         )
+        self.assertEquals(
+            response.context['status_counts'],
+            [('task_status_model_test', 1)]
+        )
 
 
 class ProfileViewTest(TestCase):
@@ -408,6 +424,11 @@ class TaskDetailsViewTest(TestCase):
             self.andrew
         )
 
+        self.assertEquals(
+            list(tm_models.Tag.objects.unused()),
+            [self.tag_must_be_deleted]
+        )
+        call_command('gc_tags', stdout=StringIO())
         with self.assertRaises(tm_models.Tag.DoesNotExist):
             tm_models.Tag.objects.get(
                 name='this_tag_must_be_deleted'
@@ -562,6 +583,7 @@ class DeleteTaskVIew(TestCase):
 
 class TasksViewTest(TestCase):
     def setUp(self):
+        cache.clear()
         self.ludmila = User.objects.create(
             first_name='Ludmila',
             last_name='Sidorova',
@@ -971,6 +993,270 @@ class TasksViewTest(TestCase):
         )
 
 
+class TasksViewSearchTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.vera = User.objects.create(
+            first_name='Vera',
+            last_name='Sidorova',
+            username='vsidorova',
+        )
+        self.vera.set_password('t4e3s2t1')
+        self.vera.save()
+        self.status_new = tm_models.TaskStatus.objects.create(
+            name='test_search_status_new'
+        )
+        self.status_done = tm_models.TaskStatus.objects.create(
+            name='test_search_status_done'
+        )
+        self.in_description = tm_models.Task.objects.create(
+            name='Update documents',
+            description='Describe the deployment of the database',
+            status=self.status_new,
+            creator=self.vera,
+            assigned_to=self.vera,
+        )
+        self.in_name = tm_models.Task.objects.create(
+            name='Migrate databases',
+            description='Move everything',
+            status=self.status_new,
+            creator=self.vera,
+            assigned_to=self.vera,
+        )
+        self.done = tm_models.Task.objects.create(
+            name='Database backup',
+            status=self.status_done,
+            creator=self.vera,
+            assigned_to=self.vera,
+        )
+        tm_models.Task.objects.create(
+            name='Unrelated',
+            status=self.status_new,
+            creator=self.vera,
+            assigned_to=self.vera,
+        )
+        self.client.login(username='vsidorova', password='t4e3s2t1')
+
+    def test_search_ranks_name_matches_first(self):
+        response = self.client.get(
+            reverse('tasks'),
+            {'q': 'database', 'status': self.status_new.pk}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEquals(
+            list(response.context['tasks']),
+            [self.in_name, self.in_description]
+        )
+
+    def test_search_vector_follows_edits(self):
+        self.done.name = 'Restore backup'
+        self.done.save()
+        response = self.client.get(reverse('tasks'), {'q': 'restore'})
+        self.assertEquals(list(response.context['tasks']), [self.done])
+
+
+class TagAutocompleteViewTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(username='tautocomplete')
+        self.user.set_password('t4e3s2t1')
+        self.user.save()
+        for name in ('deploy', 'deployment', 'redeploy', 'design', 'bug'):
+            tm_models.Tag.objects.create(name=name)
+
+    def test_redirect_if_not_logged_in(self):
+        response = self.client.get(reverse('tag_autocomplete'))
+        self.assertEqual(response.status_code, 302)
+
+    def test_prefix_matches_go_first(self):
+        self.client.login(username='tautocomplete', password='t4e3s2t1')
+        response = self.client.get(reverse('tag_autocomplete'), {'q': 'Dep'})
+        self.assertEqual(
+            [tag['name'] for tag in response.json()['results']],
+            ['deploy', 'deployment', 'redeploy']
+        )
+
+    def test_limit(self):
+        self.client.login(username='tautocomplete', password='t4e3s2t1')
+        response = self.client.get(
+            reverse('tag_autocomplete'),
+            {'q': 'de', 'limit': '2'}
+        )
+        self.assertEqual(
+            [tag['name'] for tag in response.json()['results']],
+            ['deploy', 'deployment']
+        )
+
+    def test_empty_term(self):
+        self.client.login(username='tautocomplete', password='t4e3s2t1')
+        response = self.client.get(reverse('tag_autocomplete'))
+        self.assertEqual(response.json(), {'results': []})
+
+
+class UserAutocompleteViewTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(
+            first_name='Ivan',
+            last_name='Petrov',
+            username='uautocomplete',
+        )
+        self.user.set_password('t4e3s2t1')
+        self.user.save()
+        self.ivans = [
+            User.objects.create(
+                first_name='Ivan',
+                last_name='Sidorov{}'.format(number),
+                username='isidorov{}'.format(number),
+            )
+            for number in range(3)
+        ]
+        User.objects.create(
+            first_name='Ivan',
+            last_name='Staff',
+            username='istaff',
+            is_staff=True,
+        )
+        self.client.login(username='uautocomplete', password='t4e3s2t1')
+
+    def test_redirect_if_not_logged_in(self):
+        self.client.logout()
+        response = self.client.get(reverse('user_autocomplete'))
+        self.assertEqual(response.status_code, 302)
+
+    def test_search_by_words(self):
+        response = self.client.get(
+            reverse('user_autocomplete'),
+            {'q': 'ivan sid'}
+        )
+        self.assertEqual(
+            [user['id'] for user in response.json()['results']],
+            [user.pk for user in self.ivans]
+        )
+        self.assertIsNone(response.json()['next'])
+
+    def test_pages(self):
+        with mock.patch.object(
+            tm_views.UserAutocompleteView, 'paginate_by', 2
+        ):
+            response = self.client.get(
+                reverse('user_autocomplete'),
+                {'q': 'ivan'}
+            )
+            self.assertEqual(
+                [user['name'] for user in response.json()['results']],
+                ['Ivan Petrov', 'Ivan Sidorov0']
+            )
+            response = self.client.get(
+                reverse('user_autocomplete'),
+                {'q': 'ivan', 'cursor': response.json()['next']}
+            )
+        self.assertEqual(
+            [user['name'] for user in response.json()['results']],
+            ['Ivan Sidorov1', 'Ivan Sidorov2']
+        )
+
+
+class ExportTasksViewTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(username='exporter')
+        self.user.set_password('t4e3s2t1')
+        self.user.save()
+        self.status_new = tm_models.TaskStatus.objects.create(
+            name='export_new'
+        )
+        self.status_done = tm_models.TaskStatus.objects.create(
+            name='export_done'
+        )
+        self.task = tm_models.Task.objects.create(
+            name='Exported',
+            description='Line one, "quoted"',
+            status=self.status_new,
+            creator=self.user,
+            assigned_to=self.user,
+        )
+        self.task.tags.set(
+            [
+                tm_models.Tag.objects.create(name='zeta'),
+                tm_models.Tag.objects.create(name='alpha'),
+            ]
+        )
+        tm_models.Task.objects.create(
+            name='Not exported',
+            status=self.status_done,
+            creator=self.user,
+            assigned_to=self.user,
+        )
+        self.client.login(username='exporter', password='t4e3s2t1')
+
+    def test_ndjson(self):
+        response = self.client.get(
+            reverse('export_tasks'),
+            {'status': self.status_new.pk}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(
+            [json.loads(line) for line in lines],
+            [
+                {
+                    'id': self.task.pk,
+                    'name': 'Exported',
+                    'description': 'Line one, "quoted"',
+                    'status': 'export_new',
+                    'creator': 'exporter',
+                    'assigned_to': 'exporter',
+                    'tags': 'alpha|zeta',
+                }
+            ]
+        )
+
+    def test_csv(self):
+        response = self.client.get(
+            reverse('export_tasks'),
+            {'format': 'csv', 'q': 'exported'}
+        )
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        rows = list(
+            csv.reader(
+                b''.join(response.streaming_content).decode().splitlines()
+            )
+        )
+        self.assertEqual(rows[0][0], 'id')
+        self.assertEqual(len(rows), 3)
+
+    def test_invalid_format(self):
+        response = self.client.get(reverse('export_tasks'), {'format': 'x'})
+        self.assertEqual(response.status_code, 400)
+
+
+class ExportTasksTransactionTest(TransactionTestCase):
+    def test_rows_are_read_in_a_transaction(self):
+        user = User.objects.create(username='export_cursor')
+        user.set_password('t4e3s2t1')
+        user.save()
+        tm_models.Task.objects.create(
+            name='Exported in a transaction',
+            status=tm_models.TaskStatus.objects.create(name='export_cursor'),
+            creator=user,
+            assigned_to=user,
+        )
+        self.client.login(username='export_cursor', password='t4e3s2t1')
+        in_transaction = []
+
+        def record(execute, sql, params, many, context):
+            if 'tag_names' in sql:
+                in_transaction.append(connection.in_atomic_block)
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(record):
+            response = self.client.get(reverse('export_tasks'))
+            lines = b''.join(response.streaming_content).splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(in_transaction, [True])
+
+
 class StatusesViewTest(TestCase):
     def setUp(self):
         self.ksenia = User.objects.create(
@@ -1236,3 +1522,606 @@ class DeleteStatusViewTest(TestCase):
             tm_models.TaskStatus.objects.get(
                 name='test_status_delete_view_status_one'
             )
+
+
+class ConditionalGetTest(OnCommitCallbacksMixin, TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(username='conditional')
+        self.user.set_password('t4e3s2t1')
+        self.user.save()
+        self.status = tm_models.TaskStatus.objects.create(
+            name='conditional_status'
+        )
+        self.task = tm_models.Task.objects.create(
+            name='Conditional',
+            status=self.status,
+            creator=self.user,
+            assigned_to=self.user,
+        )
+        self.client.login(username='conditional', password='t4e3s2t1')
+
+    def assertNotModified(self, url, data=None, **headers):
+        response = self.client.get(url, data, **headers)
+        self.assertEqual(response.status_code, 304)
+
+    def test_tasks_view_etag(self):
+        url = reverse('tasks')
+        response = self.client.get(url, {'status': self.status.pk})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('private', response['Cache-Control'])
+        etag = response['ETag']
+
+        with self.assertNumQueries(3):
+            self.assertNotModified(
+                url, {'status': self.status.pk}, HTTP_IF_NONE_MATCH=etag
+            )
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+        self.task.set_tags(
+            tm_models.Tag.objects.get_or_create_many(['changed'])[0]
+        )
+        response = self.client.get(
+            url, {'status': self.status.pk}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_index_view_etag_follows_status_counts(self):
+        # Stands for a task of another page, its status changes while the
+        # timestamps of the page stay the same
+        later = tm_models.TaskStatus.objects.create(name='Later')
+        url = reverse('index')
+        etag = self.client.get(url)['ETag']
+        self.assertNotModified(url, HTTP_IF_NONE_MATCH=etag)
+        tm_models.Task.objects.filter(pk=self.task.pk).update(status=later)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_index_view_etag_follows_new_tasks(self):
+        url = reverse('index')
+        etag = self.client.get(url)['ETag']
+        self.assertNotModified(url, HTTP_IF_NONE_MATCH=etag)
+        tm_models.Task.objects.create(
+            name='Another',
+            status=self.status,
+            creator=self.user,
+            assigned_to=self.user,
+        )
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_list_views_have_no_last_modified(self):
+        url = reverse('index')
+        newest = tm_models.Task.objects.create(
+            name='Newest',
+            status=self.status,
+            creator=self.user,
+            assigned_to=self.user,
+        )
+        response = self.client.get(url)
+        self.assertNotIn('Last-Modified', response)
+        since = http_date(newest.updated_at.timestamp())
+        newest.delete()
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=since)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('Last-Modified', self.client.get(reverse('tasks')))
+
+    def test_task_details_last_modified(self):
+        url = reverse('task_details', kwargs={'pk': self.task.pk})
+        response = self.client.get(url)
+        last_modified = response['Last-Modified']
+        self.assertNotModified(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertNotModified(url, HTTP_IF_NONE_MATCH=response['ETag'])
+
+        self.status.name = 'renamed_conditional_status'
+        with self.runOnCommitCallbacks():
+            self.status.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 200)
+
+    def test_missing_task(self):
+        response = self.client.get(
+            reverse('task_details', kwargs={'pk': self.task.pk + 1})
+        )
+        self.assertEqual(response.status_code, 404)
+
+
+class TaskChangesViewTest(TransactionTestCase):
+    def setUp(self):
+        self.user = User.objects.create(username='changes')
+        self.user.set_password('t4e3s2t1')
+        self.user.save()
+        self.status = tm_models.TaskStatus.objects.create(
+            name='changes_status'
+        )
+        self.done = tm_models.TaskStatus.objects.create(name='changes_done')
+        self.tasks = [
+            tm_models.Task.objects.create(
+                name='change_{}'.format(number),
+                status=self.status,
+                creator=self.user,
+                assigned_to=self.user,
+            )
+            for number in range(3)
+        ]
+        self.client.login(username='changes', password='t4e3s2t1')
+
+    def get_changes(self, since=None, **params):
+        if since:
+            params['since'] = since
+        response = self.client.get(reverse('task_changes'), params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_initial_sync_in_pages(self):
+        first = self.get_changes(limit=2)
+        self.assertEqual(
+            [change['name'] for change in first['changes']],
+            ['change_0', 'change_1']
+        )
+        self.assertTrue(first['has_more'])
+        second = self.get_changes(first['next'], limit=2)
+        self.assertEqual(
+            [change['name'] for change in second['changes']],
+            ['change_2']
+        )
+        self.assertFalse(second['has_more'])
+        self.assertEqual(self.get_changes(second['next'])['changes'], [])
+
+    def test_status_tag_changes_and_deletions(self):
+        since = self.get_changes()['next']
+        self.tasks[0].status = self.done
+        self.tasks[0].save()
+        self.tasks[1].set_tags(
+            tm_models.Tag.objects.get_or_create_many(['synced'])[0]
+        )
+        response = self.client.post(
+            reverse('delete_task', kwargs={'pk': self.tasks[2].pk})
+        )
+        self.assertEqual(response.status_code, 302)
+
+        changes = self.get_changes(since)['changes']
+        self.assertEqual(
+            [(change['id'], change['deleted']) for change in changes],
+            [
+                (self.tasks[0].pk, False),
+                (self.tasks[1].pk, False),
+                (self.tasks[2].pk, True),
+            ]
+        )
+        self.assertEqual(changes[0]['status'], 'changes_done')
+        self.assertEqual(changes[1]['tags'], ['synced'])
+
+    def test_invalid_token(self):
+        response = self.client.get(reverse('task_changes'), {'since': '!'})
+        self.assertEqual(response.status_code, 400)
+
+
+class BulkTasksViewTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(username='bulk')
+        self.user.set_password('t4e3s2t1')
+        self.user.save()
+        self.other = User.objects.create(username='bulk_other')
+        self.new = tm_models.TaskStatus.objects.create(name='bulk_new')
+        self.done = tm_models.TaskStatus.objects.create(name='bulk_done')
+        self.tasks = [
+            tm_models.Task.objects.create(
+                name='bulk_{}'.format(number),
+                status=self.new,
+                creator=self.user,
+                assigned_to=self.user,
+            )
+            for number in range(3)
+        ]
+        self.foreign = tm_models.Task.objects.create(
+            name='bulk_foreign',
+            status=self.new,
+            creator=self.other,
+            assigned_to=self.other,
+        )
+        self.client.login(username='bulk', password='t4e3s2t1')
+
+    def post(self, action, tasks, **data):
+        return self.client.post(
+            reverse('bulk_tasks'),
+            dict(data, action=action, tasks=[task.pk for task in tasks]),
+            HTTP_ACCEPT='application/json',
+        )
+
+    def test_redirect_if_not_logged_in(self):
+        self.client.logout()
+        response = self.client.post(reverse('bulk_tasks'))
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(response.url.startswith(reverse('login')))
+
+    def test_set_status(self):
+        updated_at = self.tasks[0].updated_at
+        response = self.post(
+            'set_status', self.tasks + [self.foreign], status=self.done.pk
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {
+                'updated': [task.pk for task in self.tasks],
+                'failed': {str(self.foreign.pk): 'forbidden'},
+            }
+        )
+        self.assertEqual(
+            tm_models.Task.objects.filter(status=self.done).count(), 3
+        )
+        self.tasks[0].refresh_from_db()
+        self.assertGreater(self.tasks[0].updated_at, updated_at)
+
+    def test_reassign(self):
+        response = self.post('reassign', self.tasks, assigned_to=self.other.pk)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            tm_models.Task.objects.filter(assigned_to=self.other).count(), 4
+        )
+
+    def test_add_and_remove_tags(self):
+        self.tasks[0].tags.add(tm_models.Tag.objects.create(name='urgent'))
+        response = self.post('add_tags', self.tasks, tags='urgent|later')
+        self.assertEqual(response.status_code, 200)
+        for task in self.tasks:
+            self.assertEqual(
+                sorted(task.tags.values_list('name', flat=True)),
+                ['later', 'urgent']
+            )
+        self.post('remove_tags', self.tasks[:2], tags='urgent')
+        self.assertEqual(
+            tm_models.Task.objects.filter(tags__name='urgent').get(),
+            self.tasks[2]
+        )
+
+    def test_missing_task(self):
+        response = self.post('set_status', [self.tasks[0]], status=0)
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post(
+            reverse('bulk_tasks'),
+            {'action': 'set_status', 'tasks': [0], 'status': self.done.pk},
+            HTTP_ACCEPT='application/json',
+        )
+        self.assertEqual(response.json()['failed'], {'0': 'not_found'})
+
+    def test_queries_do_not_depend_on_task_count(self):
+        self.post('set_status', [], status=self.new.pk)
+        tm_models.Tag.objects.get_or_create_many(['urgent', 'later'])
+        for action, data in (
+            ('set_status', {'status': self.done.pk}),
+            ('reassign', {'assigned_to': self.other.pk}),
+            ('add_tags', {'tags': 'urgent|later'}),
+            ('remove_tags', {'tags': 'urgent|later'}),
+        ):
+            with CaptureQueriesContext(connection) as one:
+                self.post(action, self.tasks[:1], **data)
+            with CaptureQueriesContext(connection) as many:
+                self.post(action, self.tasks[1:], **data)
+            self.assertEqual(len(one), len(many), action)
+
+    def test_html_form_redirects_with_messages(self):
+        response = self.client.post(
+            reverse('bulk_tasks'),
+            {
+                'action': 'set_status',
+                'tasks': [self.tasks[0].pk, self.foreign.pk],
+                'status': self.done.pk,
+                'next': reverse('tasks') + '?my_tasks=on',
+            },
+            follow=True,
+        )
+        self.assertRedirects(response, reverse('tasks') + '?my_tasks=on')
+        self.assertEqual(
+            [str(message) for message in response.context['messages']],
+            [
+                '1 tasks were updated',
+                'Tasks #{} could not be updated: only their creator or '
+                'assignee can change them'.format(self.foreign.pk),
+            ]
+        )
+
+
+class BulkDeleteTasksViewTest(TransactionTestCase):
+    def setUp(self):
+        self.user = User.objects.create(username='bulk_delete')
+        self.user.set_password('t4e3s2t1')
+        self.user.save()
+        other = User.objects.create(username='bulk_delete_other')
+        status = tm_models.TaskStatus.objects.create(name='bulk_delete')
+        shared, self.orphan = tm_models.Tag.objects.get_or_create_many(
+            ['shared', 'orphan']
+        )[0]
+        self.tasks = []
+        for creator in (self.user, self.user, other):
+            task = tm_models.Task.objects.create(
+                name='bulk_delete',
+                status=status,
+                creator=creator,
+                assigned_to=self.user,
+            )
+            task.tags.set([shared, self.orphan] if creator == self.user
+                          else [shared])
+            self.tasks.append(task)
+        self.client.login(username='bulk_delete', password='t4e3s2t1')
+
+    def test_delete_owned_tasks(self):
+        ids = [task.pk for task in self.tasks] + [0]
+        response = self.client.post(
+            reverse('bulk_delete_tasks'),
+            {'tasks': ','.join(str(pk) for pk in ids)},
+            HTTP_ACCEPT='application/json',
+        )
+        self.assertEqual(
+            response.json(),
+            {
+                'deleted': ids[:2],
+                'failed': {str(ids[2]): 'forbidden', '0': 'not_found'},
+            }
+        )
+        self.assertEqual(
+            list(tm_models.Task.objects.values_list('pk', flat=True)),
+            ids[2:3]
+        )
+        self.assertEqual(
+            tm_models.TaskTombstone.objects.filter(task_id__in=ids).count(),
+            2
+        )
+        tm_tag_gc.cleanup_executor.submit(lambda: None).result()
+        self.assertEqual(
+            list(tm_models.Tag.objects.values_list('name', flat=True)),
+            ['shared']
+        )
+
+    def test_html_form_redirects_with_messages(self):
+        response = self.client.post(
+            reverse('bulk_delete_tasks'),
+            {'tasks': [task.pk for task in self.tasks]},
+            follow=True,
+        )
+        self.assertRedirects(response, reverse('tasks'))
+        self.assertEqual(
+            [str(message) for message in response.context['messages']],
+            [
+                '2 tasks were deleted',
+                'Tasks #{} could not be deleted: only their creator can '
+                'delete them'.format(self.tasks[2].pk),
+            ]
+        )
+
+
+class DeleteStatusWithTasksTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        user = User.objects.create(username='status_mover')
+        user.set_password('t4e3s2t1')
+        user.save()
+        self.old = tm_models.TaskStatus.objects.create(name='status_old')
+        self.new = tm_models.TaskStatus.objects.create(name='status_new')
+        self.tasks = [
+            tm_models.Task.objects.create(
+                name='moved_{}'.format(number),
+                status=self.old,
+                creator=user,
+                assigned_to=user,
+            )
+            for number in range(3)
+        ]
+        self.url = reverse('delete_status', args=[self.old.pk])
+        self.client.login(username='status_mover', password='t4e3s2t1')
+
+    def test_context(self):
+        response = self.client.get(self.url)
+        self.assertTrue(response.context['has_tasks'])
+        self.assertEqual(
+            response.context['form'].fields['move_to'].choices,
+            [('', '-----'), (self.new.pk, 'status_new')]
+        )
+
+    def test_refuses_without_target_status(self):
+        response = self.client.post(self.url, follow=True)
+        self.assertRedirects(response, self.url)
+        self.assertTrue(
+            tm_models.TaskStatus.objects.filter(pk=self.old.pk).exists()
+        )
+        self.assertEqual(
+            tm_models.Task.objects.filter(status=self.old).count(), 3
+        )
+
+    def test_moves_tasks_and_deletes(self):
+        updated_at = self.tasks[0].updated_at
+        response = self.client.post(self.url, {'move_to': self.new.pk})
+        self.assertRedirects(response, reverse('statuses'))
+        self.assertFalse(
+            tm_models.TaskStatus.objects.filter(pk=self.old.pk).exists()
+        )
+        self.assertEqual(
+            tm_models.Task.objects.filter(status=self.new).count(), 3
+        )
+        self.tasks[0].refresh_from_db()
+        self.assertGreater(self.tasks[0].updated_at, updated_at)
+
+    def test_can_not_move_to_deleted_status(self):
+        response = self.client.post(self.url, {'move_to': self.old.pk})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context['form'].errors)
+
+    def test_target_status_deleted_meanwhile(self):
+        # The cached choices still offer the status until the commit
+        self.client.get(self.url)
+        tm_models.TaskStatus.objects.filter(pk=self.new.pk).delete()
+        response = self.client.post(self.url, {'move_to': self.new.pk})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.context['form'].errors['move_to'],
+            ['This status was deleted, choose another one']
+        )
+        self.assertEqual(
+            tm_models.Task.objects.filter(status=self.old).count(), 3
+        )
+
+
+class TaskEditVersionTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(username='editor')
+        self.user.set_password('t4e3s2t1')
+        self.user.save()
+        self.status = tm_models.TaskStatus.objects.create(name='edit_new')
+        self.task = tm_models.Task.objects.create(
+            name='Edited',
+            description='Before',
+            status=self.status,
+            creator=self.user,
+            assigned_to=self.user,
+        )
+        self.url = reverse('task_details', kwargs={'pk': self.task.pk})
+        self.client.login(username='editor', password='t4e3s2t1')
+
+    def edit(self, version, **data):
+        return self.client.post(self.url, dict({
+            'name': self.task.name,
+            'description': self.task.description,
+            'status': self.status.pk,
+            'assigned_to': self.user.pk,
+            'tags': '',
+            'version': version,
+        }, **data))
+
+    def test_edit_writes_changed_fields(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.edit(1, description='After')
+        update, = [
+            query['sql'] for query in queries
+            if query['sql'].startswith('UPDATE')
+        ]
+        self.assertRedirects(response, self.url)
+        self.assertIn('"description" =', update)
+        self.assertNotIn('"name" =', update)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.description, 'After')
+        self.assertEqual(self.task.version, 2)
+
+    def test_unchanged_form_writes_nothing(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.edit(1)
+        self.assertFalse(
+            [q for q in queries if q['sql'].startswith('UPDATE')]
+        )
+
+    def test_concurrent_edit_conflict(self):
+        self.edit(1, description='First')
+        response = self.edit(1, description='Second')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(
+            tm_views.TaskDetailView.conflict_message,
+            response.context['form'].non_field_errors()
+        )
+        self.assertEqual(response.context['task'].description, 'First')
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.description, 'First')
+
+        response = self.edit(
+            response.context['form'].data['version'],
+            description='Second'
+        )
+        self.assertRedirects(response, self.url)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.description, 'Second')
+        self.assertEqual(self.task.version, 3)
+
+    def test_edit_queries(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(7):
+            self.edit(1, name='Renamed')
+
+
+@mock.patch.object(tm_views.BoardView, 'per_column', 2)
+@mock.patch.object(tm_views.BoardColumnView, 'per_column', 2)
+class BoardViewTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='board')
+        cls.user.set_password('t4e3s2t1')
+        cls.user.save()
+        cls.todo = tm_models.TaskStatus.objects.create(name='board_todo')
+        cls.doing = tm_models.TaskStatus.objects.create(name='board_doing')
+        cls.done = tm_models.TaskStatus.objects.create(name='board_done')
+        cls.tasks = {}
+        for status, count in ((cls.todo, 5), (cls.doing, 1)):
+            cls.tasks[status.pk] = [
+                tm_models.Task.objects.create(
+                    name='{}_{}'.format(status.name, number),
+                    status=status,
+                    creator=cls.user,
+                    assigned_to=cls.user,
+                )
+                for number in range(count)
+            ]
+        cls.tasks[cls.todo.pk][0].tags.set(
+            [tm_models.Tag.objects.create(name='board_tag')]
+        )
+
+    def setUp(self):
+        self.client.login(username='board', password='t4e3s2t1')
+
+    def test_redirect_if_not_logged_in(self):
+        self.client.logout()
+        response = self.client.get(reverse('board'))
+        self.assertEqual(response.status_code, 302)
+
+    def test_columns(self):
+        response = self.client.get(reverse('board'))
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'task_manager/board.html')
+        columns = response.context['columns']
+        self.assertEqual(
+            [
+                (column.name, column.count, list(column.page))
+                for column in columns
+            ],
+            [
+                ('board_todo', 5, self.tasks[self.todo.pk][:2]),
+                ('board_doing', 1, self.tasks[self.doing.pk]),
+                ('board_done', 0, []),
+            ]
+        )
+        self.assertIsNotNone(columns[0].next_url)
+        self.assertIsNone(columns[1].next_url)
+        self.assertContains(response, 'board_tag')
+
+    def test_load_more(self):
+        response = self.client.get(reverse('board'))
+        url = response.context['columns'][0].next_url
+        pages = []
+        while url:
+            response = self.client.get(url)
+            self.assertTemplateUsed(response, 'task_manager/board_column.html')
+            pages.append(len(response.context['cards']))
+            url = response.context['next_url']
+        self.assertEqual(pages, [2, 1])
+        self.assertContains(response, 'board_todo_4')
+
+    def test_invalid_cursor(self):
+        response = self.client.get(
+            reverse('board_column', kwargs={'pk': self.todo.pk}),
+            {'cursor': '!'}
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_fixed_query_count(self):
+        self.client.get(reverse('board'))
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse('board'))
+        for status in (self.doing, self.done):
+            for number in range(5):
+                tm_models.Task.objects.create(
+                    name='board_more_{}'.format(number),
+                    status=status,
+                    creator=self.user,
+                    assigned_to=self.user,
+                )
+        with self.assertNumQueries(len(queries)):
+            self.client.get(reverse('board'))
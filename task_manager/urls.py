@@ -22,6 +22,29 @@ urlpatterns = [
     path('', views.IndexView.as_view(), name='index'),
     path('tasks/', views.TasksView.as_view(), name='tasks'),
     path('tasks/new', views.CreateTaskView.as_view(), name='create_task'),
+    path(
+        'tasks/export',
+        views.ExportTasksView.as_view(),
+        name='export_tasks'
+    ),
+    path(
+        'tasks/changes',
+        views.TaskChangesView.as_view(),
+        name='task_changes'
+    ),
+    path('tasks/board', views.BoardView.as_view(), name='board'),
+    path(
+        'tasks/board/<int:pk>',
+        views.BoardColumnView.as_view(),
+        name='board_column'
+    ),
+    path('tasks/bulk', views.BulkTasksView.as_view(), name='bulk_tasks'),
+    path(
+        'tasks/bulk/delete',
+        views.BulkDeleteTasksView.as_view(),
+        name='bulk_delete_tasks'
+    ),
+    path('tasks/events', views.TaskEventsView.as_view(), name='task_events'),
     path(
         'tasks/<int:pk>/details',
         views.TaskDetailView.as_view(),
@@ -32,6 +55,16 @@ urlpatterns = [
         views.DeleteTaskView.as_view(),
         name='delete_task'
     ),
+    path(
+        'tags/autocomplete',
+        views.TagAutocompleteView.as_view(),
+        name='tag_autocomplete'
+    ),
+    path(
+        'users/autocomplete',
+        views.UserAutocompleteView.as_view(),
+        name='user_autocomplete'
+    ),
     path('statuses/', views.StatusesView.as_view(), name='statuses'),
     path(
         'statuses/new',
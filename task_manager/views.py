@@ -1,34 +1,71 @@
+import copy
+import itertools
+
 from django.shortcuts import redirect
+from django.http import (
+    Http404, HttpResponse, JsonResponse, StreamingHttpResponse
+)
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django_registration.backends.one_step.views import RegistrationView
 from django.contrib import messages
 from django.contrib.messages.views import SuccessMessageMixin
-from django.views.generic.base import TemplateView
+from django.views.generic.base import TemplateView, View
 from django.views.generic.list import ListView
 from django.views.generic.edit import (
     CreateView, UpdateView, DeleteView, FormView, FormMixin
 )
 from django.views.generic.detail import DetailView
-from django.urls import reverse_lazy
+from django.urls import reverse, reverse_lazy
+from django.utils.http import url_has_allowed_host_and_scheme, urlencode
 
+from task_manager import board as tm_board
+from task_manager import bulk as tm_bulk
 from task_manager import forms as tm_forms
-from task_manager.models import TaskStatus, Task
+from task_manager import cache as tm_cache
+from task_manager import changes as tm_changes
+from task_manager import counters as tm_counters
+from task_manager.conditional import (
+    ConditionalGetMixin, KeysetConditionalGetMixin
+)
+from task_manager import export as tm_export
+from task_manager.middleware import timed
+from task_manager.models import (
+    TaskStatus, Tag, Task, VersionConflict, find_users
+)
+from task_manager.pagination import (
+    CURSOR_PARAM, InvalidCursor, KeysetPaginationMixin, KeysetPaginator
+)
 
 
 class CustomRegistrationView(RegistrationView):
     form_class = tm_forms.CustomRegistrationForm
 
 
-class IndexView(LoginRequiredMixin, ListView):
+class IndexView(LoginRequiredMixin, KeysetConditionalGetMixin,
+                KeysetPaginationMixin, ListView):
     model = Task
     template_name = 'task_manager/index.html'
     context_object_name = 'tasks'
 
     def get_queryset(self):
-        return Task.objects.filter(
+        return Task.objects.for_listing().filter(
             assigned_to=self.request.user.pk
         ).order_by('pk')
 
+    def get_status_counts(self):
+        if not hasattr(self, 'status_counts'):
+            self.status_counts = tm_counters.status_counts(self.request.user)
+        return self.status_counts
+
+    def get_conditional_state(self):
+        parts, _ = super().get_conditional_state()
+        return [parts, self.get_status_counts()], None
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['status_counts'] = self.get_status_counts()
+        return context
+
 
 class ProfileView(LoginRequiredMixin, TemplateView):
     template_name = 'task_manager/profile.html'
@@ -60,17 +97,40 @@ class CreateTaskView(LoginRequiredMixin, SuccessMessageMixin, FormView):
         return form
 
 
-class TaskDetailView(LoginRequiredMixin, FormMixin, DetailView):
+class TaskDetailView(LoginRequiredMixin, ConditionalGetMixin, FormMixin,
+                     DetailView):
     model = Task
+    queryset = Task.objects.for_listing()
     form_class = tm_forms.TaskForm
     context_object_name = 'task'
 
+    conflict_message = (
+        'The task was changed by someone else while you were editing it. '
+        'Check the changes and save again to overwrite them.'
+    )
+
+    def get_object(self, queryset=None):
+        if getattr(self, 'object', None) is None:
+            self.object = super().get_object(queryset)
+        return self.object
+
+    def get_conditional_state(self):
+        task = self.get_object()
+        return [task.pk, task.version], task.updated_at
+
     def get_success_url(self):
         return reverse_lazy('task_details', kwargs={'pk': self.object.pk})
 
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()
-        kwargs['instance'] = self.get_object()
+        # The form changes its instance while validating, the page shows
+        # the saved task. Copies of querysets drop their results, so the
+        # prefetched tags are handed over.
+        task = self.get_object()
+        kwargs['instance'] = copy.deepcopy(task)
+        kwargs['instance']._prefetched_objects_cache = dict(
+            task._prefetched_objects_cache
+        )
         return kwargs
 
     def post(self, request, *args, **kwargs):
@@ -82,7 +142,13 @@ class TaskDetailView(LoginRequiredMixin, FormMixin, DetailView):
             return self.form_invalid(form)
 
     def form_valid(self, form):
-        form.save()
+        try:
+            form.save()
+        except VersionConflict:
+            form.add_error(None, self.conflict_message)
+            form.data = form.data.copy()
+            form.data['version'] = self.object.version
+            return self.form_invalid(form)
         return super().form_valid(form)
 
 
@@ -93,12 +159,13 @@ class DeleteTaskView(LoginRequiredMixin, DeleteView):
 
     def delete(self, request, *args, **kwargs):
         task = self.get_object()
-        if task.creator.pk == request.user.pk:
+        if task.creator_id == request.user.pk:
+            tm_bulk.delete([task.pk], request.user)
             messages.success(
                 request,
                 'Task "{}" was deleted successfully'.format(task.name)
             )
-            return super().delete(request, *args, **kwargs)
+            return redirect(self.success_url)
         message = (
             'Only creator "{}" can delete this task.'.format(
                 task.creator.get_full_name()
@@ -108,34 +175,230 @@ class DeleteTaskView(LoginRequiredMixin, DeleteView):
         return redirect('task_details', pk=task.pk)
 
 
-class TasksView(LoginRequiredMixin, ListView):
+class TasksView(LoginRequiredMixin, KeysetConditionalGetMixin,
+                KeysetPaginationMixin, ListView):
     model = Task
     template_name = 'task_manager/tasks.html'
     context_object_name = 'tasks'
+    filter_form = None
 
     def get_queryset(self):
-        self.filter_form = tm_forms.FilterForm(self.request.GET or None)
+        if self.filter_form is None:
+            with timed(self.request, 'forms'):
+                self.filter_form = tm_forms.FilterForm(
+                    self.request.GET or None
+                )
+                self.filter_form.is_valid()
         if self.filter_form.is_valid():
-            filters = {
-                k: v for k, v in self.filter_form.cleaned_data.items()
-                if v
-            }
-
-            if filters.get('my_tasks'):
-                filters['assigned_to'] = self.request.user.pk
-                del filters['my_tasks']
-
-            tasks = Task.objects.filter(**filters).distinct()
+            tasks = self.filter_form.filter_queryset(
+                Task.objects.for_listing(),
+                self.request.user
+            )
         else:
-            tasks = Task.objects.all()
+            tasks = Task.objects.for_listing()
         return tasks
 
+    def get_keyset_ordering(self):
+        if self.filter_form.is_valid() and self.filter_form.cleaned_data['q']:
+            return '-rank'
+        return super().get_keyset_ordering()
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['filter_form'] = self.filter_form
+        context['bulk_form'] = tm_forms.BulkActionForm()
+        context['task_rows'] = tm_cache.task_rows(context['tasks'])
+        return context
+
+
+def _board_column_url(status_id, page):
+    if not page.has_next():
+        return None
+    return '{}?{}'.format(
+        reverse('board_column', kwargs={'pk': status_id}),
+        urlencode({CURSOR_PARAM: page.next_cursor}),
+    )
+
+
+class BoardView(LoginRequiredMixin, TemplateView):
+    template_name = 'task_manager/board.html'
+    per_column = tm_board.DEFAULT_PER_COLUMN
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        columns = tm_board.columns(self.per_column)
+        cards = iter(tm_cache.task_rows(
+            [task for column in columns for task in column.page],
+            tm_cache.CARD_TEMPLATE,
+        ))
+        for column in columns:
+            column.cards = list(itertools.islice(cards, len(column.page)))
+            column.next_url = _board_column_url(column.status_id, column.page)
+        context['columns'] = columns
+        return context
+
+
+class BoardColumnView(LoginRequiredMixin, TemplateView):
+    # Renders the next cards of a column, the board appends them in place
+    # of its "Load more" link
+    template_name = 'task_manager/board_column.html'
+    per_column = tm_board.DEFAULT_PER_COLUMN
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        try:
+            page = tm_board.column_page(
+                kwargs['pk'],
+                self.request.GET.get(CURSOR_PARAM),
+                self.per_column,
+            )
+        except InvalidCursor:
+            raise Http404('Invalid page cursor')
+        context['cards'] = tm_cache.task_rows(
+            page.object_list, tm_cache.CARD_TEMPLATE
+        )
+        context['next_url'] = _board_column_url(kwargs['pk'], page)
         return context
 
 
+class BulkTasksView(LoginRequiredMixin, View):
+    form_class = tm_forms.BulkActionForm
+    failure_message = (
+        'Tasks {} could not be updated: only their creator or assignee can '
+        'change them'
+    )
+
+    def post(self, request, *args, **kwargs):
+        form = self.form_class(request.POST)
+        as_json = not request.accepts('text/html')
+        if not form.is_valid():
+            if as_json:
+                return JsonResponse(form.errors, status=400)
+            for errors in form.errors.values():
+                messages.error(request, ' '.join(errors))
+            return redirect(self.get_success_url())
+        result = form.apply(request.user)
+        if as_json:
+            return JsonResponse(result.as_dict())
+        if result.done:
+            messages.success(
+                request,
+                '{} tasks were {}'.format(len(result.done), result.verb)
+            )
+        if result.failed:
+            messages.error(
+                request,
+                self.failure_message.format(
+                    ', '.join('#{}'.format(pk) for pk in result.failed)
+                )
+            )
+        return redirect(self.get_success_url())
+
+    def get_success_url(self):
+        url = self.request.POST.get('next')
+        if url and url_has_allowed_host_and_scheme(
+            url,
+            allowed_hosts={self.request.get_host()},
+            require_https=self.request.is_secure(),
+        ):
+            return url
+        return reverse('tasks')
+
+
+class BulkDeleteTasksView(BulkTasksView):
+    form_class = tm_forms.BulkDeleteForm
+    failure_message = (
+        'Tasks {} could not be deleted: only their creator can delete them'
+    )
+
+
+class TagAutocompleteView(LoginRequiredMixin, View):
+    limit = 10
+    max_limit = 50
+
+    def get(self, request, *args, **kwargs):
+        try:
+            limit = int(request.GET.get('limit', self.limit))
+        except ValueError:
+            limit = self.limit
+        limit = max(1, min(limit, self.max_limit))
+        tags = Tag.objects.autocomplete(request.GET.get('q', ''), limit)
+        return JsonResponse(
+            {'results': [{'id': tag.pk, 'name': tag.name} for tag in tags]}
+        )
+
+
+class UserAutocompleteView(LoginRequiredMixin, View):
+    paginate_by = 20
+
+    def get(self, request, *args, **kwargs):
+        paginator = KeysetPaginator(
+            find_users(request.GET.get('q', '')),
+            self.paginate_by
+        )
+        try:
+            page = paginator.page(request.GET.get(CURSOR_PARAM))
+        except InvalidCursor:
+            raise Http404('Invalid page cursor')
+        return JsonResponse(
+            {
+                'results': [
+                    {'id': user.pk, 'name': user.get_full_name()}
+                    for user in page
+                ],
+                'next': page.next_cursor,
+            }
+        )
+
+
+class ExportTasksView(LoginRequiredMixin, View):
+    def get(self, request, *args, **kwargs):
+        export_format = request.GET.get('format', 'ndjson')
+        if export_format not in tm_export.FORMATS:
+            return JsonResponse(
+                {'format': ['Unknown export format']},
+                status=400
+            )
+        filter_form = tm_forms.FilterForm(request.GET)
+        if not filter_form.is_valid():
+            return JsonResponse(filter_form.errors, status=400)
+        tasks = filter_form.filter_queryset(Task.objects.all(), request.user)
+        response = StreamingHttpResponse(
+            tm_export.export_lines(tasks, export_format),
+            content_type=tm_export.FORMATS[export_format]
+        )
+        response['Content-Disposition'] = (
+            'attachment; filename="tasks.{}"'.format(export_format)
+        )
+        return response
+
+
+class TaskChangesView(LoginRequiredMixin, View):
+    def get(self, request, *args, **kwargs):
+        try:
+            limit = int(request.GET.get('limit', tm_changes.DEFAULT_LIMIT))
+        except ValueError:
+            limit = tm_changes.DEFAULT_LIMIT
+        limit = max(1, min(limit, tm_changes.MAX_LIMIT))
+        try:
+            changes = tm_changes.changes_since(
+                request.GET.get('since'), limit
+            )
+        except InvalidCursor:
+            return JsonResponse(
+                {'since': ['Invalid change token']},
+                status=400
+            )
+        return JsonResponse(changes)
+
+
+class TaskEventsView(LoginRequiredMixin, View):
+    # The events are streamed by the ASGI application only, 204 tells the
+    # browsers of a WSGI deployment not to reconnect.
+    def get(self, request, *args, **kwargs):
+        return HttpResponse(status=204)
+
+
 class StatusesView(LoginRequiredMixin, ListView):
     model = TaskStatus
     template_name = 'task_manager/statuses.html'
@@ -163,19 +426,42 @@ class DeleteStatusView(LoginRequiredMixin, DeleteView):
     template_name = 'task_manager/delete_status.html'
     success_url = reverse_lazy('statuses')
 
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['has_tasks'] = self.object.bounded_tasks.exists()
+        context.setdefault(
+            'form',
+            tm_forms.DeleteStatusForm(status=self.object)
+        )
+        return context
+
     def delete(self, request, *args, **kwargs):
-        status = self.get_object()
-        bounded_tasks = status.bounded_tasks.all()
-        if bounded_tasks:
-            message = (
-                'Status "{}" has bounded tasks, you can not delete it!'.format(
-                    status.name
-                )
+        self.object = status = self.get_object()
+        form = tm_forms.DeleteStatusForm(request.POST, status=status)
+        if not form.is_valid():
+            return self.render_to_response(
+                self.get_context_data(form=form)
+            )
+        try:
+            deleted = tm_bulk.delete_status(
+                status.pk, form.cleaned_data['move_to']
+            )
+        except TaskStatus.DoesNotExist:
+            form.add_error(
+                'move_to', 'This status was deleted, choose another one'
+            )
+            return self.render_to_response(
+                self.get_context_data(form=form)
+            )
+        if not deleted:
+            messages.error(
+                request,
+                'Status "{}" has bounded tasks, choose a status to move '
+                'them to'.format(status.name)
             )
-            messages.error(request, message)
-            return redirect('statuses')
+            return redirect('delete_status', pk=status.pk)
         messages.success(
             request,
             'Status "{}" was deleted successfully'.format(status.name)
         )
-        return super().delete(request, *args, **kwargs)
+        return redirect(self.success_url)